@@ -1,4 +1,3 @@
-from genetic_algorithm.type import Individual
 from genetic_algorithm.selection import RouletteSelection
 from genetic_algorithm.crossover import SinglePointCrossover
 from genetic_algorithm.mutation import BitFlipMutation
@@ -6,38 +5,7 @@ from genetic_algorithm.chromosome_decoder import BinaryChromosomeDecoder, Denary
 from genetic_algorithm.optimization import Maximization
 from genetic_algorithm.termination_criterion import NumberOfGeneration, OrTermination, ThresholdDifference
 from ga import GeneticAlgorithm
-from genetic_algorithm.callbacks.base import Callback
-import matplotlib.pyplot as plt
-from prettytable import PrettyTable
-
-class PlotFitnessCallback(Callback):
-    def __init__(self):
-        self.generations = []
-        self.best_fitnesses = []
-
-    def on_generation_end(self, generation, best_fitness: float, best_individual: Individual, population: list[Individual]):
-        self.generations.append(generation)
-        self.best_fitnesses.append(best_fitness)
-
-    def on_evolution_end(self, generation, best_fitness: float, best_individual: Individual, population: list[Individual]):
-        plt.figure(figsize=(10, 6))
-        plt.plot(self.generations, self.best_fitnesses, marker='o')
-        plt.title('Fitness vs Generation')
-        plt.xlabel('Generation')
-        plt.ylabel('Best Fitness')
-        plt.grid(True)
-        plt.show()
-
-class TabulateCallback(Callback):
-    def __init__(self) -> None:
-        self.table = PrettyTable()
-        self.table.field_names = ["Generation", "Best Individual", "Best fitness"]
-    
-    def on_generation_end(self, generation, best_fitness: float, best_individual: Individual, population: list[Individual]):
-        self.table.add_row([generation, best_individual, best_fitness])
-    
-    def on_evolution_end(self, generation, best_fitness: float, best_individual: Individual, population: list[Individual]):
-        print(self.table)
+from genetic_algorithm.callbacks.table import TabulateCallback
 
 
 # Solving a basic optimization problem
@@ -0,0 +1,99 @@
+"""
+python -m benchmarks run --output results.json
+python -m benchmarks compare baseline.json results.json
+"""
+import argparse
+import json
+import sys
+
+from .functions import PROBLEMS
+from .suite import DECODERS, OPERATORS, compare, run_suite, sweep
+
+
+def comma_separated(cast=str):
+    return lambda value: [cast(item) for item in value.split(",") if item]
+
+
+def parse_arguments(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m benchmarks", description="Genetic algorithm engine benchmarks")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    run = commands.add_parser("run", help="run the benchmark sweep and write the results as JSON")
+    run.add_argument("--problems", type=comma_separated(), default=list(PROBLEMS))
+    run.add_argument("--population-sizes", type=comma_separated(int), default=[50, 200])
+    run.add_argument("--chromosome-lengths", type=comma_separated(int), default=[10, 20])
+    run.add_argument("--decoders", type=comma_separated(), default=DECODERS)
+    run.add_argument("--operators", type=comma_separated(), default=list(OPERATORS))
+    run.add_argument("--dimensions", type=int, default=5)
+    run.add_argument("--generations", type=int, default=50)
+    run.add_argument("--vectorized", action="store_true")
+    run.add_argument("--seed", type=int, default=0)
+    run.add_argument("--in-process", action="store_true", help="do not start a fresh interpreter per configuration, peak RSS is then cumulative")
+    run.add_argument("--output", help="results file, standard output by default")
+    run.add_argument("--baseline", help="compare the results against this file")
+    run.add_argument("--tolerance", type=float, default=0.1)
+
+    diff = commands.add_parser("compare", help="flag regressions of a results file against a baseline")
+    diff.add_argument("baseline")
+    diff.add_argument("current")
+    diff.add_argument("--tolerance", type=float, default=0.1)
+
+    return parser.parse_args(argv)
+
+
+def report(regressions: list[dict]) -> int:
+    for regression in regressions:
+        print(f"REGRESSION {regression['name']} {regression['metric']}: {regression['baseline']} -> {regression['current']}", file=sys.stderr)
+    print(f"{len(regressions)} regression(s)", file=sys.stderr)
+    return 1 if regressions else 0
+
+
+def main(argv=None) -> int:
+    arguments = parse_arguments(argv)
+
+    if arguments.command == "compare":
+        with open(arguments.baseline) as file:
+            baseline = json.load(file)
+        with open(arguments.current) as file:
+            current = json.load(file)
+        return report(compare(baseline, current, arguments.tolerance))
+
+    for name in arguments.problems:
+        if name not in PROBLEMS:
+            raise SystemExit(f"Unknown problem {name!r}, choose from {', '.join(PROBLEMS)}")
+    for name in arguments.operators:
+        if name not in OPERATORS:
+            raise SystemExit(f"Unknown operators {name!r}, choose from {', '.join(OPERATORS)}")
+
+    configs = sweep(
+        problems=arguments.problems,
+        population_sizes=arguments.population_sizes,
+        chromosome_lengths=arguments.chromosome_lengths,
+        decoders=arguments.decoders,
+        operators=arguments.operators,
+        dimensions=arguments.dimensions,
+        generations=arguments.generations,
+        vectorized=arguments.vectorized,
+        seed=arguments.seed,
+    )
+
+    def progress(result):
+        print(f"{result['name']}: {result['generations_per_second']:.1f} generations/s, best {result['best_fitness']:.6g}", file=sys.stderr)
+
+    results = run_suite(configs, isolate=not arguments.in_process, progress=progress)
+
+    if arguments.output is None:
+        json.dump(results, sys.stdout, indent=2)
+        print()
+    else:
+        with open(arguments.output, "w") as file:
+            json.dump(results, file, indent=2)
+
+    if arguments.baseline is not None:
+        with open(arguments.baseline) as file:
+            return report(compare(json.load(file), results, arguments.tolerance))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
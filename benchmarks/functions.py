@@ -0,0 +1,69 @@
+"""
+Benchmark objective functions. Each one accepts a single individual or a
+(population_size, number_of_decision_variables) array, so the same function
+works with the per-individual and the vectorized engine
+"""
+import numpy as np
+
+
+def sphere(x):
+    x = np.asarray(x, dtype=np.float64)
+    return np.sum(x**2, axis=-1)
+
+
+def rastrigin(x):
+    x = np.asarray(x, dtype=np.float64)
+    return 10 * x.shape[-1] + np.sum(x**2 - 10 * np.cos(2 * np.pi * x), axis=-1)
+
+
+def rosenbrock(x):
+    x = np.asarray(x, dtype=np.float64)
+    return np.sum(100 * (x[..., 1:] - x[..., :-1]**2)**2 + (1 - x[..., :-1])**2, axis=-1)
+
+
+def ackley(x):
+    x = np.asarray(x, dtype=np.float64)
+    n = x.shape[-1]
+    return (
+        -20 * np.exp(-0.2 * np.sqrt(np.sum(x**2, axis=-1) / n))
+        - np.exp(np.sum(np.cos(2 * np.pi * x), axis=-1) / n)
+        + 20 + np.e
+    )
+
+
+def basic_polynomial(x):
+    # f(x1, x2) = x1^2 x2 + 2x1 - x2 from app.py
+    x = np.asarray(x, dtype=np.float64)
+    return x[..., 0]**2 * x[..., 1] + 2 * x[..., 0] - x[..., 1]
+
+
+def lab_polynomial(x):
+    # the objective of the app.py laboratory exercises
+    x = np.asarray(x, dtype=np.float64)
+    x0, x1, x2 = x[..., 0], x[..., 1], x[..., 2]
+    return 2*x0*x1*x2 - 4*x0*x2 - 2*x1*x2 + x0**2 + x1**2 + x2**2 - 2*x0 - 4*x1 + 4*x2
+
+
+class Problem:
+    def __init__(self, objective_function, lower_bound: float | list[float], upper_bound: float | list[float], maximize: bool = False, dimensions: int | None = None) -> None:
+        self.objective_function = objective_function
+        self.lower_bound = lower_bound
+        self.upper_bound = upper_bound
+        self.maximize = maximize
+        # None when the function works in any dimension
+        self.dimensions = dimensions
+
+    def bounds(self, number_of_decision_variables: int) -> tuple[list[float], list[float]]:
+        if self.dimensions is not None:
+            return list(self.lower_bound), list(self.upper_bound)
+        return [self.lower_bound] * number_of_decision_variables, [self.upper_bound] * number_of_decision_variables
+
+
+PROBLEMS = {
+    "sphere": Problem(sphere, -5.12, 5.12),
+    "rastrigin": Problem(rastrigin, -5.12, 5.12),
+    "rosenbrock": Problem(rosenbrock, -5, 10),
+    "ackley": Problem(ackley, -32.768, 32.768),
+    "basic_polynomial": Problem(basic_polynomial, [2, -1], [6, 4], maximize=True, dimensions=2),
+    "lab_polynomial": Problem(lab_polynomial, [10, 0, -20], [90, 90, 60], maximize=True, dimensions=3),
+}
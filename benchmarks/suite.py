@@ -0,0 +1,260 @@
+"""
+Runs GeneticAlgorithm over a sweep of configurations and measures
+throughput, memory, time per operator and convergence
+"""
+import itertools
+import multiprocessing
+import platform
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+from ga import GeneticAlgorithm
+from genetic_algorithm.callbacks.base import Callback
+from genetic_algorithm.callbacks.profiling import ProfilingCallback
+from genetic_algorithm.chromosome_decoder import BinaryChromosomeDecoder, DenaryChromosomeDecoder, IdentityChromosomeDecoder
+from genetic_algorithm.crossover import BlendCrossover, SimulatedBinaryCrossover, SinglePointCrossover, TwoPointCrossover, UniformCrossover
+from genetic_algorithm.mutation import BitFlipMutation, GaussianMutation, PerBitFlipMutation, PolynomialMutation
+from genetic_algorithm.optimization import BaseOptimization, Maximization, Minimization
+from genetic_algorithm.selection import TournamentSelection
+from genetic_algorithm.termination_criterion import NumberOfGeneration
+
+from .functions import PROBLEMS
+
+try:
+    import resource
+except ImportError:  # not available on Windows
+    resource = None
+
+
+DECODERS = ["binary", "denary", "identity"]
+
+# crossover and mutation pairs, with the decoders they work on
+OPERATORS = {
+    "single_point+bit_flip": (
+        lambda lb, ub: SinglePointCrossover(0.85),
+        lambda lb, ub: BitFlipMutation(0.2),
+        {"binary", "denary"},
+    ),
+    "two_point+per_bit_flip": (
+        lambda lb, ub: TwoPointCrossover(0.85),
+        lambda lb, ub: PerBitFlipMutation(0.01),
+        {"binary"},
+    ),
+    "uniform+per_bit_flip": (
+        lambda lb, ub: UniformCrossover(0.85),
+        lambda lb, ub: PerBitFlipMutation(0.01),
+        {"binary"},
+    ),
+    "sbx+polynomial": (
+        lambda lb, ub: SimulatedBinaryCrossover(0.9, lb, ub),
+        lambda lb, ub: PolynomialMutation(0.1, lb, ub),
+        {"identity"},
+    ),
+    "blend+gaussian": (
+        lambda lb, ub: BlendCrossover(0.9, lb, ub),
+        lambda lb, ub: GaussianMutation(0.1, lb, ub),
+        {"identity"},
+    ),
+}
+
+# larger is better for these metrics, smaller for the rest
+THROUGHPUT_METRICS = ["generations_per_second", "evaluations_per_second"]
+
+
+def sweep(
+    problems: list[str] = list(PROBLEMS),
+    population_sizes: list[int] = [50, 200],
+    chromosome_lengths: list[int] = [10, 20],
+    decoders: list[str] = DECODERS,
+    operators: list[str] = list(OPERATORS),
+    dimensions: int = 5,
+    generations: int = 50,
+    vectorized: bool = False,
+    seed: int = 0,
+) -> list[dict]:
+    """
+    Every compatible combination of the given settings. The chromosome
+    length is the number of bits of a binary gene and the number of digits
+    of a denary gene, it does not apply to the identity decoder
+    """
+    configs = []
+    for problem, population_size, decoder, operator in itertools.product(problems, population_sizes, decoders, operators):
+        if decoder not in OPERATORS[operator][2]:
+            continue
+
+        lengths = [None] if decoder == "identity" else chromosome_lengths
+        for chromosome_length in lengths:
+            configs.append({
+                "problem": problem,
+                "dimensions": PROBLEMS[problem].dimensions or dimensions,
+                "population_size": population_size,
+                "decoder": decoder,
+                "chromosome_length": chromosome_length,
+                "operators": operator,
+                "generations": generations,
+                "vectorized": vectorized,
+                "seed": seed,
+            })
+    return configs
+
+
+def configuration_name(config: dict) -> str:
+    decoder = config["decoder"] if config["chromosome_length"] is None else f"{config['decoder']}{config['chromosome_length']}"
+    mode = "vectorized" if config["vectorized"] else "list"
+    return f"{config['problem']}/d{config['dimensions']}/n{config['population_size']}/{decoder}/{config['operators']}/{mode}"
+
+
+def build_decoder(config: dict, lower_bounds: list[float], upper_bounds: list[float]):
+    decoder, length, dimensions = config["decoder"], config["chromosome_length"], config["dimensions"]
+    if decoder == "binary":
+        return BinaryChromosomeDecoder(length, dimensions, lower_bounds, upper_bounds)
+    if decoder == "denary":
+        # keep enough integer digits for the widest bound, the rest are decimals
+        integer_digits = len(str(int(max(map(abs, lower_bounds + upper_bounds)))))
+        if length <= integer_digits:
+            raise ValueError(f"A denary gene of {length} digits cannot hold {integer_digits} integer digits")
+        return DenaryChromosomeDecoder(length, dimensions, length - integer_digits, lower_bounds, upper_bounds)
+    if decoder == "identity":
+        return IdentityChromosomeDecoder(dimensions, lower_bounds, upper_bounds)
+    raise ValueError(f"Unknown decoder {decoder!r}")
+
+
+class ConvergenceRecorder(Callback):
+    """
+    Best fitness found so far against the number of objective evaluations
+    """
+    requires = frozenset({"population_fitness"})
+
+    def __init__(self, optimization: BaseOptimization) -> None:
+        self.optimization = optimization
+        self.best_fitness = None
+        self.trace: list[tuple[int, float]] = []
+
+    def on_evaluation_end(self, generation, population_fitness, cache_info):
+        best = population_fitness[self.optimization.best_index(population_fitness)]
+        if self.optimization.is_optimal(best, self.best_fitness):
+            self.best_fitness = float(best)
+
+    def on_profile(self, generation, phase_nanoseconds, number_of_evaluations, number_of_cache_hits):
+        # the first call follows initialization, before any evaluation
+        if self.best_fitness is not None:
+            self.trace.append((number_of_evaluations, self.best_fitness))
+
+
+def peak_rss_kib() -> int | None:
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # bytes on macOS, kilobytes elsewhere
+    return peak // 1024 if sys.platform == "darwin" else peak
+
+
+def run_configuration(config: dict) -> dict:
+    problem = PROBLEMS[config["problem"]]
+    lower_bounds, upper_bounds = problem.bounds(config["dimensions"])
+    optimization = Maximization() if problem.maximize else Minimization()
+    make_crossover, make_mutation, _ = OPERATORS[config["operators"]]
+
+    recorder = ConvergenceRecorder(optimization)
+    profiler = ProfilingCallback()
+    ga = GeneticAlgorithm(
+        population_size=config["population_size"],
+        objective_function=problem.objective_function,
+        chromosome_decoder=build_decoder(config, lower_bounds, upper_bounds),
+        termination=NumberOfGeneration(config["generations"]),
+        optimization=optimization,
+        selection=TournamentSelection(2),
+        crossover=make_crossover(lower_bounds, upper_bounds),
+        mutation=make_mutation(lower_bounds, upper_bounds),
+        callbacks=[recorder, profiler],
+        vectorized=config["vectorized"],
+        seed=config["seed"],
+    )
+
+    start = time.perf_counter()
+    ga.run()
+    elapsed = time.perf_counter() - start
+    phases = profiler.runs[-1]["phases"]
+
+    return {
+        "name": configuration_name(config),
+        "config": config,
+        "seconds": elapsed,
+        "generations_per_second": ga.number_of_generation / elapsed,
+        "evaluations_per_second": ga.number_of_evaluations / elapsed,
+        "evaluations": ga.number_of_evaluations,
+        "peak_rss_kib": peak_rss_kib(),
+        "operator_seconds": {phase: stats["total_ns"] / 1e9 for phase, stats in phases.items()},
+        "best_fitness": recorder.best_fitness,
+        "maximize": problem.maximize,
+        "convergence": recorder.trace,
+    }
+
+
+def run_suite(configs: list[dict], isolate: bool = True, progress=None) -> dict:
+    """
+    Run every configuration and collect the results with the environment
+    they were measured in. When isolate is set, each configuration runs in a
+    fresh interpreter so that its peak RSS is its own
+    """
+    results = []
+    if isolate:
+        context = multiprocessing.get_context("spawn")
+        with ProcessPoolExecutor(max_workers=1, mp_context=context, max_tasks_per_child=1) as executor:
+            for result in executor.map(run_configuration, configs):
+                results.append(result)
+                if progress is not None:
+                    progress(result)
+    else:
+        for config in configs:
+            results.append(run_configuration(config))
+            if progress is not None:
+                progress(results[-1])
+
+    return {
+        "environment": {
+            "python": platform.python_version(),
+            "numpy": np.__version__,
+            "platform": platform.platform(),
+            "processor": platform.processor(),
+            "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+        },
+        "results": results,
+    }
+
+
+def compare(baseline: dict, current: dict, tolerance: float = 0.1) -> list[dict]:
+    """
+    Metrics of current that are worse than baseline by more than tolerance,
+    relative to the baseline value. Configurations missing from either side
+    are ignored
+    """
+    baseline_results = {result["name"]: result for result in baseline["results"]}
+
+    regressions = []
+    for result in current["results"]:
+        reference = baseline_results.get(result["name"])
+        if reference is None:
+            continue
+
+        def flag(metric, old, new):
+            regressions.append({"name": result["name"], "metric": metric, "baseline": old, "current": new})
+
+        for metric in THROUGHPUT_METRICS:
+            if result[metric] < reference[metric] * (1 - tolerance):
+                flag(metric, reference[metric], result[metric])
+
+        if None not in (result["peak_rss_kib"], reference["peak_rss_kib"]):
+            if result["peak_rss_kib"] > reference["peak_rss_kib"] * (1 + tolerance):
+                flag("peak_rss_kib", reference["peak_rss_kib"], result["peak_rss_kib"])
+
+        # fitness can cross zero, so the margin is taken on its magnitude
+        old, new = reference["best_fitness"], result["best_fitness"]
+        margin = tolerance * max(abs(old), 1e-12)
+        if (new < old - margin) if result["maximize"] else (new > old + margin):
+            flag("best_fitness", old, new)
+
+    return regressions
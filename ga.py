@@ -1,13 +1,30 @@
-import random
+from __future__ import annotations
 
-from genetic_algorithm.type import Individual
-from genetic_algorithm.selection import BaseSelection, RouletteSelection
+import copy
+import inspect
+import time
+from typing import TYPE_CHECKING
+
+import numpy as np
+
+from genetic_algorithm.type import Chromosome, Individual
+from genetic_algorithm.rng import Seed, spawn
+from genetic_algorithm.selection import BaseSelection, RouletteSelection, TournamentSelection
 from genetic_algorithm.crossover import BaseCrossover, SinglePointCrossover
 from genetic_algorithm.mutation import BaseMutation, BitFlipMutation
 from genetic_algorithm.chromosome_decoder import BaseChromosomeDecoder
 from genetic_algorithm.optimization import BaseOptimization, Maximization
-from genetic_algorithm.termination_criterion import BaseTerminationCriterion
-from genetic_algorithm.callbacks.base import Callback
+from genetic_algorithm.termination_criterion import BaseTerminationCriterion, RunState
+from genetic_algorithm.fitness_cache import FitnessCache
+from genetic_algorithm.callbacks.base import CALLBACK_FIELDS, HOOKS, Callback, overrides
+
+# imported where they are used, so that importing ga does not pay for
+# asyncio, concurrent.futures and shared memory
+if TYPE_CHECKING:
+    from genetic_algorithm.multi_objective import MultiObjectiveOptimization
+    from genetic_algorithm.evaluator import BaseEvaluator
+    from genetic_algorithm.checkpoint import Checkpointer
+    from genetic_algorithm.surrogate import SurrogateScreening
 
 
 class GeneticAlgorithm:
@@ -18,116 +35,992 @@ class GeneticAlgorithm:
         chromosome_decoder: BaseChromosomeDecoder,
         termination: BaseTerminationCriterion,
         optimization: BaseOptimization = Maximization(),
-        selection: BaseSelection = RouletteSelection(),
-        crossover: BaseCrossover = SinglePointCrossover(0.85),
-        mutation: BaseMutation = BitFlipMutation(0.2),
-        callbacks: list[Callback] = []
+        selection: BaseSelection | None = None,
+        crossover: BaseCrossover | None = None,
+        mutation: BaseMutation | None = None,
+        callbacks: list[Callback] = [],
+        vectorized: bool = False,
+        persistent_genotypes: bool = False,
+        fitness_cache: FitnessCache | None = None,
+        evaluator: BaseEvaluator | None = None,
+        checkpointer: Checkpointer | None = None,
+        elitism: int = 0,
+        steady_state_offspring: int | None = None,
+        surrogate: SurrogateScreening | None = None,
+        seed: Seed = None
     ) -> None:
+        if not 0 <= elitism < population_size:
+            raise ValueError("elitism must be between 0 and population_size - 1")
+        if steady_state_offspring is not None:
+            if elitism:
+                raise ValueError("elitism and steady_state_offspring cannot be combined")
+            if not 1 <= steady_state_offspring <= population_size:
+                raise ValueError("steady_state_offspring must be between 1 and population_size")
+
+        # the default operators are built for every instance, reseed()
+        # gives them the random streams of this one
+        if selection is None:
+            selection = RouletteSelection()
+        if crossover is None:
+            crossover = SinglePointCrossover(0.85)
+        if mutation is None:
+            mutation = BitFlipMutation(0.2)
+        if evaluator is None:
+            from genetic_algorithm.evaluator import SerialEvaluator
+            evaluator = SerialEvaluator()
+
         self.population_size = population_size
         self.optimization = optimization
         self.chromosome_decoder = chromosome_decoder
+        # selections that rank by fitness follow the optimization of the run
+        # unless they were given their own. A copy is set, the selection may
+        # be shared with runs of another optimization
+        if hasattr(selection, "optimization") and selection.optimization is None:
+            selection = copy.copy(selection)
+            selection.optimization = self._selection_optimization()
         self.selector = selection
         self.crossover_strategy = crossover
         self.mutation_strategy = mutation
         self.terminator = termination
         self.objective_function = objective_function
         self.callbacks = callbacks
+        self._register_callbacks()
+        self._phase_nanoseconds: dict[str, int] = {}
+        # When vectorized, the population is a 2-D float64 array and the
+        # objective function maps the whole matrix to a fitness vector
+        self.vectorized = vectorized
+        # When persistent, the population is carried between generations as
+        # chromosomes and only decoded when it has to be evaluated or reported
+        self.persistent_genotypes = persistent_genotypes
+        # Fitness of already seen individuals, keyed on the chromosome when
+        # genotypes are persistent and on the individual otherwise
+        self.fitness_cache = fitness_cache
+        self.evaluator = evaluator
+        self.checkpointer = checkpointer
+        # The best members that survive into the next generation with their
+        # fitness: the elitism elites, or all but the worst
+        # steady_state_offspring members, which are replaced by as many offspring
+        self.elitism = elitism
+        self.steady_state_offspring = steady_state_offspring
+        self.surrogate = surrogate
+        self.number_of_survivors = elitism if steady_state_offspring is None else population_size - steady_state_offspring
+
+        self.rng = np.random.default_rng()
+        if seed is not None:
+            self.reseed(seed)
 
         self.lower_bounds = chromosome_decoder.lower_bounds
         self.upper_bounds = chromosome_decoder.upper_bounds
         self.number_of_decision_variables = chromosome_decoder.number_of_decision_variables
 
         self.number_of_generation = 0
+        # individuals passed to the objective function and individuals
+        # whose fitness came from the cache instead
+        self.number_of_evaluations = 0
+        self.number_of_cache_hits = 0
+        # wall-clock time of the run, including the time before the
+        # checkpoint it was resumed from
+        self._started_at: float | None = None
+        self._elapsed_before_start = 0.0
+        self.genotypes: list[Chromosome] | np.ndarray | None = None
         self.population: list[Individual] = []
         self.optimal_fitness: float = None
         self.optimal_individual: Individual = None
+        # fitness of the last evaluated generation
+        self.population_fitness: list[float] | np.ndarray | None = None
+        self._evaluated_population: list[Individual] | np.ndarray | None = None
+        # fitness of the survivors, which lead the current population, and
+        # which of the fitness values of the evaluated population and of the
+        # survivors were predicted by the surrogate
+        self._survivor_fitness: list[float] | np.ndarray | None = None
+        self._predicted: np.ndarray | None = None
+        self._survivor_predicted: np.ndarray | None = None
     
-    def run(self):
+    def run(self, resume_from: str | None = None):
         # initialize population
-        self.population = []
-        for _ in range(self.population_size):
-            individual = [random.uniform(self.lower_bounds[i], self.upper_bounds[i]) for i in range(self.number_of_decision_variables)]
-            self.population.append(individual)
+        self.start(resume_from)
 
         # while termination criterion is met
-        while not self.terminator.should_terminate(self.number_of_generation, self.optimal_fitness):
-            # Start of generation
-            for cb in self.callbacks:
-                cb.on_generation_start(
-                    self.number_of_generation,
-                    self.optimal_fitness,
-                    self.optimal_individual,
-                    self.population
-                )
-
-            # Evaluate population
-            population_fitness = []
-            best_individual = None
-            best_fitness = None
-            
-            for chromosome in self.population:
-                fitness = self.objective_function(chromosome)
-                population_fitness.append(fitness)
-
-                # Update the optimal fitness chromosome
-                if self.optimization.is_optimal(fitness, best_fitness):
-                    best_fitness = fitness
-                    best_individual = chromosome
-            
-            self.optimal_fitness = best_fitness
-            self.optimal_individual = best_individual
-
-            # Do selection
-            self.population = self.selector.select(self.population, population_fitness)
-
-            self.number_of_generation += 1
-
-            new_population = []
-            while len(new_population) < self.population_size:
-                # select two different parents, randomly
-                parent1 = random.choice(self.population)
-                parent2 = random.choice(self.population)
-
-                parent1 = self.chromosome_decoder.encode(parent1)
-                parent2 = self.chromosome_decoder.encode(parent2)
-
-                # crossover
-                child1, child2 = self.crossover_strategy.cross(parent1, parent2)
-
-                # mutation
-                child1, child2 = self.mutation_strategy.mutate(child1, child2)
-
-                child1 = self.chromosome_decoder.decode(child1)
-                child2 = self.chromosome_decoder.decode(child2)
-
-                # add the children to the new population
-                new_population.append(child1)
-
-                if len(new_population) < self.population_size:
-                    new_population.append(child2)
-
-            self.population = new_population
-
-            # End of generation
-            for cb in self.callbacks:
-                cb.on_generation_end(
-                    self.number_of_generation,
-                    self.optimal_fitness,
-                    self.optimal_individual,
-                    self.population
-                )
+        while not self.should_terminate():
+            self.step()
 
         # End of evolution
-        for cb in self.callbacks:
-            cb.on_evolution_end(
+        self.finish()
+
+    def start(self, resume_from: str | None = None):
+        """
+        Initialize the population, or restore it from a checkpoint file.
+        run() is start(), step() until should_terminate(), then finish()
+        """
+        if inspect.iscoroutinefunction(self.objective_function):
+            from genetic_algorithm.evaluator import AsyncEvaluator
+            if not isinstance(self.evaluator, AsyncEvaluator):
+                raise TypeError("A coroutine objective_function needs evaluator=AsyncEvaluator()")
+
+        # callbacks may have been changed since construction
+        self._register_callbacks()
+
+        self._started_at = time.monotonic()
+        self._elapsed_before_start = 0.0
+        if resume_from is not None:
+            from genetic_algorithm.checkpoint import load_checkpoint
+            self.set_state(load_checkpoint(resume_from))
+        else:
+            self._initialize()
+            self._profile()
+
+    def should_terminate(self) -> bool:
+        """
+        Ask the termination criterion, exactly once per generation
+        """
+        return self.terminator.should_terminate(self.run_state())
+
+    def run_state(self) -> RunState:
+        return RunState(
+            number_of_generation=self.number_of_generation,
+            optimal_fitness=self.optimal_fitness,
+            optimal_individual=self.optimal_individual,
+            number_of_evaluations=self.number_of_evaluations,
+            number_of_cache_hits=self.number_of_cache_hits,
+            elapsed_seconds=self.elapsed_seconds,
+            optimization=self.optimization,
+        )
+
+    @property
+    def elapsed_seconds(self) -> float:
+        if self._started_at is None:
+            return self._elapsed_before_start
+        return self._elapsed_before_start + time.monotonic() - self._started_at
+
+    def step(self):
+        """
+        Evaluate the current population and breed the next generation
+        """
+        # decode persistent genotypes up front, so that it is timed on its own
+        population = self.population
+
+        # Start of generation
+        self._schedule_callbacks()
+        self._dispatch("on_generation_start")
+
+        # Evaluate population
+        population_fitness = self._timer("evaluation", self._evaluate_generation)(population, self._deadline())
+        if self._cut_short(population, population_fitness):
+            return
+        self._dispatch("on_evaluation_end", population_fitness)
+
+        self._evolve(population_fitness)
+
+        # End of generation
+        self._dispatch("on_generation_end")
+        self._end_generation()
+
+    def finish(self):
+        self._dispatch("on_evolution_end")
+        self._close()
+
+    def reseed(self, seed: Seed):
+        """
+        Give the engine and the selection, crossover and mutation operators
+        independent random streams derived from seed
+        """
+        engine_seed, selection_seed, crossover_seed, mutation_seed = spawn(seed, 4)
+        self.rng = np.random.default_rng(engine_seed)
+        self.selector.rng = np.random.default_rng(selection_seed)
+        self.crossover_strategy.rng = np.random.default_rng(crossover_seed)
+        self.mutation_strategy.rng = np.random.default_rng(mutation_seed)
+
+    def get_state(self) -> dict:
+        """
+        Snapshot of everything needed to resume the evolution
+        """
+        def as_array(value):
+            return None if value is None else np.array(value)
+
+        return {
+            "number_of_generation": self.number_of_generation,
+            "number_of_evaluations": self.number_of_evaluations,
+            "number_of_cache_hits": self.number_of_cache_hits,
+            "elapsed_seconds": self.elapsed_seconds,
+            "optimal_fitness": self.optimal_fitness,
+            "optimal_individual": as_array(self.optimal_individual),
+            "population": None if self.persistent_genotypes else as_array(self.population),
+            "genotypes": as_array(self.genotypes),
+            "population_fitness": as_array(self.population_fitness),
+            "evaluated_population": as_array(self._evaluated_population),
+            "survivor_fitness": as_array(self._survivor_fitness),
+            "survivor_predicted": self._survivor_predicted,
+            "surrogate": None if self.surrogate is None else self.surrogate.get_state(),
+            "random_states": [component.rng.bit_generator.state for component in self._random_components()],
+            "terminator": self.terminator.get_state(),
+        }
+
+    def set_state(self, state: dict):
+        def restore(value):
+            if value is None or self.vectorized:
+                return value
+            return value.tolist()
+
+        self.number_of_generation = state["number_of_generation"]
+        self.number_of_evaluations = state.get("number_of_evaluations", 0)
+        self.number_of_cache_hits = state.get("number_of_cache_hits", 0)
+        self._elapsed_before_start = state.get("elapsed_seconds", 0.0)
+        self.optimal_fitness = state["optimal_fitness"]
+        self.optimal_individual = restore(state["optimal_individual"])
+        if state["genotypes"] is not None:
+            self._set_genotypes(restore(state["genotypes"]))
+        else:
+            self.genotypes = None
+            self.population = restore(state["population"])
+        self.population_fitness = restore(state["population_fitness"])
+        self._evaluated_population = restore(state["evaluated_population"])
+        self._survivor_fitness = restore(state.get("survivor_fitness"))
+        self._survivor_predicted = state.get("survivor_predicted")
+        if self.surrogate is not None and state.get("surrogate") is not None:
+            self.surrogate.set_state(state["surrogate"])
+
+        for component, random_state in zip(self._random_components(), state["random_states"]):
+            component.rng.bit_generator.state = random_state
+        self.terminator.set_state(state["terminator"])
+
+    def emigrants(self, count: int) -> list[tuple[float, Individual]]:
+        """
+        (fitness, individual) copies of the count best individuals of the
+        last evaluated generation
+        """
+        if self.population_fitness is None:
+            return []
+
+        order = np.argsort(self.optimization.scores(self.population_fitness), kind="stable")[::-1]
+        return [(self.population_fitness[i], list(self._evaluated_population[i])) for i in order[:count]]
+
+    def immigrate(self, individuals: list[Individual]):
+        """
+        Replace randomly chosen members of the current population
+        """
+        positions = self.rng.choice(self.population_size, min(len(individuals), self.population_size), replace=False)
+        # immigrants may take the place of survivors, evaluate everyone again
+        self._survivor_fitness = None
+        self._survivor_predicted = None
+
+        if self.persistent_genotypes:
+            for i, individual in zip(positions, individuals):
+                self.genotypes[i] = self.chromosome_decoder.encode(list(individual))
+            self._set_genotypes(self.genotypes)
+            return
+
+        for i, individual in zip(positions, individuals):
+            self.population[i] = np.asarray(individual, dtype=np.float64) if self.vectorized else list(individual)
+
+    async def run_async(self, resume_from: str | None = None):
+        """
+        Same as run(), but awaits the evaluation of every generation and any
+        callback hook written as a coroutine
+        """
+        self.start(resume_from)
+
+        while not self.should_terminate():
+            await self.step_async()
+
+        await self.finish_async()
+
+    async def step_async(self):
+        """
+        Same as step(), awaiting the evaluation and coroutine hooks
+        """
+        population = self.population
+        self._schedule_callbacks()
+        await self._dispatch_async("on_generation_start")
+
+        population_fitness = await self._timer("evaluation", self._evaluate_generation_async)(population, self._deadline())
+        if self._cut_short(population, population_fitness):
+            return
+        await self._dispatch_async("on_evaluation_end", population_fitness)
+
+        self._evolve(population_fitness)
+
+        await self._dispatch_async("on_generation_end")
+        self._end_generation()
+
+    async def finish_async(self):
+        await self._dispatch_async("on_evolution_end")
+        self._close()
+
+    def _cut_short(self, population: list[Individual] | np.ndarray, population_fitness: list[float] | np.ndarray) -> bool:
+        # the time limit passed during the evaluation
+        if len(population_fitness) < len(population):
+            self._keep_partial_evaluation(population, population_fitness)
+            return True
+        return False
+
+    def _end_generation(self):
+        self._profile()
+        if self.checkpointer is not None:
+            self.checkpointer.on_generation_end(self)
+
+    def _close(self):
+        self.evaluator.close()
+        if self.checkpointer is not None:
+            self.checkpointer.save(self)
+            self.checkpointer.close()
+
+    def _initialize(self):
+        self._survivor_fitness = None
+        self._survivor_predicted = None
+        if self.surrogate is not None:
+            self.surrogate.reset()
+        self.population = self._timer("initialization", self._initialize_population)()
+        if self.persistent_genotypes:
+            self._set_genotypes(self._timer("encoding", self._encode_population)(self.population))
+
+    def _evolve(self, population_fitness: list[float] | np.ndarray):
+        self.population_fitness = population_fitness
+        self._evaluated_population = self.population
+
+        # Update the optimal fitness chromosome
+        self._update_optimal(self.population, population_fitness)
+
+        # Do selection
+        select = self._timer("selection", self.selector.select)
+        if self.persistent_genotypes:
+            parents = select(self.genotypes, population_fitness)
+        else:
+            parents = select(self.population, population_fitness)
+
+        self.number_of_generation += 1
+
+        survivors = self._select_survivors(population_fitness)
+        number_of_offspring = self.population_size - len(survivors)
+
+        if hasattr(self.crossover_strategy, "cross_batch"):
+            offspring = self._reproduce_batch(parents, number_of_offspring)
+        else:
+            offspring = self._reproduce(parents, number_of_offspring)
+
+        # the survivors lead the next generation and keep their fitness
+        current = self.genotypes if self.persistent_genotypes else self.population
+        if self.vectorized:
+            offspring = np.concatenate((current[survivors], np.asarray(offspring, dtype=current.dtype).reshape(-1, *current.shape[1:])))
+            self._survivor_fitness = population_fitness[survivors] if len(survivors) else None
+        else:
+            offspring = [current[i] for i in survivors] + offspring
+            self._survivor_fitness = [population_fitness[i] for i in survivors] if len(survivors) else None
+        self._survivor_predicted = None if self._predicted is None or not len(survivors) else self._predicted[survivors]
+
+        if self.persistent_genotypes:
+            self._set_genotypes(offspring)
+        else:
+            self.population = offspring
+
+    def _select_survivors(self, population_fitness: list[float] | np.ndarray) -> np.ndarray:
+        """
+        Indices of the number_of_survivors best members, in no particular order
+        """
+        if self.number_of_survivors == 0:
+            return np.empty(0, dtype=np.intp)
+
+        # a partial sort is enough, the order among the survivors does not matter
+        scores = self.optimization.scores(population_fitness)
+        return np.argpartition(-scores, self.number_of_survivors - 1)[:self.number_of_survivors]
+
+    def _random_components(self) -> list:
+        return [self, self.selector, self.crossover_strategy, self.mutation_strategy]
+
+    def _selection_optimization(self) -> BaseOptimization:
+        return self.optimization
+
+    def _register_callbacks(self):
+        # Only the callbacks that override a hook are called for it
+        self._hooks = {hook: [cb for cb in self.callbacks if overrides(cb, hook)] for hook in HOOKS}
+        # Phases are only timed when a callback implements on_profile
+        self._profilers = [cb for cb in self.callbacks if overrides(cb, "on_profile")]
+        self._due = {hook: [] for hook in HOOKS}
+
+    def _schedule_callbacks(self):
+        # Decided once per generation, before number_of_generation counts
+        # it, so that a due callback gets all the hooks of the generation
+        completed = self.number_of_generation + 1
+        self._due = {hook: [cb for cb in callbacks if completed % getattr(cb, "every", 1) == 0] for hook, callbacks in self._hooks.items()}
+
+    def _due_callbacks(self, hook: str) -> list[Callback]:
+        if hook == "on_evolution_end":
+            return self._hooks[hook]
+        return self._due[hook]
+
+    def _hook_arguments(self, hook: str, callbacks: list[Callback], population_fitness: list[float] | np.ndarray | None) -> tuple:
+        # fields no callback asked for are passed as None, so that the
+        # population is not decoded just to be ignored
+        requested = set()
+        for cb in callbacks:
+            requires = getattr(cb, "requires", None)
+            if requires is None:
+                requested = CALLBACK_FIELDS
+                break
+            requested |= requires
+
+        if hook == "on_evaluation_end":
+            return (
                 self.number_of_generation,
-                self.optimal_fitness,
-                self.optimal_individual,
-                self.population
+                population_fitness if "population_fitness" in requested else None,
+                self.fitness_cache.cache_info() if "cache_info" in requested and self.fitness_cache is not None else None,
             )
 
+        return (
+            self.number_of_generation,
+            self.optimal_fitness if "best_fitness" in requested else None,
+            self.optimal_individual if "best_individual" in requested else None,
+            self.population if "population" in requested else None,
+        )
+
+    def _dispatch(self, hook: str, population_fitness: list[float] | np.ndarray | None = None):
+        callbacks = self._due_callbacks(hook)
+        if not callbacks:
+            return
+
+        if self._profilers:
+            start = time.perf_counter_ns()
+
+        args = self._hook_arguments(hook, callbacks, population_fitness)
+        for cb in callbacks:
+            getattr(cb, hook)(*args)
+
+        if self._profilers:
+            self._add_phase_time("callbacks", time.perf_counter_ns() - start)
+
+    async def _dispatch_async(self, hook: str, population_fitness: list[float] | np.ndarray | None = None):
+        callbacks = self._due_callbacks(hook)
+        if not callbacks:
+            return
+
+        start = time.perf_counter_ns()
+        args = self._hook_arguments(hook, callbacks, population_fitness)
+        for cb in callbacks:
+            result = getattr(cb, hook)(*args)
+            if inspect.isawaitable(result):
+                await result
+        if self._profilers:
+            self._add_phase_time("callbacks", time.perf_counter_ns() - start)
+
+    def _timer(self, phase: str, function):
+        """
+        function itself when nothing is profiling, otherwise a wrapper that
+        adds its running time to phase
+        """
+        if not self._profilers:
+            return function
+
+        if inspect.iscoroutinefunction(function):
+            async def timed_async(*args):
+                start = time.perf_counter_ns()
+                try:
+                    return await function(*args)
+                finally:
+                    self._add_phase_time(phase, time.perf_counter_ns() - start)
+            return timed_async
+
+        def timed(*args):
+            start = time.perf_counter_ns()
+            try:
+                return function(*args)
+            finally:
+                self._add_phase_time(phase, time.perf_counter_ns() - start)
+        return timed
+
+    def _add_phase_time(self, phase: str, nanoseconds: int):
+        self._phase_nanoseconds[phase] = self._phase_nanoseconds.get(phase, 0) + nanoseconds
+
+    def _profile(self):
+        # hand the phase times accumulated since the last call to the profilers
+        if not self._profilers:
+            return
+
+        phase_nanoseconds, self._phase_nanoseconds = self._phase_nanoseconds, {}
+        for cb in self._profilers:
+            cb.on_profile(self.number_of_generation, phase_nanoseconds, self.number_of_evaluations, self.number_of_cache_hits)
+
+    @property
+    def population(self) -> list[Individual] | np.ndarray:
+        if self._population is None and self.genotypes is not None:
+            self._population = self._timer("decoding", self._decode_population)(self.genotypes)
+        return self._population
+
+    @population.setter
+    def population(self, population: list[Individual] | np.ndarray):
+        self._population = population
+
+    def _set_genotypes(self, genotypes: list[Chromosome] | np.ndarray):
+        # the phenotypes are decoded again on first access
+        self.genotypes = genotypes
+        self._population = None
+
+    def _encode_population(self, population: list[Individual] | np.ndarray) -> list[Chromosome] | np.ndarray:
+        if self.vectorized:
+            return self.chromosome_decoder.encode_batch(population)
+        return [self.chromosome_decoder.encode(individual) for individual in population]
+
+    def _decode_population(self, genotypes: list[Chromosome] | np.ndarray) -> list[Individual] | np.ndarray:
+        if self.vectorized:
+            return self.chromosome_decoder.decode_batch(genotypes)
+        return [self.chromosome_decoder.decode(chromosome) for chromosome in genotypes]
+
+    def _initialize_population(self) -> list[Individual] | np.ndarray:
+        population = self.rng.uniform(
+            self.lower_bounds,
+            self.upper_bounds,
+            size=(self.population_size, self.number_of_decision_variables)
+        )
+
+        if self.vectorized:
+            return population
+        return population.tolist()
+
+    def _evaluate_generation(self, population: list[Individual] | np.ndarray, deadline: float | None = None) -> list[float] | np.ndarray:
+        """
+        Fitness of the current population. Survivors of the previous
+        generation keep their fitness and, with a surrogate, the offspring
+        it screens out keep their predicted fitness
+        """
+        rows, predicted_fitness = self._screen(population)
+        fitness = self._evaluate(self._take(population, rows), deadline, rows)
+        return self._assemble_fitness(population, rows, predicted_fitness, fitness)
+
+    async def _evaluate_generation_async(self, population: list[Individual] | np.ndarray, deadline: float | None = None) -> list[float] | np.ndarray:
+        rows, predicted_fitness = self._screen(population)
+        fitness = await self._evaluate_async(self._take(population, rows), deadline, rows)
+        return self._assemble_fitness(population, rows, predicted_fitness, fitness)
+
+    def _screen(self, population: list[Individual] | np.ndarray) -> tuple[np.ndarray | None, np.ndarray | None]:
+        # Rows of the population to evaluate, None for all of them, and the
+        # predicted fitness of the offspring when the surrogate screened them
+        survivors = self._number_of_evaluated_survivors()
+        if self.surrogate is None:
+            return (None if survivors == 0 else np.arange(survivors, len(population))), None
+
+        offspring_rows = np.arange(survivors, len(population))
+        screened = self.surrogate.screen(self.number_of_generation, self._take(population, offspring_rows), self.optimization)
+        if screened is None:
+            return (None if survivors == 0 else offspring_rows), None
+        rows, predicted_fitness = screened
+        return survivors + rows, predicted_fitness
+
+    def _assemble_fitness(self, population: list[Individual] | np.ndarray, rows: np.ndarray | None, predicted_fitness: np.ndarray | None, fitness: list[float] | np.ndarray) -> list[float] | np.ndarray:
+        # fitness may only cover the leading rows when the deadline passed
+        evaluated_rows = np.arange(len(fitness)) if rows is None else rows[:len(fitness)]
+        if self.surrogate is not None:
+            self.surrogate.record(self._take(population, evaluated_rows), fitness)
+
+        survivors = self._number_of_evaluated_survivors()
+        if predicted_fitness is None:
+            self._predicted = None if self._survivor_predicted is None else np.concatenate((self._survivor_predicted, np.zeros(len(fitness), dtype=bool)))
+            return fitness if survivors == 0 else self._join_survivor_fitness(fitness)
+
+        self.surrogate.record_error(self.number_of_generation, len(predicted_fitness) - len(rows), predicted_fitness[evaluated_rows - survivors], fitness)
+
+        population_fitness = np.empty(len(population))
+        population_fitness[survivors:] = predicted_fitness
+        population_fitness[evaluated_rows] = fitness
+        predicted = np.ones(len(population), dtype=bool)
+        predicted[evaluated_rows] = False
+        if survivors:
+            population_fitness[:survivors] = self._survivor_fitness
+            predicted[:survivors] = False if self._survivor_predicted is None else self._survivor_predicted
+
+        # keep the prefix up to the first row the deadline left unevaluated
+        length = len(population) if len(fitness) == len(rows) else rows[len(fitness)]
+        self._predicted = predicted[:length]
+        population_fitness = population_fitness[:length]
+        return population_fitness if self.vectorized else population_fitness.tolist()
+
+    def _number_of_evaluated_survivors(self) -> int:
+        return 0 if self._survivor_fitness is None else len(self._survivor_fitness)
+
+    def _join_survivor_fitness(self, offspring_fitness: list[float] | np.ndarray) -> list[float] | np.ndarray:
+        if self.vectorized:
+            return np.concatenate((self._survivor_fitness, offspring_fitness))
+        return list(self._survivor_fitness) + list(offspring_fitness)
+
+    @staticmethod
+    def _take(population: list | np.ndarray, rows: np.ndarray | None) -> list | np.ndarray:
+        # None takes every row
+        if rows is None:
+            return population
+        if isinstance(population, np.ndarray):
+            return population[rows]
+        return [population[i] for i in rows]
+
+    def _evaluate(self, population: list[Individual] | np.ndarray, deadline: float | None = None, rows: np.ndarray | None = None) -> list[float] | np.ndarray:
+        """
+        Fitness of the population, the given rows of the current one, or of
+        its leading individuals only when the deadline passed during the
+        evaluation
+        """
+        if self.fitness_cache is None:
+            return self._evaluate_individuals(population, deadline)
+
+        population_fitness, missing, unseen = self._lookup_fitness(population, rows)
+        if missing:
+            self._store_fitness(population_fitness, missing, self._evaluate_individuals(unseen, deadline))
+        return self._as_fitness(self._evaluated_prefix(population_fitness))
+
+    async def _evaluate_async(self, population: list[Individual] | np.ndarray, deadline: float | None = None, rows: np.ndarray | None = None) -> list[float] | np.ndarray:
+        if self.fitness_cache is None:
+            return await self._evaluate_individuals_async(population, deadline)
+
+        population_fitness, missing, unseen = self._lookup_fitness(population, rows)
+        if missing:
+            self._store_fitness(population_fitness, missing, await self._evaluate_individuals_async(unseen, deadline))
+        return self._as_fitness(self._evaluated_prefix(population_fitness))
+
+    def _deadline(self) -> float | None:
+        remaining = self.terminator.time_remaining(self.run_state())
+        return None if remaining is None else time.monotonic() + remaining
+
+    @staticmethod
+    def _evaluated_prefix(population_fitness: list[float | None]) -> list[float]:
+        # unseen chromosomes the evaluator did not get to before the deadline
+        # have no fitness. Compared by identity, fitness may be a vector
+        for i, fitness in enumerate(population_fitness):
+            if fitness is None:
+                return population_fitness[:i]
+        return population_fitness
+
+    def _keep_partial_evaluation(self, population: list[Individual] | np.ndarray, population_fitness: list[float] | np.ndarray):
+        # the generation is not bred, but a better individual found in it is kept
+        candidates = np.arange(len(population_fitness)) if self._predicted is None else np.flatnonzero(~self._predicted)
+        if len(candidates) == 0:
+            return
+
+        best = int(candidates[self.optimization.best_index(self._take(population_fitness, candidates))])
+        if self.optimization.is_optimal(population_fitness[best], self.optimal_fitness):
+            if self.vectorized:
+                self.optimal_fitness = float(population_fitness[best])
+                self.optimal_individual = population[best].copy()
+            else:
+                self.optimal_fitness = population_fitness[best]
+                self.optimal_individual = population[best]
+
+    def _lookup_fitness(self, population: list[Individual] | np.ndarray, rows: np.ndarray | None = None) -> tuple[list[float | None], dict, list[Individual] | np.ndarray]:
+        # Evaluate each unseen chromosome once, however often it appears
+        population_fitness, missing = self.fitness_cache.lookup(self._genotype_keys(population, rows))
+
+        unseen = self._take(population, [indices[0] for indices in missing.values()])
+        self.number_of_cache_hits += len(population) - len(unseen)
+        return population_fitness, missing, unseen
+
+    def _store_fitness(self, population_fitness: list[float | None], missing: dict, unseen_fitness: list[float] | np.ndarray):
+        for (key, indices), fitness in zip(missing.items(), unseen_fitness):
+            self.fitness_cache.put(key, fitness)
+            for i in indices:
+                population_fitness[i] = fitness
+
+    def _evaluate_individuals(self, population: list[Individual] | np.ndarray, deadline: float | None = None) -> list[float] | np.ndarray:
+        population_fitness = self.evaluator.evaluate(*self._evaluator_arguments(population, deadline))
+        return self._count_evaluations(population, population_fitness, deadline)
+
+    async def _evaluate_individuals_async(self, population: list[Individual] | np.ndarray, deadline: float | None = None) -> list[float] | np.ndarray:
+        population_fitness = await self.evaluator.evaluate_async(*self._evaluator_arguments(population, deadline))
+        return self._count_evaluations(population, population_fitness, deadline)
+
+    def _evaluator_arguments(self, population: list[Individual] | np.ndarray, deadline: float | None) -> tuple:
+        # evaluators written before deadlines existed do not take one
+        if deadline is None:
+            return self.objective_function, population, self.vectorized
+        return self.objective_function, population, self.vectorized, deadline
+
+    def _count_evaluations(self, population: list[Individual] | np.ndarray, population_fitness: list[float] | np.ndarray, deadline: float | None) -> list[float] | np.ndarray:
+        # with a deadline, the evaluator may return the fitness of a prefix only
+        population_fitness = self._as_fitness(population_fitness, len(population) if deadline is None else None)
+        if len(population_fitness) > len(population):
+            raise ValueError(f"The evaluator returned {len(population_fitness)} fitness values for {len(population)} individuals")
+
+        self.number_of_evaluations += len(population_fitness)
+        return population_fitness
+
+    def _as_fitness(self, population_fitness: list[float] | np.ndarray, size: int | None = None) -> list[float] | np.ndarray:
+        if not self.vectorized:
+            return population_fitness
+
+        population_fitness = np.asarray(population_fitness, dtype=np.float64)
+        if size is not None and population_fitness.shape != (size,):
+            raise ValueError(f"vectorized objective_function must return {size} fitness values, got shape {population_fitness.shape}")
+        return population_fitness
+
+    def _genotype_keys(self, population: list[Individual] | np.ndarray, rows: np.ndarray | None = None) -> list:
+        if not self.persistent_genotypes:
+            # distinct individuals may share a chromosome once encoded
+            return [np.asarray(individual, dtype=np.float64).tobytes() for individual in population]
+
+        # chromosomes may be flat, real-coded ones, or nested with one gene per variable
+        return [np.asarray(chromosome).tobytes() for chromosome in self._take(self.genotypes, rows)]
+
+    def _update_optimal(self, population: list[Individual] | np.ndarray, population_fitness: list[float] | np.ndarray):
+        survivors = self._number_of_evaluated_survivors()
+        if self._predicted is not None:
+            # predicted fitness cannot make an individual the optimum
+            candidates = np.flatnonzero(~self._predicted)
+        elif survivors and self.optimal_fitness is not None:
+            # The optimum of the previous generation is among the survivors,
+            # only the offspring can replace it
+            candidates = np.arange(survivors, len(population_fitness))
+        else:
+            candidates = None
+
+        if candidates is not None:
+            best = int(candidates[self.optimization.best_index(self._take(population_fitness, candidates))])
+            if self.optimization.is_optimal(population_fitness[best], self.optimal_fitness):
+                self.optimal_fitness = float(population_fitness[best]) if self.vectorized else population_fitness[best]
+                self.optimal_individual = population[best].copy() if self.vectorized else population[best]
+            return
+
+        if self.vectorized:
+            best = self.optimization.best_index(population_fitness)
+            self.optimal_fitness = float(population_fitness[best])
+            self.optimal_individual = population[best].copy()
+            return
+
+        best_individual = None
+        best_fitness = None
+        for individual, fitness in zip(population, population_fitness):
+            if self.optimization.is_optimal(fitness, best_fitness):
+                best_fitness = fitness
+                best_individual = individual
+
+        self.optimal_fitness = best_fitness
+        self.optimal_individual = best_individual
+
+    def _reproduce(self, parents: list[Individual] | list[Chromosome] | np.ndarray, number_of_offspring: int | None = None) -> list[Individual] | list[Chromosome]:
+        if self.persistent_genotypes and self.vectorized:
+            # the operators work on nested lists
+            parents = np.asarray(parents).tolist()
+
+        if number_of_offspring is None:
+            number_of_offspring = self.population_size
+
+        # select two parents per pair of children, randomly
+        pairs = self.rng.integers(0, len(parents), size=((number_of_offspring + 1) // 2, 2))
+
+        encode = self._timer("encoding", self.chromosome_decoder.encode)
+        decode = self._timer("decoding", self.chromosome_decoder.decode)
+        cross = self._timer("crossover", self.crossover_strategy.cross)
+        mutate = self._timer("mutation", self.mutation_strategy.mutate)
+
+        new_population = []
+        for i, j in pairs:
+            parent1 = parents[i]
+            parent2 = parents[j]
+
+            if not self.persistent_genotypes:
+                parent1 = encode(parent1)
+                parent2 = encode(parent2)
+
+            # crossover
+            child1, child2 = cross(parent1, parent2)
+
+            # mutation
+            child1, child2 = mutate(child1, child2)
+
+            if not self.persistent_genotypes:
+                child1 = decode(child1)
+                child2 = decode(child2)
+
+            # add the children to the new population
+            new_population.append(child1)
+
+            if len(new_population) < number_of_offspring:
+                new_population.append(child2)
+
+        return new_population
+
+    def _reproduce_batch(self, parents: list[Individual] | list[Chromosome] | np.ndarray, number_of_offspring: int | None = None) -> list[Individual] | list[Chromosome] | np.ndarray:
+        if self.persistent_genotypes:
+            genotypes = np.asarray(parents)
+        else:
+            genotypes = self._timer("encoding", self.chromosome_decoder.encode_batch)(parents)
+
+        if number_of_offspring is None:
+            number_of_offspring = self.population_size
+
+        # select two parents per pair of children, randomly
+        pairs = self.rng.integers(0, len(genotypes), size=((number_of_offspring + 1) // 2, 2))
+
+        # crossover
+        children1, children2 = self._timer("crossover", self.crossover_strategy.cross_batch)(genotypes[pairs[:, 0]], genotypes[pairs[:, 1]])
+
+        # the children of pair k are rows 2k and 2k + 1
+        offspring = np.stack((children1, children2), axis=1).reshape(-1, *children1.shape[1:])
+
+        # mutation
+        if hasattr(self.mutation_strategy, "mutate_batch"):
+            offspring = self._timer("mutation", self.mutation_strategy.mutate_batch)(offspring)
+        else:
+            mutate = self._timer("mutation", self.mutation_strategy.mutate)
+            for k in range(len(pairs)):
+                offspring[2 * k], offspring[2 * k + 1] = mutate(offspring[2 * k].tolist(), offspring[2 * k + 1].tolist())
+
+        offspring = offspring[:number_of_offspring]
+        if not self.persistent_genotypes:
+            offspring = self._timer("decoding", self.chromosome_decoder.decode_batch)(offspring)
+
+        return offspring if self.vectorized else offspring.tolist()
+
     @property
     def result(self):
-        if not self.optimal_individual:
+        if self.optimal_individual is None:
             print("(Warning) Genetic Algorithm has not been run yet. Call run() method first")
         return self.optimal_fitness, self.optimal_individual
+
+
+class NSGA2(GeneticAlgorithm):
+    """
+    Multi-objective genetic algorithm: objective_function returns one value
+    per objective (a row per individual when vectorized) and optimization
+    gives the direction of each.
+
+    Every generation the offspring are merged with the parents, ranked by
+    non-dominated sorting and crowding distance, and the population_size
+    best become the next parents. selection works on scores that order
+    them by rank then crowding distance, so the default binary tournament
+    is the crowded tournament of NSGA-II.
+
+    The non-dominated front of the parents is pareto_fitness, a matrix with
+    one row per individual, and pareto_front. They are also optimal_fitness
+    and optimal_individual, so callbacks and result receive the front
+    """
+    def __init__(
+        self,
+        population_size: int,
+        objective_function,
+        chromosome_decoder: BaseChromosomeDecoder,
+        termination: BaseTerminationCriterion,
+        optimization: MultiObjectiveOptimization | None = None,
+        selection: BaseSelection | None = None,
+        **settings
+    ) -> None:
+        for name in ["elitism", "steady_state_offspring", "surrogate"]:
+            if settings.get(name):
+                raise ValueError(f"NSGA2 keeps the best parents by itself, {name} does not apply")
+        if optimization is None:
+            from genetic_algorithm.multi_objective import MultiObjectiveOptimization
+            optimization = MultiObjectiveOptimization()
+        if selection is None:
+            selection = TournamentSelection(2)
+        super().__init__(population_size, objective_function, chromosome_decoder, termination, optimization, selection, **settings)
+
+        self.pareto_front: list[Individual] | np.ndarray | None = None
+        self.pareto_fitness: np.ndarray | None = None
+        # the parents as bred (genotypes when they are persistent), decoded,
+        # and their fitness
+        self._parents: list | np.ndarray | None = None
+        self._parent_individuals: list[Individual] | np.ndarray | None = None
+        self._parent_fitness: np.ndarray | None = None
+
+    def get_state(self) -> dict:
+        state = super().get_state()
+        state["parents"] = None if self._parents is None else np.array(self._parents)
+        state["parent_individuals"] = None if self._parent_individuals is None else np.array(self._parent_individuals)
+        state["parent_fitness"] = self._parent_fitness
+        return state
+
+    def set_state(self, state: dict):
+        super().set_state(state)
+
+        def restore(value):
+            if value is None or self.vectorized:
+                return value
+            return value.tolist()
+
+        self._parents = restore(state["parents"])
+        self._parent_individuals = restore(state["parent_individuals"])
+        self._parent_fitness = state["parent_fitness"]
+        self.pareto_front = self.optimal_individual
+        self.pareto_fitness = None if self.optimal_fitness is None else np.asarray(self.optimal_fitness, dtype=np.float64)
+        self.optimal_fitness = self.pareto_fitness
+
+    def _initialize(self):
+        self._parents = self._parent_individuals = self._parent_fitness = None
+        super()._initialize()
+
+    def emigrants(self, count: int) -> list[tuple[np.ndarray, Individual]]:
+        """
+        (objectives, individual) copies of the count best parents, by rank
+        then crowding distance
+        """
+        if self._parent_fitness is None:
+            return []
+
+        from genetic_algorithm.multi_objective import crowded_scores
+        ranks, distance = self._rank(self._parent_fitness)
+        order = np.argsort(-crowded_scores(ranks, distance), kind="stable")
+        return [(self._parent_fitness[i], list(self._parent_individuals[i])) for i in order[:count]]
+
+    def _selection_optimization(self) -> BaseOptimization:
+        # the selection compares crowded scores, larger is better
+        return Maximization()
+
+    def _as_fitness(self, population_fitness: list | np.ndarray, size: int | None = None) -> list | np.ndarray:
+        if not self.vectorized:
+            return population_fitness
+
+        population_fitness = np.asarray(population_fitness, dtype=np.float64)
+        if size is not None and (population_fitness.ndim != 2 or len(population_fitness) != size):
+            raise ValueError(f"vectorized objective_function must return a row of objectives for each of the {size} individuals, got shape {population_fitness.shape}")
+        return population_fitness
+
+    def _keep_partial_evaluation(self, population: list[Individual] | np.ndarray, population_fitness: list | np.ndarray):
+        # the front only changes when a whole generation has been evaluated
+        pass
+
+    def _evolve(self, population_fitness: list | np.ndarray):
+        self.population_fitness = population_fitness
+        self._evaluated_population = self.population
+
+        offspring = self.genotypes if self.persistent_genotypes else self.population
+        offspring_fitness = np.asarray(population_fitness, dtype=np.float64).reshape(len(offspring), -1)
+        if self._parents is None:
+            candidates, individuals, fitness = offspring, self.population, offspring_fitness
+        else:
+            candidates = self._join(self._parents, offspring)
+            individuals = self._join(self._parent_individuals, self.population)
+            fitness = np.concatenate((self._parent_fitness, offspring_fitness))
+
+        # Environmental selection: best ranks first, the least crowded first within a rank
+        ranks, distance = self._timer("selection", self._rank)(fitness)
+        keep = np.lexsort((-distance, ranks))[:self.population_size]
+        self._parents = self._take(candidates, keep)
+        self._parent_individuals = self._take(individuals, keep)
+        self._parent_fitness = fitness[keep]
+        ranks, distance = ranks[keep], distance[keep]
+
+        front = np.flatnonzero(ranks == 0)
+        self.pareto_front = self._take(self._parent_individuals, front)
+        self.pareto_fitness = self._parent_fitness[front]
+        self.optimal_fitness, self.optimal_individual = self.pareto_fitness, self.pareto_front
+
+        from genetic_algorithm.multi_objective import crowded_scores
+        parents = self._timer("selection", self.selector.select)(self._parents, crowded_scores(ranks, distance))
+
+        self.number_of_generation += 1
+
+        if hasattr(self.crossover_strategy, "cross_batch"):
+            offspring = self._reproduce_batch(parents)
+        else:
+            offspring = self._reproduce(parents)
+
+        if self.persistent_genotypes:
+            self._set_genotypes(np.asarray(offspring, dtype=self.genotypes.dtype) if self.vectorized else offspring)
+        elif self.vectorized:
+            self.population = np.asarray(offspring, dtype=np.float64)
+        else:
+            self.population = offspring
+
+    def _rank(self, fitness: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+        objectives = self.optimization.objectives(fitness)
+        from genetic_algorithm.multi_objective import crowding_distance, non_dominated_sort
+        ranks = non_dominated_sort(objectives)
+        return ranks, crowding_distance(objectives, ranks)
+
+    @staticmethod
+    def _join(a: list | np.ndarray, b: list | np.ndarray) -> list | np.ndarray:
+        if isinstance(a, np.ndarray):
+            return np.concatenate((a, b))
+        return list(a) + list(b)
@@ -0,0 +1,55 @@
+"""
+python -m genetic_algorithm run.toml --seed 1 --output result.json
+
+Runs the algorithm a TOML or JSON configuration describes, see config.py,
+and writes the result as JSON. Modules next to the configuration file can
+hold the objective function
+"""
+import argparse
+import json
+import os
+import sys
+
+
+def parse_arguments(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m genetic_algorithm", description="Run a genetic algorithm from a configuration file")
+    parser.add_argument("config", help="TOML or JSON configuration")
+    parser.add_argument("--seed", type=int, help="overrides the seed of the configuration")
+    parser.add_argument("--resume-from", help="checkpoint file to resume the run from")
+    parser.add_argument("--output", help="result file, standard output by default")
+    return parser.parse_args(argv)
+
+
+def main(argv=None) -> int:
+    arguments = parse_arguments(argv)
+
+    # imported here so that --help does not pay for numpy
+    import numpy as np
+    from .config import build, load_config
+
+    config = load_config(arguments.config)
+    if arguments.seed is not None:
+        config["seed"] = arguments.seed
+    sys.path.insert(0, os.path.dirname(os.path.abspath(arguments.config)))
+
+    ga = build(config)
+    ga.run(resume_from=arguments.resume_from)
+
+    result = {
+        "optimal_fitness": np.asarray(ga.optimal_fitness).tolist(),
+        "optimal_individual": np.asarray(ga.optimal_individual).tolist(),
+        "number_of_generation": ga.number_of_generation,
+        "number_of_evaluations": ga.number_of_evaluations,
+        "elapsed_seconds": ga.elapsed_seconds,
+    }
+    if arguments.output is None:
+        json.dump(result, sys.stdout, indent=2)
+        print()
+    else:
+        with open(arguments.output, "w") as file:
+            json.dump(result, file, indent=2)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,147 @@
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from typing import Iterator
+
+import numpy as np
+
+from .callbacks.base import Callback
+from .optimization import BaseOptimization, Maximization
+from .rng import Seed, spawn
+from .type import Individual
+
+
+class RunResult:
+    """
+    Outcome of one seeded run of a configuration. trace holds the best
+    fitness of every generation as (generation, best_fitness) pairs
+    """
+    def __init__(
+        self,
+        configuration: str,
+        run: int,
+        optimal_fitness: float,
+        optimal_individual: Individual,
+        number_of_generation: int,
+        number_of_evaluations: int,
+        elapsed_seconds: float,
+        trace: list[tuple[int, float]],
+    ) -> None:
+        self.configuration = configuration
+        self.run = run
+        self.optimal_fitness = optimal_fitness
+        self.optimal_individual = optimal_individual
+        self.number_of_generation = number_of_generation
+        self.number_of_evaluations = number_of_evaluations
+        self.elapsed_seconds = elapsed_seconds
+        self.trace = trace
+
+
+class ConvergenceTrace(Callback):
+    requires = frozenset({"best_fitness"})
+
+    def __init__(self) -> None:
+        self.trace: list[tuple[int, float]] = []
+
+    def on_generation_end(self, generation, best_fitness: float, best_individual: Individual, population: list[Individual]):
+        self.trace.append((generation, best_fitness))
+
+
+class BatchRunner:
+    """
+    Runs every configuration repeats times on a process pool and streams
+    the results back as the runs finish.
+
+    configurations maps a name to a picklable callable (a module level
+    function or a functools.partial) that builds the GeneticAlgorithm of
+    one run. Run i of every configuration is reseeded with the i-th stream
+    spawned from seed, so configurations are compared on the same seeds,
+    unless seeds gives the seed of every run. max_workers defaults to the
+    number of CPUs
+    """
+    def __init__(
+        self,
+        configurations: dict,
+        repeats: int = 30,
+        seed: Seed = None,
+        seeds: list[Seed] | None = None,
+        max_workers: int | None = None,
+        optimization: BaseOptimization = Maximization(),
+        mp_context=None,
+    ) -> None:
+        if seeds is None and repeats < 1:
+            raise ValueError("repeats must be at least 1")
+
+        self.configurations = configurations
+        self.seeds = spawn(seed, repeats) if seeds is None else list(seeds)
+        self.max_workers = max_workers
+        self.optimization = optimization
+        self.mp_context = mp_context
+
+        self.results: list[RunResult] = []
+
+    def run(self) -> Iterator[RunResult]:
+        """
+        Yield the result of every run as soon as it finishes. Runs that
+        have not started are cancelled when the iteration stops early
+        """
+        self.results = []
+        executor = ProcessPoolExecutor(max_workers=self.max_workers, mp_context=self.mp_context)
+        try:
+            futures = [
+                executor.submit(_run_once, name, factory, run, seed)
+                for name, factory in self.configurations.items()
+                for run, seed in enumerate(self.seeds)
+            ]
+            for future in as_completed(futures):
+                result = future.result()
+                self.results.append(result)
+                yield result
+        finally:
+            executor.shutdown(cancel_futures=True)
+
+    def run_all(self) -> list[RunResult]:
+        for _ in self.run():
+            pass
+        return self.results
+
+    def summary(self, quantiles: list[float] = [0.1, 0.25, 0.5, 0.75, 0.9]) -> dict[str, dict]:
+        """
+        Statistics of the final optimal fitness of the runs finished so far,
+        per configuration. Multi-objective runs end with a front, which has
+        no such statistics
+        """
+        fitness_by_configuration: dict[str, list[float]] = {}
+        for result in self.results:
+            if np.ndim(result.optimal_fitness) != 0:
+                raise TypeError(f"Run {result.run} of {result.configuration} ended with a Pareto front, summary only applies to single-objective runs")
+            fitness_by_configuration.setdefault(result.configuration, []).append(result.optimal_fitness)
+
+        summary = {}
+        for name, fitness in fitness_by_configuration.items():
+            fitness = np.asarray(fitness, dtype=np.float64)
+            summary[name] = {
+                "runs": len(fitness),
+                "best": float(fitness[self.optimization.best_index(fitness)]),
+                "mean": float(fitness.mean()),
+                "std": float(fitness.std()),
+                "quantiles": dict(zip(quantiles, np.quantile(fitness, quantiles).tolist())),
+            }
+        return summary
+
+
+def _run_once(configuration: str, factory, run: int, seed: np.random.SeedSequence) -> RunResult:
+    ga = factory()
+    recorder = ConvergenceTrace()
+    ga.callbacks = list(ga.callbacks) + [recorder]
+    ga.reseed(seed)
+    ga.run()
+
+    return RunResult(
+        configuration=configuration,
+        run=run,
+        optimal_fitness=ga.optimal_fitness,
+        optimal_individual=ga.optimal_individual,
+        number_of_generation=ga.number_of_generation,
+        number_of_evaluations=ga.number_of_evaluations,
+        elapsed_seconds=ga.elapsed_seconds,
+        trace=recorder.trace,
+    )
@@ -1,14 +1,47 @@
 from ..type import Individual
+from ..fitness_cache import CacheInfo
+
+# the hooks the engine dispatches, and the hook arguments a callback can ask for
+HOOKS = ["on_generation_start", "on_evaluation_end", "on_generation_end", "on_evolution_end"]
+CALLBACK_FIELDS = frozenset({"best_fitness", "best_individual", "population", "population_fitness", "cache_info"})
+
 
 class Callback:
     """
     Base class for callbacks
+
+    A callback can declare the hook arguments it reads in requires, the
+    others are then passed as None when no other callback needs them (the
+    generation is always passed). None means every argument. The hooks
+    other than on_evolution_end are only called in generations whose
+    on_generation_end generation is a multiple of every, so a callback gets
+    the start, evaluation and end of the same generations. A hook that is
+    not overridden is never called
     """
+    requires: frozenset[str] | None = None
+    every: int = 1
+
     def on_generation_start(self, generation, best_fitness: float, best_individual: Individual, population: list[Individual]):
         pass
 
+    def on_evaluation_end(self, generation, population_fitness: list[float], cache_info: CacheInfo | None):
+        pass
+
     def on_generation_end(self, generation, best_fitness: float, best_individual: Individual, population: list[Individual]):
         pass
 
+    def on_profile(self, generation, phase_nanoseconds: dict[str, int], number_of_evaluations: int, number_of_cache_hits: int):
+        """
+        Nanoseconds spent in each phase since the previous call, once after
+        initialization and once per generation. The engine only times its
+        phases when a callback overrides this hook
+        """
+        pass
+
     def on_evolution_end(self, generation, best_fitness: float, best_individual: Individual, population: list[Individual]):
         pass
+
+
+def overrides(callback, hook: str) -> bool:
+    method = getattr(type(callback), hook, None)
+    return method is not None and method is not getattr(Callback, hook)
@@ -1,7 +1,19 @@
 from .base import Callback
 
-def on_generation_end(fn):
+def on_generation_end(fn=None, every: int = 1):
+    """
+    Turn fn(generation, population, best_individual) into a callback,
+    used as @on_generation_end or @on_generation_end(every=10)
+    """
+    if fn is None:
+        return lambda fn: on_generation_end(fn, every)
+
     class FunctionalCallback(Callback):
-        def on_generation_end(self, generation, population, best_individual):
+        requires = frozenset({"population", "best_individual"})
+
+        def on_generation_end(self, generation, best_fitness, best_individual, population):
             fn(generation, population, best_individual)
-    return FunctionalCallback()
+
+    callback = FunctionalCallback()
+    callback.every = every
+    return callback
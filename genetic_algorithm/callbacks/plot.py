@@ -0,0 +1,39 @@
+from ..type import Individual
+from .base import Callback
+
+
+class PlotFitnessCallback(Callback):
+    """
+    Plots the best fitness of every generation when the evolution ends,
+    to path when it is given and in a window otherwise. matplotlib is only
+    imported then
+    """
+    requires = frozenset({"best_fitness"})
+
+    def __init__(self, path: str | None = None) -> None:
+        self.path = path
+        self.generations = []
+        self.best_fitnesses = []
+
+    def on_generation_end(self, generation, best_fitness: float, best_individual: Individual, population: list[Individual]):
+        self.generations.append(generation)
+        self.best_fitnesses.append(best_fitness)
+
+    def on_evolution_end(self, generation, best_fitness: float, best_individual: Individual, population: list[Individual]):
+        import matplotlib
+        if self.path is not None:
+            # no display needed to write a file
+            matplotlib.use("Agg")
+        import matplotlib.pyplot as plt
+
+        plt.figure(figsize=(10, 6))
+        plt.plot(self.generations, self.best_fitnesses, marker='o')
+        plt.title('Fitness vs Generation')
+        plt.xlabel('Generation')
+        plt.ylabel('Best Fitness')
+        plt.grid(True)
+        if self.path is None:
+            plt.show()
+        else:
+            plt.savefig(self.path)
+            plt.close()
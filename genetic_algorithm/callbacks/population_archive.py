@@ -0,0 +1,179 @@
+import json
+import os
+
+import numpy as np
+
+from ..chromosome_decoder import BaseChromosomeDecoder
+from ..fitness_cache import CacheInfo
+from ..type import Individual
+from .base import Callback
+
+INDEX_FILE = "index.json"
+ARCHIVE_VERSION = 1
+
+
+class PopulationArchive(Callback):
+    """
+    Archives the full population and fitness of every evaluated generation
+    to memory-mapped files in a directory, and their genotypes too when
+    chromosome_decoder is given (the population is encoded with it).
+
+    Every array is a raw file with one row per generation, preallocated for
+    capacity generations and doubled when it is full, next to a small JSON
+    index with the dtypes, row shapes and number of archived generations.
+    The index is replaced atomically after the rows are flushed, so a
+    reader never sees a partial generation. The directory is rewritten by
+    every run and the files are trimmed to their length on
+    on_evolution_end. Read it back with PopulationArchiveReader
+    """
+    requires = frozenset({"population", "population_fitness"})
+
+    def __init__(self, directory: str, chromosome_decoder: BaseChromosomeDecoder | None = None, capacity: int = 64) -> None:
+        if capacity < 1:
+            raise ValueError("capacity must be at least 1")
+
+        self.directory = directory
+        self.chromosome_decoder = chromosome_decoder
+        self.capacity = capacity
+
+        self.length = 0
+        self.__arrays: dict[str, np.memmap] = {}
+        self.__population = None
+
+    def on_generation_start(self, generation, best_fitness: float, best_individual: Individual, population: list[Individual]):
+        self.__population = population
+
+    def on_evaluation_end(self, generation, population_fitness: list[float], cache_info: CacheInfo | None):
+        population = np.asarray(self.__population, dtype=np.float64)
+        rows = {
+            "generation": np.int64(generation),
+            "population": population,
+            "fitness": np.asarray(population_fitness, dtype=np.float64),
+        }
+        if self.chromosome_decoder is not None:
+            rows["genotypes"] = np.asarray(self.chromosome_decoder.encode_batch(population))
+        self.append(rows)
+
+    def on_evolution_end(self, generation, best_fitness: float, best_individual: Individual, population: list[Individual]):
+        self.close()
+
+    def append(self, rows: dict[str, np.ndarray]):
+        """
+        Write one generation, a row for each array
+        """
+        if not self.__arrays:
+            self.__create(rows)
+        for name, row in rows.items():
+            if np.shape(row) != self.__arrays[name].shape[1:]:
+                raise ValueError(f"{name} of shape {np.shape(row)} does not match the archived shape {self.__arrays[name].shape[1:]}")
+
+        if self.length == len(self.__arrays["generation"]):
+            self.__resize(2 * self.length)
+        for name, row in rows.items():
+            self.__arrays[name][self.length] = row
+        self.length += 1
+
+        for array in self.__arrays.values():
+            array.flush()
+        self.__write_index(complete=False)
+
+    def close(self):
+        """
+        Trim the files to the archived generations and mark the archive complete
+        """
+        if not self.__arrays:
+            return
+        self.__resize(self.length)
+        self.__write_index(complete=True)
+        self.__arrays = {}
+
+    def __create(self, rows: dict[str, np.ndarray]):
+        os.makedirs(self.directory, exist_ok=True)
+        self.length = 0
+        for name, row in rows.items():
+            row = np.asarray(row)
+            self.__arrays[name] = np.memmap(self.__path(name), dtype=row.dtype, mode="w+", shape=(self.capacity, *row.shape))
+
+    def __resize(self, capacity: int):
+        for name in list(self.__arrays):
+            array = self.__arrays[name]
+            dtype, row_shape = array.dtype, array.shape[1:]
+            array.flush()
+            # unmap the file before changing its size
+            self.__arrays[name] = array = None
+
+            with open(self.__path(name), "r+b") as file:
+                file.truncate(capacity * int(np.prod(row_shape, dtype=np.int64)) * dtype.itemsize)
+            # memmap cannot map an empty file
+            self.__arrays[name] = np.memmap(self.__path(name), dtype=dtype, mode="r+", shape=(capacity, *row_shape)) if capacity else np.empty((0, *row_shape), dtype=dtype)
+
+    def __write_index(self, complete: bool):
+        index = {
+            "version": ARCHIVE_VERSION,
+            "length": self.length,
+            "complete": complete,
+            "arrays": {name: {"dtype": array.dtype.str, "shape": list(array.shape[1:])} for name, array in self.__arrays.items()},
+        }
+        temporary_path = os.path.join(self.directory, f".{INDEX_FILE}.tmp")
+        with open(temporary_path, "w") as file:
+            json.dump(index, file)
+        os.replace(temporary_path, os.path.join(self.directory, INDEX_FILE))
+
+    def __path(self, name: str) -> str:
+        return os.path.join(self.directory, f"{name}.dat")
+
+
+class PopulationArchiveReader:
+    """
+    Lazy view of a PopulationArchive directory. population, fitness,
+    genotypes and generation are read-only memory maps with one row per
+    archived generation, slicing them only reads the rows asked for.
+    While the run is going on, refresh() picks up the new generations
+    """
+    def __init__(self, directory: str) -> None:
+        self.directory = directory
+        self.refresh()
+
+    def refresh(self):
+        with open(os.path.join(self.directory, INDEX_FILE)) as file:
+            index = json.load(file)
+        if index["version"] != ARCHIVE_VERSION:
+            raise ValueError(f"Unsupported archive version {index['version']}")
+
+        self.length: int = index["length"]
+        self.complete: bool = index["complete"]
+        self.__arrays = {}
+        for name, spec in index["arrays"].items():
+            shape = (self.length, *spec["shape"])
+            if self.length == 0:
+                self.__arrays[name] = np.empty(shape, dtype=spec["dtype"])
+            else:
+                self.__arrays[name] = np.memmap(os.path.join(self.directory, f"{name}.dat"), dtype=spec["dtype"], mode="r", shape=shape)
+
+    def __len__(self) -> int:
+        return self.length
+
+    @property
+    def generation(self) -> np.ndarray:
+        return self.__arrays["generation"]
+
+    @property
+    def population(self) -> np.ndarray:
+        return self.__arrays["population"]
+
+    @property
+    def fitness(self) -> np.ndarray:
+        return self.__arrays["fitness"]
+
+    @property
+    def genotypes(self) -> np.ndarray | None:
+        return self.__arrays.get("genotypes")
+
+    def row(self, generation: int) -> int:
+        """
+        Row of a generation number
+        """
+        rows = np.flatnonzero(self.generation == generation)
+        if len(rows) == 0:
+            raise KeyError(generation)
+        return int(rows[-1])
@@ -1,8 +1,13 @@
 from .base import Callback
 
 class PrintBestFitness(Callback):
-    def on_generation_end(self, generation, population, best_fitness, best_individual):
+    requires = frozenset({"best_fitness"})
+
+    def __init__(self, every: int = 1) -> None:
+        self.every = every
+
+    def on_generation_end(self, generation, best_fitness, best_individual, population):
         print(f"Generation {generation}: Best Fitness = {best_fitness}")
 
-    def on_evolution_end(self, best_fitness, best_individual):
+    def on_evolution_end(self, generation, best_fitness, best_individual, population):
         print(f"Best Fitness = {best_fitness}")
@@ -0,0 +1,93 @@
+import numpy as np
+
+from .base import Callback
+
+PHASES = ["initialization", "evaluation", "selection", "encoding", "crossover", "mutation", "decoding", "callbacks"]
+
+
+class ProfilingCallback(Callback):
+    """
+    Collects the time the engine spends in each phase of every generation.
+    summary() and histogram() describe the current run; when a run ends its
+    summary is appended to runs and the samples start over, so one instance
+    can profile several runs
+    """
+    requires = frozenset()
+
+    def __init__(self, verbose: bool = False) -> None:
+        self.verbose = verbose
+        self.runs: list[dict] = []
+        self.reset()
+
+    def reset(self):
+        # nanoseconds per phase, one sample per call of on_profile
+        self.samples: dict[str, list[int]] = {}
+        self.number_of_generation = 0
+        self.number_of_evaluations = 0
+        self.number_of_cache_hits = 0
+
+    def on_profile(self, generation, phase_nanoseconds: dict[str, int], number_of_evaluations: int, number_of_cache_hits: int):
+        for phase, nanoseconds in phase_nanoseconds.items():
+            self.samples.setdefault(phase, []).append(nanoseconds)
+        self.number_of_generation = generation
+        self.number_of_evaluations = number_of_evaluations
+        self.number_of_cache_hits = number_of_cache_hits
+
+    def on_evolution_end(self, generation, best_fitness, best_individual, population):
+        summary = self.summary()
+        if self.verbose:
+            print(self.report(summary))
+        self.runs.append(summary)
+        self.reset()
+
+    def summary(self) -> dict:
+        """
+        Total, mean, percentiles and share of the profiled time per phase,
+        in nanoseconds, with the evaluation counters
+        """
+        totals = {phase: int(np.sum(samples)) for phase, samples in self.samples.items()}
+        overall = sum(totals.values())
+
+        phases = {}
+        for phase in sorted(self.samples, key=self.__phase_order):
+            samples = np.asarray(self.samples[phase], dtype=np.int64)
+            p50, p90, p99 = np.percentile(samples, [50, 90, 99])
+            phases[phase] = {
+                "count": len(samples),
+                "total_ns": totals[phase],
+                "mean_ns": float(samples.mean()),
+                "min_ns": int(samples.min()),
+                "p50_ns": float(p50),
+                "p90_ns": float(p90),
+                "p99_ns": float(p99),
+                "max_ns": int(samples.max()),
+                "share": totals[phase] / overall if overall else 0.0,
+            }
+
+        return {
+            "generations": self.number_of_generation,
+            "objective_calls": self.number_of_evaluations,
+            "cache_hits": self.number_of_cache_hits,
+            "total_ns": overall,
+            "phases": phases,
+        }
+
+    def histogram(self, phase: str, bins: int = 10) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Counts and bin edges, in nanoseconds, of the per-generation time of phase
+        """
+        return np.histogram(np.asarray(self.samples.get(phase, []), dtype=np.int64), bins=bins)
+
+    @staticmethod
+    def report(summary: dict) -> str:
+        lines = [
+            f"Generations: {summary['generations']}, objective calls: {summary['objective_calls']}, cache hits: {summary['cache_hits']}",
+            f"{'phase':<16}{'total ms':>12}{'mean us':>12}{'p90 us':>12}{'share':>8}",
+        ]
+        for phase, stats in summary["phases"].items():
+            lines.append(f"{phase:<16}{stats['total_ns'] / 1e6:>12.3f}{stats['mean_ns'] / 1e3:>12.1f}{stats['p90_ns'] / 1e3:>12.1f}{stats['share']:>8.1%}")
+        return "\n".join(lines)
+
+    @staticmethod
+    def __phase_order(phase: str) -> int:
+        return PHASES.index(phase) if phase in PHASES else len(PHASES)
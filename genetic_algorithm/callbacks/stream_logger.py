@@ -0,0 +1,166 @@
+from queue import Full, Queue
+from threading import Thread
+import csv
+import json
+import struct
+
+import numpy as np
+
+from ..type import Individual
+from ..fitness_cache import CacheInfo
+from .base import Callback
+
+FORMATS = ["jsonl", "csv", "binary"]
+
+# file signature and version of the binary format
+BINARY_MAGIC = b"GALOG\x00\x00\x01"
+
+
+class StreamingLogger(Callback):
+    """
+    Streams one record per generation to a JSONL, CSV or binary file: the
+    generation, the best and mean fitness of the evaluated population, its
+    diversity (mean standard deviation of the decision variables) and
+    optionally the best individual.
+
+    Records go through a bounded queue to a background thread that does
+    the file I/O, so memory stays constant however long the run is. When
+    the queue is full the record is dropped and counted in dropped, unless
+    block is set. The file is rewritten by every run and flushed and closed
+    on on_evolution_end.
+
+    The binary file is a signature, a little-endian uint32 with the length
+    of the best individual (0 when it is not logged) and then packed
+    records, see read_binary_log
+    """
+    def __init__(self, path: str, format: str = "jsonl", log_best_individual: bool = False, queue_size: int = 1024, block: bool = False) -> None:
+        if format not in FORMATS:
+            raise ValueError(f"format must be one of {', '.join(FORMATS)}")
+
+        self.path = path
+        self.format = format
+        self.log_best_individual = log_best_individual
+        self.requires = frozenset({"best_fitness", "population", "population_fitness"} | ({"best_individual"} if log_best_individual else set()))
+        self.block = block
+        self.dropped = 0
+
+        self.__queue: Queue = Queue(maxsize=queue_size)
+        self.__writer: Thread | None = None
+        self.__error: BaseException | None = None
+        self.__generation = None
+        self.__mean_fitness = None
+        self.__diversity = None
+
+    def on_generation_start(self, generation, best_fitness: float, best_individual: Individual, population: list[Individual]):
+        self.__diversity = diversity(population)
+
+    def on_evaluation_end(self, generation, population_fitness: list[float], cache_info: CacheInfo | None):
+        self.__generation = generation
+        self.__mean_fitness = float(np.mean(population_fitness))
+
+    def on_generation_end(self, generation, best_fitness: float, best_individual: Individual, population: list[Individual]):
+        # best_fitness and best_individual belong to the generation that was just evaluated
+        record = (self.__generation, float(best_fitness), self.__mean_fitness, self.__diversity)
+        if self.log_best_individual:
+            record += (np.asarray(best_individual, dtype=np.float64).tolist(),)
+        self.__put(record)
+
+    def on_evolution_end(self, generation, best_fitness: float, best_individual: Individual, population: list[Individual]):
+        self.close()
+
+    def close(self):
+        """
+        Write out the queued records and close the file
+        """
+        if self.__writer is not None:
+            self.__queue.put(None)
+            self.__writer.join()
+            self.__writer = None
+
+        if self.__error is not None:
+            error, self.__error = self.__error, None
+            raise error
+
+    def __put(self, record: tuple):
+        if self.__writer is None:
+            self.__writer = Thread(target=self.__write, daemon=True)
+            self.__writer.start()
+
+        if self.block:
+            self.__queue.put(record)
+            return
+        try:
+            self.__queue.put_nowait(record)
+        except Full:
+            self.dropped += 1
+
+    def __write(self):
+        try:
+            file = open(self.path, "wb") if self.format == "binary" else open(self.path, "w", newline="")
+            with file:
+                write = self.__record_writer(file)
+                while True:
+                    record = self.__queue.get()
+                    if record is None:
+                        return
+                    write(record)
+                    if self.__queue.empty():
+                        file.flush()
+        except BaseException as error:
+            self.__error = error
+            # keep consuming so that a blocked generation loop and close() do not hang
+            while self.__queue.get() is not None:
+                pass
+
+    def __record_writer(self, file):
+        if self.format == "jsonl":
+            def write(record):
+                fields = dict(zip(["generation", "best_fitness", "mean_fitness", "diversity", "best_individual"], record))
+                file.write(json.dumps(fields) + "\n")
+            return write
+
+        if self.format == "csv":
+            writer = csv.writer(file)
+            writer.writerow(["generation", "best_fitness", "mean_fitness", "diversity"] + (["best_individual"] if self.log_best_individual else []))
+
+            def write(record):
+                if self.log_best_individual:
+                    record = record[:4] + (json.dumps(record[4]),)
+                writer.writerow(record)
+            return write
+
+        header_written = False
+
+        def write(record):
+            # the length of the best individual is only known from the first record
+            nonlocal header_written
+            individual = record[4] if self.log_best_individual else []
+            if not header_written:
+                file.write(BINARY_MAGIC + struct.pack("<I", len(individual)))
+                header_written = True
+            file.write(struct.pack(f"<qddd{len(individual)}d", *record[:4], *individual))
+        return write
+
+
+def diversity(population: list[Individual] | np.ndarray) -> float:
+    """
+    Mean over the decision variables of their standard deviation in the population
+    """
+    return float(np.std(np.asarray(population, dtype=np.float64), axis=0).mean())
+
+
+def read_binary_log(path: str) -> np.ndarray:
+    """
+    The records of a binary StreamingLogger file as a structured array with
+    generation, best_fitness, mean_fitness, diversity and, when it was
+    logged, best_individual fields
+    """
+    with open(path, "rb") as file:
+        if file.read(len(BINARY_MAGIC)) != BINARY_MAGIC:
+            raise ValueError(f"{path} is not a binary StreamingLogger file")
+        (length,) = struct.unpack("<I", file.read(4))
+
+        fields = [("generation", "<i8"), ("best_fitness", "<f8"), ("mean_fitness", "<f8"), ("diversity", "<f8")]
+        if length:
+            fields.append(("best_individual", "<f8", (length,)))
+        return np.fromfile(file, dtype=np.dtype(fields))
@@ -0,0 +1,23 @@
+from ..type import Individual
+from .base import Callback
+
+
+class TabulateCallback(Callback):
+    """
+    Prints a table of the best individual and fitness of every generation
+    when the evolution ends. prettytable is only imported when the callback
+    is created
+    """
+    requires = frozenset({"best_fitness", "best_individual"})
+
+    def __init__(self) -> None:
+        from prettytable import PrettyTable
+
+        self.table = PrettyTable()
+        self.table.field_names = ["Generation", "Best Individual", "Best fitness"]
+
+    def on_generation_end(self, generation, best_fitness: float, best_individual: Individual, population: list[Individual]):
+        self.table.add_row([generation, best_individual, best_fitness])
+
+    def on_evolution_end(self, generation, best_fitness: float, best_individual: Individual, population: list[Individual]):
+        print(self.table)
@@ -0,0 +1,130 @@
+from queue import Empty, Full, Queue
+from threading import Thread
+import json
+import os
+import time
+
+import numpy as np
+
+
+def save_checkpoint(path: str, state: dict):
+    """
+    Atomically write a state dictionary to an .npz file. Arrays are stored
+    as npz entries and everything else as JSON, so no pickle is involved
+    """
+    arrays: dict[str, np.ndarray] = {}
+    meta = _to_json(state, arrays)
+
+    directory = os.path.dirname(os.path.abspath(path))
+    temporary_path = os.path.join(directory, f".{os.path.basename(path)}.tmp")
+    with open(temporary_path, "wb") as f:
+        np.savez(f, __meta__=np.array(json.dumps(meta)), **arrays)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(temporary_path, path)
+
+
+def load_checkpoint(path: str) -> dict:
+    with np.load(path, allow_pickle=False) as checkpoint:
+        arrays = {name: checkpoint[name] for name in checkpoint.files}
+    return _from_json(json.loads(str(arrays.pop("__meta__"))), arrays)
+
+
+class Checkpointer:
+    """
+    Saves the state of a GeneticAlgorithm every every_n_generations
+    generations and/or every every_seconds seconds, and once more when the
+    evolution ends. The state is snapshotted on the generation loop and
+    written by a background thread; if a write is still in progress the
+    pending snapshot is replaced by the newer one. A failed write is raised
+    by the next save() or close()
+    """
+    def __init__(self, path: str, every_n_generations: int | None = None, every_seconds: float | None = None) -> None:
+        self.path = path
+        self.every_n_generations = every_n_generations
+        self.every_seconds = every_seconds
+
+        self.__queue: Queue = Queue(maxsize=1)
+        self.__writer: Thread | None = None
+        self.__error: BaseException | None = None
+        self.__last_save = time.monotonic()
+
+    def on_generation_end(self, ga):
+        due = self.every_n_generations is not None and ga.number_of_generation % self.every_n_generations == 0
+        due = due or (self.every_seconds is not None and time.monotonic() - self.__last_save >= self.every_seconds)
+        if due:
+            self.save(ga)
+
+    def save(self, ga):
+        if self.__error is not None:
+            self.close()
+        self.__last_save = time.monotonic()
+        self.__start_writer()
+
+        snapshot = ga.get_state()
+        while True:
+            try:
+                self.__queue.put_nowait(snapshot)
+                return
+            except Full:
+                # drop the stale snapshot that has not been written yet
+                try:
+                    self.__queue.get_nowait()
+                except Empty:
+                    pass
+
+    def close(self):
+        """
+        Wait for the pending write to finish
+        """
+        if self.__writer is not None:
+            # the writer keeps taking snapshots even after a failed write
+            self.__queue.put(None)
+            self.__writer.join()
+            self.__writer = None
+
+        if self.__error is not None:
+            error, self.__error = self.__error, None
+            raise error
+
+    def __start_writer(self):
+        if self.__writer is None:
+            self.__writer = Thread(target=self.__write, daemon=True)
+            self.__writer.start()
+
+    def __write(self):
+        try:
+            while True:
+                snapshot = self.__queue.get()
+                if snapshot is None:
+                    return
+                save_checkpoint(self.path, snapshot)
+        except BaseException as error:
+            self.__error = error
+            # keep consuming so that close() does not hang
+            while self.__queue.get() is not None:
+                pass
+
+
+def _to_json(value, arrays: dict[str, np.ndarray]):
+    if isinstance(value, np.ndarray):
+        name = f"array_{len(arrays)}"
+        arrays[name] = value
+        return {"__array__": name}
+    if isinstance(value, dict):
+        return {key: _to_json(item, arrays) for key, item in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [_to_json(item, arrays) for item in value]
+    if isinstance(value, np.generic):
+        return value.item()
+    return value
+
+
+def _from_json(value, arrays: dict[str, np.ndarray]):
+    if isinstance(value, dict):
+        if set(value) == {"__array__"}:
+            return arrays[value["__array__"]]
+        return {key: _from_json(item, arrays) for key, item in value.items()}
+    if isinstance(value, list):
+        return [_from_json(item, arrays) for item in value]
+    return value
@@ -1,6 +1,8 @@
 from .type import Chromosome, Individual
 import random
 
+import numpy as np
+
 class BaseChromosomeDecoder():
     def __init__(
         self,
@@ -26,8 +28,48 @@ class BaseChromosomeDecoder():
         """
         raise NotImplementedError()
 
+    def encode_batch(self, population: np.ndarray) -> np.ndarray:
+        """
+        Encode a (population_size, number_of_decision_variables) array into
+        an array of chromosomes, one row per individual
+        """
+        return np.asarray([self.encode(individual) for individual in np.asarray(population, dtype=np.float64).tolist()])
+
+    def decode_batch(self, genotypes: np.ndarray) -> np.ndarray:
+        """
+        Decode an array of chromosomes into a
+        (population_size, number_of_decision_variables) float64 array
+        """
+        return np.asarray([self.decode(chromosome) for chromosome in np.asarray(genotypes).tolist()], dtype=np.float64)
+
 
 class BinaryChromosomeDecoder(BaseChromosomeDecoder):
+    """
+    Genes are fixed-width, most significant bit first, binary numbers.
+
+    The batch methods work on (population_size, number_of_decision_variables,
+    number_of_bytes) uint8 bit arrays, or on the packed form where each gene
+    is a single uint64 code of shape (population_size, number_of_decision_variables)
+    """
+    def __init__(
+        self,
+        number_of_bytes: int,
+        number_of_decision_variables: int,
+        lower_bounds: list[float],
+        upper_bounds: list[float],
+    ) -> None:
+        super().__init__(
+            number_of_bytes=number_of_bytes,
+            number_of_decision_variables=number_of_decision_variables,
+            lower_bounds=lower_bounds,
+            upper_bounds=upper_bounds
+        )
+        # Precomputed factors shared by every encode/decode
+        self.levels = 2**number_of_bytes - 1
+        self.shifts = tuple(range(number_of_bytes - 1, -1, -1))
+        self.offsets = np.asarray(lower_bounds, dtype=np.float64)
+        self.scales = np.asarray(upper_bounds, dtype=np.float64) - self.offsets
+
     def encode(self, value: Individual) -> Chromosome:
         chromosome = []
         
@@ -39,20 +81,11 @@ class BinaryChromosomeDecoder(BaseChromosomeDecoder):
                 raise ValueError(f"encode: value[{i}] is not within the boundary [{self.lower_bounds[i]}, {self.upper_bounds[i]}]")
 
             fraction = (x_i - self.lower_bounds[i]) / (self.upper_bounds[i] - self.lower_bounds[i])
-            denary = 0 + (2**self.number_of_bytes - 1) * fraction
-
-            # convert denary to binary
-            binary = []
-            while denary > 0:
-                denary, remainder = divmod(denary, 2)
-                binary.append(int(remainder))
-            
-            # pad with zero to make binary exactly number_of_bytes long
-            while len(binary) < self.number_of_bytes:
-                binary.append(0)
-            
-            binary.reverse()
-            chromosome.append(binary)
+            # the nearest code, so that a decoded value encodes back to its
+            # chromosome instead of drifting down one code at a time
+            denary = round(self.levels * fraction)
+
+            chromosome.append([(denary >> shift) & 1 for shift in self.shifts])
 
         return chromosome
     
@@ -61,15 +94,67 @@ class BinaryChromosomeDecoder(BaseChromosomeDecoder):
 
         x = []
         for i, gene in enumerate(chromosome):
-            denary = sum([g * 2**j for j, g in enumerate(reversed(gene))])
-            fraction = denary / (2**self.number_of_bytes - 1)
+            denary = int("".join(map(str, gene)), 2)
+            fraction = denary / self.levels
             x_i = self.lower_bounds[i] + (self.upper_bounds[i] - self.lower_bounds[i]) * fraction
             x.append(x_i)
         
         return x
 
+    def encode_batch(self, population: np.ndarray, packed: bool = False) -> np.ndarray:
+        self.__check_packable()
+        values = np.asarray(population, dtype=np.float64)
+
+        if values.ndim != 2 or values.shape[1] != self.number_of_decision_variables:
+            raise ValueError(f"encode_batch: population must have shape (n, {self.number_of_decision_variables}), got {values.shape}")
+
+        outside = (values < self.offsets) | (values > np.asarray(self.upper_bounds, dtype=np.float64))
+        if outside.any():
+            n, i = np.argwhere(outside)[0]
+            raise ValueError(f"encode_batch: population[{n}][{i}] is not within the boundary [{self.lower_bounds[i]}, {self.upper_bounds[i]}]")
+
+        # rint rounds half to even like round()
+        codes = np.rint(self.levels * ((values - self.offsets) / self.scales)).astype(np.uint64)
+        return codes if packed else self.unpack(codes)
+
+    def decode_batch(self, genotypes: np.ndarray) -> np.ndarray:
+        genotypes = np.asarray(genotypes)
+        codes = genotypes if genotypes.dtype == np.uint64 else self.pack(genotypes)
+        return self.offsets + self.scales * (codes / self.levels)
+
+    def pack(self, genotypes: np.ndarray) -> np.ndarray:
+        """
+        Pack a (..., number_of_bytes) bit array into uint64 gene codes
+        """
+        self.__check_packable()
+        weights = np.left_shift(np.uint64(1), np.asarray(self.shifts, dtype=np.uint64))
+        return np.asarray(genotypes, dtype=np.uint64) @ weights
+
+    def unpack(self, codes: np.ndarray) -> np.ndarray:
+        """
+        Unpack uint64 gene codes into a (..., number_of_bytes) uint8 bit array
+        """
+        shifts = np.asarray(self.shifts, dtype=np.uint64)
+        return ((np.asarray(codes, dtype=np.uint64)[..., None] >> shifts) & np.uint64(1)).astype(np.uint8)
+
+    def __check_packable(self):
+        if self.number_of_bytes > 64:
+            raise ValueError(f"Batch encoding supports at most 64 bits per variable, got {self.number_of_bytes}")
+
 
 class DenaryChromosomeDecoder(BaseChromosomeDecoder):
+    """
+    Genes are a sign digit (1 for negative) followed by digit_bytes decimal
+    digits, most significant first, of the value scaled by 10**dp.
+
+    The batch methods work on (population_size, number_of_decision_variables,
+    digit_bytes + 1) uint8 digit arrays with the sign in column 0, and give
+    exactly the same values as encode and decode
+    """
+    # float64 holds every integer up to 2**53, so magnitudes of up to 15
+    # digits convert and divide exactly as Python ints do
+    MAX_BATCH_DIGITS = 15
+
     def __init__(
         self,
         number_of_bytes: int,
@@ -89,6 +174,11 @@ class DenaryChromosomeDecoder(BaseChromosomeDecoder):
         self.digit_bytes = number_of_bytes
         self.number_of_bytes = number_of_bytes + 1  # Including sign
 
+        # Precomputed factors shared by every encode/decode
+        self.powers = tuple(10**j for j in range(self.digit_bytes - 1, -1, -1))
+        self.denominator = 10**dp
+        self.capacity = 10**self.digit_bytes
+
     def encode(self, value: Individual) -> Chromosome:
         chromosome: Chromosome = []
 
@@ -108,25 +198,87 @@ class DenaryChromosomeDecoder(BaseChromosomeDecoder):
         x = []
         for i, gene in enumerate(chromosome):
             sign = -1 if gene[0] == 1 else 1
-            magnitude = sum([g * 10**j for j, g in enumerate(reversed(gene[1:]))])
-            x_i = sign * magnitude / 10**self.dp
+            magnitude = sum([g * power for g, power in zip(gene[1:], self.powers)])
+            x_i = sign * magnitude / self.denominator
             x_i = min(max(x_i, self.lower_bounds[i]), self.upper_bounds[i])
             x.append(x_i)
         return x
 
+    def encode_batch(self, population: np.ndarray) -> np.ndarray:
+        if self.digit_bytes > self.MAX_BATCH_DIGITS:
+            return super().encode_batch(population).astype(np.uint8)
+
+        values = np.asarray(population, dtype=np.float64)
+        if values.ndim != 2 or values.shape[1] != self.number_of_decision_variables:
+            raise ValueError(f"encode_batch: population must have shape (n, {self.number_of_decision_variables}), got {values.shape}")
+
+        outside = (values < np.asarray(self.lower_bounds, dtype=np.float64)) | (values > np.asarray(self.upper_bounds, dtype=np.float64))
+        if outside.any():
+            n, i = np.argwhere(outside)[0]
+            raise ValueError(f"encode_batch: population[{n}][{i}] = {values[n, i]} is out of bounds [{self.lower_bounds[i]}, {self.upper_bounds[i]}]")
+
+        # rint rounds half to even like round()
+        scaled = np.rint(np.abs(values) * float(self.denominator))
+        assert (scaled < self.capacity).all(), f"population exceeds digit capacity for {self.digit_bytes} bytes"
+
+        genotypes = np.empty(values.shape + (self.number_of_bytes,), dtype=np.uint8)
+        genotypes[..., 0] = values < 0
+        genotypes[..., 1:] = (scaled.astype(np.int64)[..., None] // np.asarray(self.powers, dtype=np.int64)) % 10
+        return genotypes
+
+    def decode_batch(self, genotypes: np.ndarray) -> np.ndarray:
+        if self.digit_bytes > self.MAX_BATCH_DIGITS:
+            return super().decode_batch(genotypes)
+
+        genotypes = np.asarray(genotypes)
+        magnitude = genotypes[..., 1:].astype(np.int64) @ np.asarray(self.powers, dtype=np.int64)
+        # negate the integers, not the floats, so that a zero magnitude stays 0.0 and not -0.0
+        signed = np.where(genotypes[..., 0] == 1, -magnitude, magnitude)
+        return np.clip(signed / float(self.denominator), np.asarray(self.lower_bounds, dtype=np.float64), np.asarray(self.upper_bounds, dtype=np.float64))
+
     def __float_to_gene(self, value: float) -> list[int]:
         sign = 0 if value >= 0 else 1
         value = abs(value)
-        scaled = int(round(value * 10**self.dp))
+        scaled = int(round(value * self.denominator))
 
-        max_digits = 10**self.digit_bytes
-        assert scaled < max_digits, f"{value} exceeds digit capacity for {self.digit_bytes} bytes"
+        assert scaled < self.capacity, f"{value} exceeds digit capacity for {self.digit_bytes} bytes"
 
         gene = [sign]
-        divisor = 10**(self.digit_bytes - 1)
-        for _ in range(self.digit_bytes):
-            gene.append(scaled // divisor)
-            scaled %= divisor
-            divisor //= 10
+        for power in self.powers:
+            gene.append(scaled // power)
+            scaled %= power
 
         return gene
+
+
+class IdentityChromosomeDecoder(BaseChromosomeDecoder):
+    """
+    The chromosome is the individual itself, for real-coded operators.
+    Nothing is quantized and batch encoding and decoding do not copy
+    """
+    def __init__(
+        self,
+        number_of_decision_variables: int,
+        lower_bounds: list[float],
+        upper_bounds: list[float],
+    ) -> None:
+        super().__init__(
+            number_of_bytes=0,
+            number_of_decision_variables=number_of_decision_variables,
+            lower_bounds=lower_bounds,
+            upper_bounds=upper_bounds
+        )
+
+    def encode(self, value: Individual) -> Individual:
+        if len(value) != self.number_of_decision_variables:
+            raise ValueError(f"encode: value must be an array of {self.number_of_decision_variables} length")
+        return list(value)
+
+    def decode(self, chromosome: Individual) -> Individual:
+        return list(chromosome)
+
+    def encode_batch(self, population: np.ndarray) -> np.ndarray:
+        return np.asarray(population, dtype=np.float64)
+
+    def decode_batch(self, genotypes: np.ndarray) -> np.ndarray:
+        return np.asarray(genotypes, dtype=np.float64)
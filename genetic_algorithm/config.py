@@ -0,0 +1,99 @@
+"""
+Builds a run from a configuration dictionary, read from a TOML or JSON file.
+
+The keys are the arguments of the algorithm (GeneticAlgorithm unless
+algorithm names another one). objective_function is a "module:function"
+path. Components (chromosome_decoder, termination, optimization, selection,
+crossover, mutation, evaluator, fitness_cache, checkpointer, surrogate and
+every entry of callbacks) are specified as a registered name, a
+"module:attribute" path, true for the default of their kind, or a table
+with the type and the keyword arguments, plus args for positional ones:
+
+    population_size = 100
+    objective_function = "problems:f"
+    optimization = "maximization"
+    chromosome_decoder = { type = "binary", number_of_bytes = 6, number_of_decision_variables = 2, lower_bounds = [2, -1], upper_bounds = [6, 4] }
+    crossover = { type = "single_point", crossover_probability = 0.85 }
+
+    [termination]
+    type = "or"
+    args = [{ type = "number_of_generation", max_number_of_generation = 100 }, { type = "threshold_difference", threshold = 0.05 }]
+"""
+import json
+
+from .registry import import_object, resolve
+
+# arguments of the algorithm that are components, with their registry kind
+COMPONENTS = {
+    "chromosome_decoder": "decoder",
+    "termination": "termination",
+    "selection": "selection",
+    "crossover": "crossover",
+    "mutation": "mutation",
+    "evaluator": "evaluator",
+    "fitness_cache": "fitness_cache",
+    "checkpointer": "checkpointer",
+    "surrogate": "surrogate",
+}
+
+# keyword arguments of components that are components themselves
+NESTED_COMPONENTS = {
+    "optimization": "optimization",
+    "optimizations": "optimization",
+    "chromosome_decoder": "decoder",
+    "model": "surrogate_model",
+}
+
+
+def load_config(path: str) -> dict:
+    if path.endswith(".toml"):
+        import tomllib
+        with open(path, "rb") as file:
+            return tomllib.load(file)
+    if path.endswith(".json"):
+        with open(path) as file:
+            return json.load(file)
+    raise ValueError(f"{path} is neither a .toml nor a .json file")
+
+
+def build_component(kind: str, spec):
+    """
+    The component a specification describes
+    """
+    if spec is True:
+        spec = {}
+    elif isinstance(spec, str):
+        spec = {"type": spec}
+    spec = dict(spec)
+
+    factory = resolve(kind, spec.pop("type", "default"))
+    args = [build_component(kind, value) if isinstance(value, dict) else value for value in spec.pop("args", [])]
+    kwargs = {name: _keyword_argument(name, value) for name, value in spec.items()}
+    return factory(*args, **kwargs)
+
+
+def _keyword_argument(name: str, value):
+    kind = NESTED_COMPONENTS.get(name)
+    if kind is None:
+        return value
+    if isinstance(value, list):
+        return [build_component(kind, item) for item in value]
+    return build_component(kind, value)
+
+
+def build(config: dict):
+    """
+    The algorithm a configuration describes, ready to run
+    """
+    settings = dict(config)
+    algorithm = resolve("algorithm", settings.pop("algorithm", "genetic_algorithm"))
+    settings["objective_function"] = import_object(settings["objective_function"])
+
+    if "optimization" in settings:
+        settings["optimization"] = build_component("optimization", settings["optimization"])
+    for name, kind in COMPONENTS.items():
+        if name in settings:
+            settings[name] = build_component(kind, settings[name])
+    settings["callbacks"] = [build_component("callback", spec) for spec in settings.get("callbacks", [])]
+
+    return algorithm(**settings)
@@ -1,23 +1,37 @@
-from .type import Chromosome
-import random
+from .type import Chromosome, Individual
+from .rng import Seed
+import numpy as np
 
 class BaseCrossover:
-    def __init__(self, crossover_probability: float) -> None:
+    """
+    Operators may also implement cross_batch(parents_a, parents_b), which
+    crosses every pair of rows of two genotype arrays at once and returns
+    the two arrays of children. The engine uses it whenever it is there
+    """
+    def __init__(self, crossover_probability: float, seed: Seed = None) -> None:
         self.crossover_probability = crossover_probability
+        self.rng = np.random.default_rng(seed)
     
     def cross(self, parent1: Chromosome, parent2: Chromosome) -> tuple[Chromosome, Chromosome]:
         raise NotImplementedError()
 
+    def _swap_masked(self, parents_a: np.ndarray, parents_b: np.ndarray, swap: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+        return np.where(swap, parents_b, parents_a), np.where(swap, parents_a, parents_b)
+
 
 class SinglePointCrossover(BaseCrossover):
     def cross(self, parent1: Chromosome, parent2: Chromosome) -> tuple[Chromosome, Chromosome]:
         assert len(parent1) == len(parent2), "Parents must have the same number of decision variables"
 
+        # one draw for every gene of the pair
+        crosses = self.rng.random(len(parent1)) < self.crossover_probability
+        crossover_points = self.rng.integers(1, len(parent1[0]), size=len(parent1)) if crosses.any() else None
+
         child1, child2 = [], []
-        for gene1, gene2 in zip(parent1, parent2):
+        for i, (gene1, gene2) in enumerate(zip(parent1, parent2)):
             assert len(gene1) == len(gene2), "Genes must have the same size"
-            if random.random() < self.crossover_probability:
-                crossover_point = random.randrange(1, len(gene1))
+            if crosses[i]:
+                crossover_point = crossover_points[i]
                 child_gene1 = gene1[:crossover_point] + gene2[crossover_point:]
                 child_gene2 = gene2[:crossover_point] + gene1[crossover_point:]
                 child1.append(child_gene1)
@@ -26,4 +40,156 @@ class SinglePointCrossover(BaseCrossover):
                 child1.append(gene1)
                 child2.append(gene2)
 
-        return child1, child2
\ No newline at end of file
+        return child1, child2
+
+    def cross_batch(self, parents_a: np.ndarray, parents_b: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+        number_of_pairs, number_of_genes, gene_size = parents_a.shape
+
+        crosses = self.rng.random((number_of_pairs, number_of_genes)) < self.crossover_probability
+        crossover_points = self.rng.integers(1, gene_size, size=(number_of_pairs, number_of_genes))
+
+        swap = crosses[..., None] & (np.arange(gene_size) >= crossover_points[..., None])
+        return self._swap_masked(parents_a, parents_b, swap)
+
+
+class TwoPointCrossover(BaseCrossover):
+    """
+    Crossed genes exchange the segment between two cut points
+    """
+    def cross(self, parent1: Chromosome, parent2: Chromosome) -> tuple[Chromosome, Chromosome]:
+        assert len(parent1) == len(parent2), "Parents must have the same number of decision variables"
+
+        crosses = self.rng.random(len(parent1)) < self.crossover_probability
+        starts, ends = self.__cut_points(len(parent1[0]), len(parent1))
+
+        child1, child2 = [], []
+        for i, (gene1, gene2) in enumerate(zip(parent1, parent2)):
+            assert len(gene1) == len(gene2), "Genes must have the same size"
+            if crosses[i]:
+                start, end = starts[i], ends[i]
+                child1.append(gene1[:start] + gene2[start:end] + gene1[end:])
+                child2.append(gene2[:start] + gene1[start:end] + gene2[end:])
+            else:
+                child1.append(gene1)
+                child2.append(gene2)
+
+        return child1, child2
+
+    def cross_batch(self, parents_a: np.ndarray, parents_b: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+        number_of_pairs, number_of_genes, gene_size = parents_a.shape
+
+        crosses = self.rng.random((number_of_pairs, number_of_genes)) < self.crossover_probability
+        starts, ends = self.__cut_points(gene_size, (number_of_pairs, number_of_genes))
+
+        positions = np.arange(gene_size)
+        swap = crosses[..., None] & (positions >= starts[..., None]) & (positions < ends[..., None])
+        return self._swap_masked(parents_a, parents_b, swap)
+
+    def __cut_points(self, gene_size: int, size) -> tuple[np.ndarray, np.ndarray]:
+        # a non empty segment [start, end) that never starts at the first allele
+        starts = self.rng.integers(1, gene_size, size=size)
+        ends = self.rng.integers(starts + 1, gene_size + 1)
+        return starts, ends
+
+
+class UniformCrossover(BaseCrossover):
+    """
+    Crossed genes exchange each allele with probability swap_probability
+    """
+    def __init__(self, crossover_probability: float, swap_probability: float = 0.5, seed: Seed = None) -> None:
+        super().__init__(crossover_probability, seed)
+        self.swap_probability = swap_probability
+
+    def cross(self, parent1: Chromosome, parent2: Chromosome) -> tuple[Chromosome, Chromosome]:
+        assert len(parent1) == len(parent2), "Parents must have the same number of decision variables"
+
+        crosses = self.rng.random(len(parent1)) < self.crossover_probability
+        swaps = self.rng.random((len(parent1), len(parent1[0]))) < self.swap_probability
+
+        child1, child2 = [], []
+        for i, (gene1, gene2) in enumerate(zip(parent1, parent2)):
+            assert len(gene1) == len(gene2), "Genes must have the same size"
+            if crosses[i]:
+                child1.append([b if swap else a for a, b, swap in zip(gene1, gene2, swaps[i])])
+                child2.append([a if swap else b for a, b, swap in zip(gene1, gene2, swaps[i])])
+            else:
+                child1.append(gene1)
+                child2.append(gene2)
+
+        return child1, child2
+
+    def cross_batch(self, parents_a: np.ndarray, parents_b: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+        crosses = self.rng.random(parents_a.shape[:2]) < self.crossover_probability
+        swap = crosses[..., None] & (self.rng.random(parents_a.shape) < self.swap_probability)
+        return self._swap_masked(parents_a, parents_b, swap)
+
+
+class SimulatedBinaryCrossover(BaseCrossover):
+    """
+    Real-coded crossover (SBX) on float individuals. Each decision variable
+    is crossed with crossover_probability; a larger distribution_index
+    keeps the children closer to their parents
+    """
+    def __init__(
+        self,
+        crossover_probability: float,
+        lower_bounds: list[float],
+        upper_bounds: list[float],
+        distribution_index: float = 15,
+        seed: Seed = None
+    ) -> None:
+        super().__init__(crossover_probability, seed)
+        self.lower_bounds = np.asarray(lower_bounds, dtype=np.float64)
+        self.upper_bounds = np.asarray(upper_bounds, dtype=np.float64)
+        self.distribution_index = distribution_index
+
+    def cross(self, parent1: Individual, parent2: Individual) -> tuple[Individual, Individual]:
+        children_a, children_b = self.cross_batch(np.asarray([parent1], dtype=np.float64), np.asarray([parent2], dtype=np.float64))
+        return children_a[0].tolist(), children_b[0].tolist()
+
+    def cross_batch(self, parents_a: np.ndarray, parents_b: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+        crosses = self.rng.random(parents_a.shape) < self.crossover_probability
+        u = self.rng.random(parents_a.shape)
+
+        exponent = 1 / (self.distribution_index + 1)
+        beta = np.where(u <= 0.5, (2 * u)**exponent, (1 / (2 * (1 - u)))**exponent)
+        beta = np.where(crosses, beta, 1)
+
+        children_a = 0.5 * ((1 + beta) * parents_a + (1 - beta) * parents_b)
+        children_b = 0.5 * ((1 - beta) * parents_a + (1 + beta) * parents_b)
+        return np.clip(children_a, self.lower_bounds, self.upper_bounds), np.clip(children_b, self.lower_bounds, self.upper_bounds)
+
+
+class BlendCrossover(BaseCrossover):
+    """
+    Real-coded crossover (BLX-alpha) on float individuals. Each crossed
+    decision variable of a child is drawn uniformly from the parents'
+    interval widened by alpha times its length on both sides
+    """
+    def __init__(
+        self,
+        crossover_probability: float,
+        lower_bounds: list[float],
+        upper_bounds: list[float],
+        alpha: float = 0.5,
+        seed: Seed = None
+    ) -> None:
+        super().__init__(crossover_probability, seed)
+        self.lower_bounds = np.asarray(lower_bounds, dtype=np.float64)
+        self.upper_bounds = np.asarray(upper_bounds, dtype=np.float64)
+        self.alpha = alpha
+
+    def cross(self, parent1: Individual, parent2: Individual) -> tuple[Individual, Individual]:
+        children_a, children_b = self.cross_batch(np.asarray([parent1], dtype=np.float64), np.asarray([parent2], dtype=np.float64))
+        return children_a[0].tolist(), children_b[0].tolist()
+
+    def cross_batch(self, parents_a: np.ndarray, parents_b: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+        crosses = self.rng.random(parents_a.shape) < self.crossover_probability
+
+        low = np.minimum(parents_a, parents_b)
+        spread = np.abs(parents_a - parents_b)
+        low, width = low - self.alpha * spread, (1 + 2 * self.alpha) * spread
+
+        children_a = np.where(crosses, low + width * self.rng.random(parents_a.shape), parents_a)
+        children_b = np.where(crosses, low + width * self.rng.random(parents_a.shape), parents_b)
+        return np.clip(children_a, self.lower_bounds, self.upper_bounds), np.clip(children_b, self.lower_bounds, self.upper_bounds)
@@ -0,0 +1,271 @@
+from concurrent.futures import Future, ProcessPoolExecutor, ThreadPoolExecutor, wait
+import asyncio
+import inspect
+from multiprocessing import shared_memory
+import math
+import os
+import time
+
+import numpy as np
+
+from .type import Individual
+
+
+class BaseEvaluator:
+    """
+    Computes the fitness of a whole population. The result must be in
+    population order. When vectorized, the objective function maps a
+    2-D array of individuals to a fitness vector.
+
+    deadline is a time.monotonic() timestamp. Once it has passed no more
+    evaluations are started and only the fitness of the leading individuals
+    evaluated in time is returned, so the result may be shorter than the
+    population. The engine only passes it when the termination criterion
+    has a time limit
+    """
+    def evaluate(self, objective_function, population: list[Individual] | np.ndarray, vectorized: bool = False, deadline: float | None = None) -> list[float] | np.ndarray:
+        raise NotImplementedError()
+
+    async def evaluate_async(self, objective_function, population: list[Individual] | np.ndarray, vectorized: bool = False, deadline: float | None = None) -> list[float] | np.ndarray:
+        """
+        Awaitable evaluate(), run in a worker thread so the event loop stays free
+        """
+        if deadline is None:
+            return await asyncio.to_thread(self.evaluate, objective_function, population, vectorized)
+        return await asyncio.to_thread(self.evaluate, objective_function, population, vectorized, deadline)
+
+    def close(self):
+        """
+        Release any worker pool held by the evaluator
+        """
+        pass
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+class SerialEvaluator(BaseEvaluator):
+    def evaluate(self, objective_function, population: list[Individual] | np.ndarray, vectorized: bool = False, deadline: float | None = None) -> list[float] | np.ndarray:
+        if vectorized:
+            if deadline is not None and time.monotonic() >= deadline:
+                return np.empty(0)
+            return objective_function(population)
+
+        if deadline is None:
+            return [objective_function(individual) for individual in population]
+
+        population_fitness = []
+        for individual in population:
+            if time.monotonic() >= deadline:
+                break
+            population_fitness.append(objective_function(individual))
+        return population_fitness
+
+
+class ThreadPoolEvaluator(BaseEvaluator):
+    """
+    Evaluates on a thread pool. Only worth it when the objective function
+    releases the GIL (NumPy, I/O, native extensions)
+    """
+    def __init__(self, max_workers: int | None = None) -> None:
+        self.max_workers = max_workers or min(32, (os.cpu_count() or 1) + 4)
+        self.__executor: ThreadPoolExecutor | None = None
+
+    def evaluate(self, objective_function, population: list[Individual] | np.ndarray, vectorized: bool = False, deadline: float | None = None) -> list[float] | np.ndarray:
+        executor = self.__get_executor()
+
+        if vectorized:
+            chunks = [chunk for chunk in np.array_split(population, self.max_workers) if len(chunk)]
+            if deadline is None:
+                results = executor.map(objective_function, chunks)
+            else:
+                results = _completed_prefix([executor.submit(objective_function, chunk) for chunk in chunks], deadline)
+            return np.concatenate([np.asarray(result, dtype=np.float64) for result in results] or [np.empty(0)])
+
+        if deadline is None:
+            return list(executor.map(objective_function, population))
+        return _completed_prefix([executor.submit(objective_function, individual) for individual in population], deadline)
+
+    def close(self):
+        if self.__executor is not None:
+            self.__executor.shutdown()
+            self.__executor = None
+
+    def __get_executor(self) -> ThreadPoolExecutor:
+        if self.__executor is None:
+            self.__executor = ThreadPoolExecutor(max_workers=self.max_workers)
+        return self.__executor
+
+
+class ProcessPoolEvaluator(BaseEvaluator):
+    """
+    Evaluates on a process pool. The population is written once to a
+    shared memory block and each task only carries the block name and the
+    slice of rows to evaluate. The objective function must be picklable,
+    i.e. defined at module level
+    """
+    def __init__(self, max_workers: int | None = None, chunksize: int | None = None) -> None:
+        self.max_workers = max_workers or os.cpu_count() or 1
+        self.chunksize = chunksize
+        self.__executor: ProcessPoolExecutor | None = None
+
+    def evaluate(self, objective_function, population: list[Individual] | np.ndarray, vectorized: bool = False, deadline: float | None = None) -> list[float] | np.ndarray:
+        executor = self.__get_executor()
+        population = np.ascontiguousarray(population, dtype=np.float64)
+        size = len(population)
+        if size == 0:
+            return np.empty(0) if vectorized else []
+
+        chunksize = self.chunksize or math.ceil(size / (self.max_workers * 4))
+
+        block = shared_memory.SharedMemory(create=True, size=population.nbytes)
+        futures = []
+        try:
+            np.ndarray(population.shape, dtype=population.dtype, buffer=block.buf)[:] = population
+
+            futures = [
+                executor.submit(_evaluate_shared_rows, objective_function, block.name, population.shape, start, min(start + chunksize, size), vectorized)
+                for start in range(0, size, chunksize)
+            ]
+            if deadline is None:
+                results = [future.result() for future in futures]
+            else:
+                results = _completed_prefix(futures, deadline)
+            population_fitness = [fitness for result in results for fitness in result]
+        finally:
+            # tasks past the deadline or after a failure may not have
+            # attached to the block yet, so it outlives all of them
+            for future in futures:
+                future.cancel()
+            wait(futures)
+            block.close()
+            block.unlink()
+
+        if vectorized:
+            return np.asarray(population_fitness, dtype=np.float64)
+        return population_fitness
+
+    def close(self):
+        if self.__executor is not None:
+            self.__executor.shutdown()
+            self.__executor = None
+
+    def __get_executor(self) -> ProcessPoolExecutor:
+        if self.__executor is None:
+            self.__executor = ProcessPoolExecutor(max_workers=self.max_workers)
+        return self.__executor
+
+
+class AsyncEvaluator(BaseEvaluator):
+    """
+    Evaluates a whole generation concurrently on the event loop. Meant for
+    objective functions written as coroutines (plain functions are called
+    directly). At most max_concurrency evaluations are in flight at once and
+    each one is given timeout seconds. An evaluation that times out gets
+    timeout_fitness, or raises TimeoutError when no timeout_fitness is set
+    """
+    def __init__(self, max_concurrency: int | None = None, timeout: float | None = None, timeout_fitness: float | None = None) -> None:
+        if max_concurrency is not None and max_concurrency < 1:
+            raise ValueError("max_concurrency must be at least 1")
+
+        self.max_concurrency = max_concurrency
+        self.timeout = timeout
+        self.timeout_fitness = timeout_fitness
+
+    def evaluate(self, objective_function, population: list[Individual] | np.ndarray, vectorized: bool = False, deadline: float | None = None) -> list[float] | np.ndarray:
+        return asyncio.run(self.evaluate_async(objective_function, population, vectorized, deadline))
+
+    async def evaluate_async(self, objective_function, population: list[Individual] | np.ndarray, vectorized: bool = False, deadline: float | None = None) -> list[float] | np.ndarray:
+        if vectorized:
+            async def evaluate_population():
+                try:
+                    return await self.__evaluate_one(objective_function, population)
+                except TimeoutError:
+                    if self.timeout_fitness is None:
+                        raise
+                    return np.full(len(population), self.timeout_fitness, dtype=np.float64)
+
+            if deadline is None:
+                return await evaluate_population()
+            results = await _gather_until(deadline, [evaluate_population()])
+            return results[0] if results else np.empty(0)
+
+        semaphore = asyncio.Semaphore(self.max_concurrency) if self.max_concurrency else None
+
+        async def evaluate(individual):
+            try:
+                if semaphore is None:
+                    return await self.__evaluate_one(objective_function, individual)
+                async with semaphore:
+                    return await self.__evaluate_one(objective_function, individual)
+            except TimeoutError:
+                if self.timeout_fitness is None:
+                    raise
+                return self.timeout_fitness
+
+        if deadline is None:
+            return list(await asyncio.gather(*(evaluate(individual) for individual in population)))
+        return await _gather_until(deadline, [evaluate(individual) for individual in population])
+
+    async def __evaluate_one(self, objective_function, individual):
+        result = objective_function(individual)
+        if inspect.isawaitable(result):
+            return await asyncio.wait_for(result, self.timeout)
+        return result
+
+
+def _completed_prefix(futures: list[Future], deadline: float) -> list:
+    """
+    Results of the leading futures that are done by the deadline. The
+    others are cancelled, or left to finish unseen if already running
+    """
+    wait(futures, timeout=max(0.0, deadline - time.monotonic()))
+
+    results = []
+    for future in futures:
+        if not future.done() or future.cancelled():
+            break
+        results.append(future.result())
+
+    for future in futures[len(results):]:
+        future.cancel()
+    return results
+
+
+async def _gather_until(deadline: float, coroutines: list) -> list:
+    """
+    Results of the leading coroutines that are done by the deadline, the
+    others are cancelled
+    """
+    tasks = [asyncio.ensure_future(coroutine) for coroutine in coroutines]
+    if not tasks:
+        return []
+
+    done, pending = await asyncio.wait(tasks, timeout=max(0.0, deadline - time.monotonic()))
+    for task in pending:
+        task.cancel()
+    await asyncio.gather(*pending, return_exceptions=True)
+
+    results = []
+    for task in tasks:
+        if task not in done:
+            break
+        results.append(task.result())
+    return results
+
+
+def _evaluate_shared_rows(objective_function, name: str, shape: tuple[int, int], start: int, stop: int, vectorized: bool) -> list[float]:
+    block = shared_memory.SharedMemory(name=name)
+    rows = None
+    try:
+        rows = np.ndarray(shape, dtype=np.float64, buffer=block.buf)[start:stop]
+        if vectorized:
+            return np.asarray(objective_function(rows), dtype=np.float64).tolist()
+        return [objective_function(individual) for individual in rows.tolist()]
+    finally:
+        # the block cannot be closed while a view on it is alive
+        rows = None
+        block.close()
@@ -0,0 +1,63 @@
+from collections import OrderedDict, namedtuple
+from typing import Hashable
+
+CacheInfo = namedtuple("CacheInfo", ["hits", "misses", "maxsize", "currsize"])
+
+
+class FitnessCache:
+    """
+    Least recently used map from a chromosome, or an individual, to its fitness
+    """
+    def __init__(self, maxsize: int = 100_000) -> None:
+        if maxsize < 1:
+            raise ValueError("maxsize must be at least 1")
+
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self.__entries: OrderedDict[Hashable, float] = OrderedDict()
+
+    def lookup(self, keys: list[Hashable]) -> tuple[list[float | None], dict[Hashable, list[int]]]:
+        """
+        Fitness of every key (None when unknown) and, for each unknown key,
+        the positions it appears at. Repeats of an unknown key only count
+        one miss since they are evaluated once
+        """
+        population_fitness: list[float | None] = []
+        missing: dict[Hashable, list[int]] = {}
+
+        for i, key in enumerate(keys):
+            if key in missing:
+                self.hits += 1
+                missing[key].append(i)
+                population_fitness.append(None)
+            elif key in self.__entries:
+                self.hits += 1
+                self.__entries.move_to_end(key)
+                population_fitness.append(self.__entries[key])
+            else:
+                self.misses += 1
+                missing[key] = [i]
+                population_fitness.append(None)
+
+        return population_fitness, missing
+
+    def put(self, key: Hashable, fitness: float):
+        self.__entries[key] = fitness
+        self.__entries.move_to_end(key)
+        if len(self.__entries) > self.maxsize:
+            self.__entries.popitem(last=False)
+
+    def cache_info(self) -> CacheInfo:
+        return CacheInfo(self.hits, self.misses, self.maxsize, len(self.__entries))
+
+    def clear(self):
+        self.hits = 0
+        self.misses = 0
+        self.__entries.clear()
+
+    def __len__(self) -> int:
+        return len(self.__entries)
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self.__entries
@@ -0,0 +1,263 @@
+import traceback
+from multiprocessing import Pipe, Process
+from multiprocessing.connection import Connection
+
+import numpy as np
+
+from .multi_objective import MultiObjectiveOptimization, crowded_scores, crowding_distance, non_dominated_sort
+from .optimization import BaseOptimization, Maximization
+from .rng import Seed, spawn
+from .type import Individual
+
+
+class BaseTopology:
+    def destinations(self, number_of_islands: int) -> list[list[int]]:
+        """
+        For every island, the islands its emigrants are sent to
+        """
+        raise NotImplementedError()
+
+
+class RingTopology(BaseTopology):
+    def destinations(self, number_of_islands: int) -> list[list[int]]:
+        if number_of_islands < 2:
+            return [[] for _ in range(number_of_islands)]
+        return [[(i + 1) % number_of_islands] for i in range(number_of_islands)]
+
+
+class FullyConnectedTopology(BaseTopology):
+    def destinations(self, number_of_islands: int) -> list[list[int]]:
+        return [[j for j in range(number_of_islands) if j != i] for i in range(number_of_islands)]
+
+
+class RandomTopology(BaseTopology):
+    """
+    Every migration, each island sends to one other island picked at random
+    """
+    def __init__(self, seed: Seed = None) -> None:
+        self.rng = np.random.default_rng(seed)
+
+    def destinations(self, number_of_islands: int) -> list[list[int]]:
+        if number_of_islands < 2:
+            return [[] for _ in range(number_of_islands)]
+        # shift every island by a non-zero offset
+        offsets = self.rng.integers(1, number_of_islands, size=number_of_islands)
+        return [[int(i + offset) % number_of_islands] for i, offset in enumerate(offsets)]
+
+
+class IslandModel:
+    """
+    Runs one GeneticAlgorithm per worker process. Every migration_interval
+    generations each island sends copies of its migration_size best
+    individuals along the topology, and every island replaces
+    migration_size random members with the best of what it received.
+    An island stops with its own termination criterion, the run ends when
+    all of them have stopped.
+
+    Each factory is a picklable callable (a module level function or a
+    functools.partial) that builds the GeneticAlgorithm of one island, so
+    islands can use different operators and settings. Island i is reseeded
+    with the i-th stream spawned from seed, so results do not depend on
+    process scheduling, and a topology that draws at random is reseeded
+    with the next stream when seed is given. Islands may evaluate on a
+    ProcessPoolEvaluator of their own. When an island raises, the other
+    islands are terminated and run() raises the same exception.
+
+    Islands running NSGA2 need its MultiObjectiveOptimization: migrants
+    are then picked by rank and crowding distance, and optimal_fitness and
+    optimal_individual are the non-dominated front of all the islands
+    """
+    def __init__(
+        self,
+        factories: list,
+        migration_interval: int = 10,
+        migration_size: int = 1,
+        topology: BaseTopology = RingTopology(),
+        optimization: BaseOptimization | MultiObjectiveOptimization = Maximization(),
+        seed: Seed = None,
+    ) -> None:
+        if migration_interval < 1:
+            raise ValueError("migration_interval must be at least 1")
+
+        self.factories = factories
+        self.migration_interval = migration_interval
+        self.migration_size = migration_size
+        self.topology = topology
+        self.optimization = optimization
+        self.seed = seed
+
+        self.island_results: list[tuple[int, float, Individual]] = []
+        self.optimal_fitness: float = None
+        self.optimal_individual: Individual = None
+        self.optimal_island: int = None
+
+    def run(self):
+        connections: list[Connection] = []
+        processes: list[Process] = []
+        *island_seeds, topology_seed = spawn(self.seed, len(self.factories) + 1)
+        if self.seed is not None and hasattr(self.topology, "rng"):
+            self.topology.rng = np.random.default_rng(topology_seed)
+
+        for factory, island_seed in zip(self.factories, island_seeds):
+            parent_connection, child_connection = Pipe()
+            # not a daemon, so that an island can start the worker processes
+            # of its evaluator. It is joined, or terminated on failure, below
+            process = Process(target=_run_island, args=(factory, island_seed, child_connection, self.migration_interval, self.migration_size))
+            process.start()
+            # only the island holds its end, so the pipe reports EOF if it dies
+            child_connection.close()
+            connections.append(parent_connection)
+            processes.append(process)
+
+        number_of_islands = len(self.factories)
+        self.island_results = [None] * number_of_islands
+        active = set(range(number_of_islands))
+
+        failed = True
+        try:
+            while active:
+                emigrants = {}
+                for i in sorted(active):
+                    number_of_generation, optimal_fitness, optimal_individual, island_emigrants, done = self.__receive(i, connections[i], processes[i])
+                    self.island_results[i] = (number_of_generation, optimal_fitness, optimal_individual)
+                    self.__update_optimal(i, optimal_fitness, optimal_individual)
+
+                    emigrants[i] = island_emigrants
+                    if done:
+                        active.discard(i)
+
+                immigrants = {i: [] for i in active}
+                for source, destinations in enumerate(self.topology.destinations(number_of_islands)):
+                    for destination in destinations:
+                        if source in emigrants and destination in immigrants:
+                            immigrants[destination].extend(emigrants[source])
+
+                for i in range(number_of_islands):
+                    if i in immigrants:
+                        self.__send(i, connections[i], self.__best(immigrants[i]))
+                    elif i in emigrants:
+                        # the island has terminated
+                        self.__send(i, connections[i], None)
+            failed = False
+        finally:
+            for process in processes:
+                if failed:
+                    process.terminate()
+                process.join()
+            for connection in connections:
+                connection.close()
+
+    @property
+    def result(self):
+        if self.optimal_individual is None:
+            print("(Warning) Island model has not been run yet. Call run() method first")
+        return self.optimal_fitness, self.optimal_individual
+
+    @staticmethod
+    def __receive(island: int, connection: Connection, process: Process) -> tuple:
+        try:
+            message = connection.recv()
+        except (EOFError, OSError):
+            process.join()
+            raise RuntimeError(f"Island {island} exited without reporting, exit code {process.exitcode}") from None
+
+        if isinstance(message, IslandError):
+            raise message.error from message
+        return message
+
+    @staticmethod
+    def __send(island: int, connection: Connection, immigrants: list[Individual] | None):
+        try:
+            connection.send(immigrants)
+        except OSError:
+            raise RuntimeError(f"Island {island} exited while migrating") from None
+
+    def __update_optimal(self, island: int, fitness: float, individual: Individual):
+        if fitness is not None and np.ndim(fitness) != 0:
+            self.__update_front(fitness, individual)
+        elif fitness is not None and self.optimization.is_optimal(fitness, self.optimal_fitness):
+            self.optimal_fitness = fitness
+            self.optimal_individual = individual
+            self.optimal_island = island
+
+    def __update_front(self, fitness: np.ndarray, individuals: list[Individual]):
+        if not isinstance(self.optimization, MultiObjectiveOptimization):
+            raise TypeError("The islands report Pareto fronts, give IslandModel the MultiObjectiveOptimization of their NSGA2")
+
+        # an island reports its front again until it improves, keep one
+        # copy of every individual
+        front = {}
+        if self.optimal_individual is not None:
+            front.update(zip(map(tuple, self.optimal_individual), self.optimal_fitness))
+        for row, individual in zip(np.asarray(fitness, dtype=np.float64), individuals):
+            front.setdefault(tuple(np.asarray(individual).tolist()), row)
+
+        candidates = np.array(list(front.values()))
+        keep = np.flatnonzero(non_dominated_sort(self.optimization.objectives(candidates)) == 0)
+        individuals = list(front)
+        self.optimal_fitness = candidates[keep]
+        self.optimal_individual = [list(individuals[i]) for i in keep]
+
+    def __best(self, migrants: list[tuple[float, Individual]]) -> list[Individual]:
+        if not migrants:
+            return []
+        order = np.argsort(self.__scores([fitness for fitness, _ in migrants]), kind="stable")[::-1]
+        return [migrants[i][1] for i in order[:self.migration_size]]
+
+    def __scores(self, fitness: list) -> np.ndarray:
+        if not isinstance(self.optimization, MultiObjectiveOptimization):
+            return self.optimization.scores(fitness)
+        objectives = self.optimization.objectives(np.asarray(fitness, dtype=np.float64))
+        ranks = non_dominated_sort(objectives)
+        return crowded_scores(ranks, crowding_distance(objectives, ranks))
+
+
+class IslandError(Exception):
+    """
+    Sent by an island that raised, with the exception and its traceback in
+    the island process
+    """
+    def __init__(self, island_traceback: str, error: BaseException) -> None:
+        super().__init__(island_traceback)
+        self.error = error
+
+    def __reduce__(self):
+        return IslandError, (self.args[0], self.error)
+
+
+def _run_island(factory, seed: np.random.SeedSequence, connection: Connection, migration_interval: int, migration_size: int):
+    try:
+        _evolve_island(factory, seed, connection, migration_interval, migration_size)
+    except Exception as error:
+        island_traceback = traceback.format_exc()
+        try:
+            connection.send(IslandError(island_traceback, error))
+        except Exception:
+            # the exception itself cannot be pickled
+            connection.send(IslandError(island_traceback, RuntimeError(repr(error))))
+    finally:
+        connection.close()
+
+
+def _evolve_island(factory, seed: np.random.SeedSequence, connection: Connection, migration_interval: int, migration_size: int):
+    ga = factory()
+    ga.reseed(seed)
+    ga.start()
+
+    while True:
+        done = False
+        for _ in range(migration_interval):
+            if ga.should_terminate():
+                done = True
+                break
+            ga.step()
+
+        connection.send((ga.number_of_generation, ga.optimal_fitness, ga.optimal_individual, ga.emigrants(migration_size), done))
+
+        # the coordinator answers every report, with None once the island is done
+        immigrants = connection.recv()
+        if immigrants is None:
+            break
+        ga.immigrate(immigrants)
+
+    ga.finish()
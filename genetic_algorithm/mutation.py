@@ -1,28 +1,42 @@
-from .type import Chromosome
-import random
+from .type import Chromosome, Individual
+from .rng import Seed
+import numpy as np
 
 class BaseMutation:
-    def __init__(self, mutation_probability: float) -> None:
+    """
+    Operators may also implement mutate_batch(population), which mutates a
+    whole genotype array of children at once, where rows 2k and 2k + 1 are
+    the children of the same pair. The engine uses it whenever it is there
+    """
+    def __init__(self, mutation_probability: float, seed: Seed = None) -> None:
         if mutation_probability < 0 or mutation_probability > 1:
             raise ValueError("mutation_rate must be between 0 and 1")
         
         self.mutation_probability = mutation_probability
+        self.rng = np.random.default_rng(seed)
     
     def mutate(self, parent1: Chromosome, parent2: Chromosome) -> tuple[Chromosome, Chromosome]:
         raise NotImplementedError()
 
 
 class BitFlipMutation(BaseMutation):
+    """
+    A mutated gene swaps one allele with the same gene of the other child
+    """
     def mutate(self, parent1: Chromosome, parent2: Chromosome) -> tuple[Chromosome, Chromosome]:
         assert len(parent1) == len(parent2), "Parents must have the same number of decision variables"
 
+        # one draw for every gene of the pair
+        mutates = self.rng.random(len(parent1)) < self.mutation_probability
+        positions = self.rng.integers(0, len(parent1[0]), size=len(parent1)) if mutates.any() else None
+
         child1, child2 = [], []
-        for gene1, gene2 in zip(parent1, parent2):
+        for i, (gene1, gene2) in enumerate(zip(parent1, parent2)):
             assert len(gene1) == len(gene2), "Genes must have the same size"
-            if random.random() < self.mutation_probability:
-                i = random.randint(0, len(parent1) - 1)
+            if mutates[i]:
+                position = positions[i]
                 child_gene1, child_gene2 = gene1.copy(), gene2.copy()
-                child_gene1[i], child_gene2[i] = child_gene2[i], child_gene1[i]
+                child_gene1[position], child_gene2[position] = child_gene2[position], child_gene1[position]
                 child1.append(child_gene1)
                 child2.append(child_gene2)
             else:
@@ -30,3 +44,111 @@ class BitFlipMutation(BaseMutation):
                 child2.append(gene2)
 
         return child1, child2
+
+    def mutate_batch(self, population: np.ndarray) -> np.ndarray:
+        # an odd last row has no partner and is left alone
+        number_of_pairs = len(population) // 2
+        children_a, children_b = population[0:2 * number_of_pairs:2], population[1:2 * number_of_pairs:2]
+        _, number_of_genes, gene_size = population.shape
+
+        mutates = self.rng.random((number_of_pairs, number_of_genes)) < self.mutation_probability
+        positions = self.rng.integers(0, gene_size, size=(number_of_pairs, number_of_genes))
+        swap = mutates[..., None] & (np.arange(gene_size) == positions[..., None])
+
+        mutated = population.copy()
+        mutated[0:2 * number_of_pairs:2] = np.where(swap, children_b, children_a)
+        mutated[1:2 * number_of_pairs:2] = np.where(swap, children_a, children_b)
+        return mutated
+
+
+class PerBitFlipMutation(BaseMutation):
+    """
+    Every bit of every child flips independently with mutation_probability.
+    Meant for binary chromosomes
+    """
+    def mutate(self, parent1: Chromosome, parent2: Chromosome) -> tuple[Chromosome, Chromosome]:
+        assert len(parent1) == len(parent2), "Parents must have the same number of decision variables"
+
+        flips = self.rng.random((2, len(parent1), len(parent1[0]))) < self.mutation_probability
+        child1 = [[bit ^ int(flip) for bit, flip in zip(gene, gene_flips)] for gene, gene_flips in zip(parent1, flips[0])]
+        child2 = [[bit ^ int(flip) for bit, flip in zip(gene, gene_flips)] for gene, gene_flips in zip(parent2, flips[1])]
+        return child1, child2
+
+    def mutate_batch(self, population: np.ndarray) -> np.ndarray:
+        flips = self.rng.random(population.shape) < self.mutation_probability
+        return population ^ flips.astype(population.dtype)
+
+
+class PolynomialMutation(BaseMutation):
+    """
+    Real-coded mutation on float individuals. Each decision variable is
+    perturbed with mutation_probability by a polynomial distributed step
+    that never leaves the bounds; a larger distribution_index gives
+    smaller steps
+    """
+    def __init__(
+        self,
+        mutation_probability: float,
+        lower_bounds: list[float],
+        upper_bounds: list[float],
+        distribution_index: float = 20,
+        seed: Seed = None
+    ) -> None:
+        super().__init__(mutation_probability, seed)
+        self.lower_bounds = np.asarray(lower_bounds, dtype=np.float64)
+        self.upper_bounds = np.asarray(upper_bounds, dtype=np.float64)
+        self.distribution_index = distribution_index
+
+    def mutate(self, parent1: Individual, parent2: Individual) -> tuple[Individual, Individual]:
+        child1, child2 = self.mutate_batch(np.asarray([parent1, parent2], dtype=np.float64))
+        return child1.tolist(), child2.tolist()
+
+    def mutate_batch(self, population: np.ndarray) -> np.ndarray:
+        mutates = self.rng.random(population.shape) < self.mutation_probability
+        u = self.rng.random(population.shape)
+
+        span = self.upper_bounds - self.lower_bounds
+        exponent = self.distribution_index + 1
+        with np.errstate(divide="ignore", invalid="ignore"):
+            below = (population - self.lower_bounds) / span
+            above = (self.upper_bounds - population) / span
+
+        step = np.where(
+            u < 0.5,
+            (2 * u + (1 - 2 * u) * (1 - below)**exponent)**(1 / exponent) - 1,
+            1 - (2 * (1 - u) + 2 * (u - 0.5) * (1 - above)**exponent)**(1 / exponent)
+        )
+
+        mutated = np.where(mutates, population + step * span, population)
+        return np.clip(mutated, self.lower_bounds, self.upper_bounds)
+
+
+class GaussianMutation(BaseMutation):
+    """
+    Real-coded mutation on float individuals. Each decision variable is
+    perturbed with mutation_probability by normal noise whose standard
+    deviation is sigma times the width of its bounds
+    """
+    def __init__(
+        self,
+        mutation_probability: float,
+        lower_bounds: list[float],
+        upper_bounds: list[float],
+        sigma: float = 0.1,
+        seed: Seed = None
+    ) -> None:
+        super().__init__(mutation_probability, seed)
+        self.lower_bounds = np.asarray(lower_bounds, dtype=np.float64)
+        self.upper_bounds = np.asarray(upper_bounds, dtype=np.float64)
+        self.sigma = sigma
+
+    def mutate(self, parent1: Individual, parent2: Individual) -> tuple[Individual, Individual]:
+        child1, child2 = self.mutate_batch(np.asarray([parent1, parent2], dtype=np.float64))
+        return child1.tolist(), child2.tolist()
+
+    def mutate_batch(self, population: np.ndarray) -> np.ndarray:
+        mutates = self.rng.random(population.shape) < self.mutation_probability
+        noise = self.rng.normal(0, self.sigma, size=population.shape) * (self.upper_bounds - self.lower_bounds)
+
+        mutated = np.where(mutates, population + noise, population)
+        return np.clip(mutated, self.lower_bounds, self.upper_bounds)
@@ -1,13 +1,44 @@
+import numpy as np
+
+
 class BaseOptimization:
     def is_optimal(self, new: float, old: float | None) -> bool:
         return False
 
+    def best_index(self, population_fitness: np.ndarray) -> int:
+        """
+        Index of the optimal value in a fitness vector
+        """
+        best, best_fitness = 0, None
+        for i, fitness in enumerate(population_fitness):
+            if self.is_optimal(fitness, best_fitness):
+                best, best_fitness = i, fitness
+        return best
+
+    def scores(self, population_fitness: np.ndarray) -> np.ndarray:
+        """
+        Fitness oriented so that a larger score is always better
+        """
+        raise NotImplementedError()
+
 
 class Minimization(BaseOptimization):
     def is_optimal(self, new: float, old: float | None) -> bool:
         return old is None or new < old
 
+    def best_index(self, population_fitness: np.ndarray) -> int:
+        return int(np.argmin(population_fitness))
+
+    def scores(self, population_fitness: np.ndarray) -> np.ndarray:
+        return -np.asarray(population_fitness, dtype=np.float64)
+
 
 class Maximization(BaseOptimization):
     def is_optimal(self, new: float, old: float | None) -> bool:
         return old is None or new > old
+
+    def best_index(self, population_fitness: np.ndarray) -> int:
+        return int(np.argmax(population_fitness))
+
+    def scores(self, population_fitness: np.ndarray) -> np.ndarray:
+        return np.asarray(population_fitness, dtype=np.float64)
@@ -0,0 +1,114 @@
+"""
+Names that configuration files use for the components of a run. Targets are
+"module:attribute" paths imported only when they are resolved, so a run
+does not pay for the modules it does not use (matplotlib for plotting,
+prettytable for tables). A name that is not registered may be given as a
+path directly
+"""
+import importlib
+
+REGISTRY: dict[str, dict[str, str]] = {
+    "algorithm": {
+        "genetic_algorithm": "ga:GeneticAlgorithm",
+        "nsga2": "ga:NSGA2",
+    },
+    "decoder": {
+        "binary": "genetic_algorithm.chromosome_decoder:BinaryChromosomeDecoder",
+        "denary": "genetic_algorithm.chromosome_decoder:DenaryChromosomeDecoder",
+        "identity": "genetic_algorithm.chromosome_decoder:IdentityChromosomeDecoder",
+    },
+    "optimization": {
+        "maximization": "genetic_algorithm.optimization:Maximization",
+        "minimization": "genetic_algorithm.optimization:Minimization",
+        "multi_objective": "genetic_algorithm.multi_objective:MultiObjectiveOptimization",
+    },
+    "selection": {
+        "roulette": "genetic_algorithm.selection:RouletteSelection",
+        "stochastic_universal_sampling": "genetic_algorithm.selection:StochasticUniversalSampling",
+        "alias": "genetic_algorithm.selection:AliasSelection",
+        "tournament": "genetic_algorithm.selection:TournamentSelection",
+        "linear_rank": "genetic_algorithm.selection:LinearRankSelection",
+    },
+    "crossover": {
+        "single_point": "genetic_algorithm.crossover:SinglePointCrossover",
+        "two_point": "genetic_algorithm.crossover:TwoPointCrossover",
+        "uniform": "genetic_algorithm.crossover:UniformCrossover",
+        "simulated_binary": "genetic_algorithm.crossover:SimulatedBinaryCrossover",
+        "blend": "genetic_algorithm.crossover:BlendCrossover",
+    },
+    "mutation": {
+        "bit_flip": "genetic_algorithm.mutation:BitFlipMutation",
+        "per_bit_flip": "genetic_algorithm.mutation:PerBitFlipMutation",
+        "polynomial": "genetic_algorithm.mutation:PolynomialMutation",
+        "gaussian": "genetic_algorithm.mutation:GaussianMutation",
+    },
+    "termination": {
+        "number_of_generation": "genetic_algorithm.termination_criterion:NumberOfGeneration",
+        "threshold_difference": "genetic_algorithm.termination_criterion:ThresholdDifference",
+        "max_evaluations": "genetic_algorithm.termination_criterion:MaxEvaluations",
+        "max_runtime": "genetic_algorithm.termination_criterion:MaxRuntime",
+        "early_stopping": "genetic_algorithm.termination_criterion:EarlyStopping",
+        "target_fitness_reached": "genetic_algorithm.termination_criterion:TargetFitnessReached",
+        "or": "genetic_algorithm.termination_criterion:OrTermination",
+        "and": "genetic_algorithm.termination_criterion:AndTermination",
+    },
+    "callback": {
+        "print_best_fitness": "genetic_algorithm.callbacks.print_logger:PrintBestFitness",
+        "profiling": "genetic_algorithm.callbacks.profiling:ProfilingCallback",
+        "streaming_logger": "genetic_algorithm.callbacks.stream_logger:StreamingLogger",
+        "population_archive": "genetic_algorithm.callbacks.population_archive:PopulationArchive",
+        "plot_fitness": "genetic_algorithm.callbacks.plot:PlotFitnessCallback",
+        "table": "genetic_algorithm.callbacks.table:TabulateCallback",
+    },
+    "evaluator": {
+        "serial": "genetic_algorithm.evaluator:SerialEvaluator",
+        "thread_pool": "genetic_algorithm.evaluator:ThreadPoolEvaluator",
+        "process_pool": "genetic_algorithm.evaluator:ProcessPoolEvaluator",
+        "async": "genetic_algorithm.evaluator:AsyncEvaluator",
+    },
+    "surrogate": {
+        "screening": "genetic_algorithm.surrogate:SurrogateScreening",
+    },
+    "surrogate_model": {
+        "k_nearest_neighbours": "genetic_algorithm.surrogate:KNearestNeighbours",
+        "radial_basis_function": "genetic_algorithm.surrogate:RadialBasisFunction",
+    },
+    # components with a single implementation
+    "fitness_cache": {
+        "default": "genetic_algorithm.fitness_cache:FitnessCache",
+    },
+    "checkpointer": {
+        "default": "genetic_algorithm.checkpoint:Checkpointer",
+    },
+}
+
+
+def register(kind: str, name: str, target: str):
+    """
+    Make a "module:attribute" path available under a name
+    """
+    REGISTRY.setdefault(kind, {})[name] = target
+
+
+def resolve(kind: str, name: str):
+    """
+    The object registered under name, or name itself imported as a
+    "module:attribute" path
+    """
+    entries = REGISTRY.get(kind, {})
+    if name in entries:
+        return import_object(entries[name])
+    if ":" in name:
+        return import_object(name)
+    raise ValueError(f"Unknown {kind} {name!r}, choose from {', '.join(entries)} or give a module:attribute path")
+
+
+def import_object(path: str):
+    module_name, _, attribute = path.partition(":")
+    target = importlib.import_module(module_name)
+    try:
+        for part in attribute.split("."):
+            target = getattr(target, part)
+    except AttributeError:
+        raise ValueError(f"{module_name} has no attribute {attribute!r}") from None
+    return target
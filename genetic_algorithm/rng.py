@@ -0,0 +1,17 @@
+import numpy as np
+
+# Anything np.random.default_rng accepts
+type Seed = int | np.random.SeedSequence | np.random.Generator | None
+
+
+def spawn(seed: Seed, n: int) -> list[np.random.SeedSequence | np.random.Generator]:
+    """
+    n independent child seeds. The same seed always gives the same children,
+    so streams assigned per component, island or worker do not depend on
+    how many of them run in parallel
+    """
+    if isinstance(seed, np.random.Generator):
+        return seed.spawn(n)
+    if not isinstance(seed, np.random.SeedSequence):
+        seed = np.random.SeedSequence(seed)
+    return seed.spawn(n)
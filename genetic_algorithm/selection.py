@@ -1,31 +1,175 @@
 from .type import Chromosome
-import random
+from .optimization import BaseOptimization, Maximization
+from .rng import Seed
+import numpy as np
 
 class BaseSelection:
+    def __init__(self, seed: Seed = None) -> None:
+        self.rng = np.random.default_rng(seed)
+
     def select(self, population: list[Chromosome], population_fitness: list[float]) -> list[Chromosome]:
+        indices = self.select_indices(population_fitness, len(population))
+        if isinstance(population, np.ndarray):
+            return population[indices]
+        return [population[i] for i in indices]
+
+    def select_indices(self, population_fitness: list[float], k: int) -> np.ndarray:
+        """
+        Draw k indices into the population according to its fitness
+        """
         raise NotImplementedError()
 
 
+def wheel_weights(population_fitness: list[float]) -> np.ndarray:
+    """
+    Fitness proportional weights. Negative fitness is shifted up so that
+    the least fit individual gets a zero slice of the wheel
+    """
+    weights = np.asarray(population_fitness, dtype=np.float64)
+    lowest = weights.min()
+    if lowest < 0:
+        weights = weights - lowest
+    return weights
+
+
 class RouletteSelection(BaseSelection):
-    def select(self, population: list[Chromosome], population_fitness: list[float]) -> list[Chromosome]:
-        roulette_wheel = []
-        cumulative_fitness = 0
+    """
+    Fitness proportional selection, each spin is located on the cumulative
+    wheel with a binary search
+    """
+    def select_indices(self, population_fitness: list[float], k: int) -> np.ndarray:
+        roulette_wheel = np.cumsum(wheel_weights(population_fitness))
+        total_fitness = roulette_wheel[-1]
 
-        for fitness in population_fitness:
-            cumulative_fitness += fitness
-            roulette_wheel.append(cumulative_fitness)
+        if total_fitness == 0:
+            return self.rng.integers(0, len(roulette_wheel), size=k)
+
+        spins = self.rng.uniform(0, total_fitness, size=k)
+        indices = np.searchsorted(roulette_wheel, spins, side="right")
+        return np.minimum(indices, len(roulette_wheel) - 1)
 
-        total_fitness = cumulative_fitness
+
+class StochasticUniversalSampling(BaseSelection):
+    """
+    Fitness proportional selection with a single spin and k evenly spaced
+    pointers, so every individual is picked within one of its expected count
+    """
+    def select_indices(self, population_fitness: list[float], k: int) -> np.ndarray:
+        roulette_wheel = np.cumsum(wheel_weights(population_fitness))
+        total_fitness = roulette_wheel[-1]
 
         if total_fitness == 0:
-            return random.choices(population, k=len(population))
+            return self.rng.integers(0, len(roulette_wheel), size=k)
+
+        distance = total_fitness / k
+        pointers = self.rng.uniform(0, distance) + distance * np.arange(k)
+        indices = np.minimum(np.searchsorted(roulette_wheel, pointers, side="right"), len(roulette_wheel) - 1)
+
+        # pointers come out in wheel order
+        return self.rng.permutation(indices)
+
+
+class AliasSelection(BaseSelection):
+    """
+    Fitness proportional selection with Vose's alias method: O(n) to build
+    the table, O(1) per draw
+    """
+    def select_indices(self, population_fitness: list[float], k: int) -> np.ndarray:
+        weights = wheel_weights(population_fitness)
+        n = len(weights)
+        total_fitness = weights.sum()
+
+        if total_fitness == 0:
+            return self.rng.integers(0, n, size=k)
+
+        probability, alias = self.__build_table(weights * (n / total_fitness))
+
+        columns = self.rng.integers(0, n, size=k)
+        coins = self.rng.random(size=k)
+        return np.where(coins < probability[columns], columns, alias[columns])
+
+    @staticmethod
+    def __build_table(scaled: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+        n = len(scaled)
+        probability = np.ones(n)
+        alias = np.arange(n)
+
+        small = np.flatnonzero(scaled < 1).tolist()
+        large = np.flatnonzero(scaled >= 1).tolist()
+        scaled = scaled.tolist()
+
+        while small and large:
+            less, more = small.pop(), large.pop()
+            probability[less] = scaled[less]
+            alias[less] = more
+            scaled[more] = scaled[more] + scaled[less] - 1
+            if scaled[more] < 1:
+                small.append(more)
+            else:
+                large.append(more)
+
+        # whatever is left is 1 up to rounding error
+        return probability, alias
+
+
+def rank_scores(population_fitness: list[float], optimization: BaseOptimization | None) -> np.ndarray:
+    """
+    Scores that rank based selections compare, larger is better
+    """
+    if optimization is None:
+        optimization = Maximization()
+    return optimization.scores(population_fitness)
+
+
+class TournamentSelection(BaseSelection):
+    """
+    Each pick is the best of k contestants drawn uniformly with replacement.
+    Without an optimization, the selection follows the one of the
+    GeneticAlgorithm it is given to, and maximizes on its own
+    """
+    def __init__(self, k: int = 2, optimization: BaseOptimization | None = None, seed: Seed = None) -> None:
+        super().__init__(seed)
+        if k < 1:
+            raise ValueError("k must be at least 1")
+
+        self.k = k
+        self.optimization = optimization
+
+    def select_indices(self, population_fitness: list[float], k: int) -> np.ndarray:
+        scores = rank_scores(population_fitness, self.optimization)
+
+        contestants = self.rng.integers(0, len(scores), size=(k, self.k))
+        winners = np.argmax(scores[contestants], axis=1)
+        return contestants[np.arange(k), winners]
+
+
+class LinearRankSelection(BaseSelection):
+    """
+    Selection probability grows linearly with rank, from (2 - selection_pressure) / n
+    for the worst individual to selection_pressure / n for the best. The
+    optimization is found like the one of TournamentSelection
+    """
+    def __init__(self, selection_pressure: float = 1.5, optimization: BaseOptimization | None = None, seed: Seed = None) -> None:
+        super().__init__(seed)
+        if selection_pressure < 1 or selection_pressure > 2:
+            raise ValueError("selection_pressure must be between 1 and 2")
+
+        self.selection_pressure = selection_pressure
+        self.optimization = optimization
+
+    def select_indices(self, population_fitness: list[float], k: int) -> np.ndarray:
+        scores = rank_scores(population_fitness, self.optimization)
+        n = len(scores)
+
+        # worst individual first
+        order = np.argsort(scores, kind="stable")
+
+        if n == 1:
+            return order[np.zeros(k, dtype=np.intp)]
 
-        selection = []
-        while len(selection) < len(population):
-            spin = random.uniform(0, total_fitness)
-            for i in range(len(roulette_wheel)):
-                if spin < roulette_wheel[i]:
-                    selection.append(population[i])
-                    break
+        ranks = np.arange(n)
+        probability = (2 - self.selection_pressure) / n + 2 * ranks * (self.selection_pressure - 1) / (n * (n - 1))
+        wheel = np.cumsum(probability)
 
-        return selection
+        spins = self.rng.uniform(0, wheel[-1], size=k)
+        return order[np.minimum(np.searchsorted(wheel, spins, side="right"), n - 1)]
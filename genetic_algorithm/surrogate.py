@@ -0,0 +1,221 @@
+import numpy as np
+
+from .optimization import BaseOptimization
+from .type import Individual
+
+
+def squared_distances(points: np.ndarray, centers: np.ndarray) -> np.ndarray:
+    """
+    Squared euclidean distance of every point to every center
+    """
+    distances = (points * points).sum(axis=1)[:, None] + (centers * centers).sum(axis=1)[None, :] - 2 * points @ centers.T
+    # rounding can take a zero distance slightly below zero
+    return np.maximum(distances, 0)
+
+
+class BaseSurrogateModel:
+    """
+    Cheap approximation of the objective function, fitted on the individuals
+    evaluated so far. The decision variables are scaled to [0, 1] over the
+    training points so that wide and narrow bounds weigh the same
+    """
+    def fit(self, individuals: np.ndarray, fitness: np.ndarray):
+        self.offset = individuals.min(axis=0)
+        span = individuals.max(axis=0) - self.offset
+        self.scale = np.where(span > 0, span, 1)
+        self._fit(self._normalize(individuals), fitness)
+
+    def predict(self, individuals: np.ndarray) -> np.ndarray:
+        return self._predict(self._normalize(individuals))
+
+    def _normalize(self, individuals: np.ndarray) -> np.ndarray:
+        return (individuals - self.offset) / self.scale
+
+    def _fit(self, individuals: np.ndarray, fitness: np.ndarray):
+        raise NotImplementedError()
+
+    def _predict(self, individuals: np.ndarray) -> np.ndarray:
+        raise NotImplementedError()
+
+
+class KNearestNeighbours(BaseSurrogateModel):
+    """
+    Inverse distance weighted mean fitness of the k nearest training points
+    """
+    def __init__(self, k: int = 5) -> None:
+        if k < 1:
+            raise ValueError("k must be at least 1")
+        self.k = k
+
+    def _fit(self, individuals: np.ndarray, fitness: np.ndarray):
+        self.individuals = individuals
+        self.fitness = fitness
+
+    def _predict(self, individuals: np.ndarray) -> np.ndarray:
+        k = min(self.k, len(self.fitness))
+        distances = squared_distances(individuals, self.individuals)
+        nearest = np.argpartition(distances, k - 1, axis=1)[:, :k]
+        distances = np.sqrt(np.take_along_axis(distances, nearest, axis=1))
+
+        # a training point at distance zero takes all the weight
+        exact = distances == 0
+        weights = np.where(exact.any(axis=1, keepdims=True), exact, 1 / np.where(exact, 1, distances))
+        return (weights * self.fitness[nearest]).sum(axis=1) / weights.sum(axis=1)
+
+
+class RadialBasisFunction(BaseSurrogateModel):
+    """
+    Gaussian radial basis function interpolation around the mean fitness.
+    The width defaults to the mean distance between training points and
+    smoothing regularizes the system against duplicate points
+    """
+    def __init__(self, width: float | None = None, smoothing: float = 1e-8) -> None:
+        self.width = width
+        self.smoothing = smoothing
+
+    def _fit(self, individuals: np.ndarray, fitness: np.ndarray):
+        distances = squared_distances(individuals, individuals)
+        width = self.width
+        if width is None:
+            width = float(np.sqrt(distances).mean()) or 1.0
+
+        self.gamma = 1 / (2 * width ** 2)
+        self.centers = individuals
+        self.mean = fitness.mean()
+
+        kernel = np.exp(-self.gamma * distances)
+        kernel[np.diag_indices_from(kernel)] += self.smoothing
+        self.weights = np.linalg.lstsq(kernel, fitness - self.mean, rcond=None)[0]
+
+    def _predict(self, individuals: np.ndarray) -> np.ndarray:
+        return self.mean + np.exp(-self.gamma * squared_distances(individuals, self.centers)) @ self.weights
+
+
+class SurrogateScreening:
+    """
+    Pre-screens offspring with a surrogate model so that only the most
+    promising evaluated_fraction of every generation goes to the objective
+    function, the others keep their predicted fitness.
+
+    Every individual the objective function evaluates is added to an archive
+    of the archive_size most recent ones, and the model is refitted on it
+    every retrain_interval generations once it holds min_archive_size
+    individuals. Until then every offspring is evaluated.
+
+    history has one record per screened generation with the number of
+    evaluated and predicted offspring, the mean absolute error of the
+    predictions for the evaluated ones and the rank correlation between
+    their predicted and true fitness
+    """
+    def __init__(
+        self,
+        model: BaseSurrogateModel | None = None,
+        evaluated_fraction: float = 0.5,
+        retrain_interval: int = 1,
+        archive_size: int = 1000,
+        min_archive_size: int = 10,
+    ) -> None:
+        if not 0 < evaluated_fraction <= 1:
+            raise ValueError("evaluated_fraction must be in (0, 1]")
+        if retrain_interval < 1:
+            raise ValueError("retrain_interval must be at least 1")
+        if not 1 <= min_archive_size <= archive_size:
+            raise ValueError("min_archive_size must be between 1 and archive_size")
+
+        self.model = KNearestNeighbours() if model is None else model
+        self.evaluated_fraction = evaluated_fraction
+        self.retrain_interval = retrain_interval
+        self.archive_size = archive_size
+        self.min_archive_size = min_archive_size
+        self.reset()
+
+    def reset(self):
+        self.archive_individuals: np.ndarray | None = None
+        self.archive_fitness = np.empty(0)
+        self.archive_length = 0
+        self.trained_at: int | None = None
+        self.history: list[dict] = []
+        # the archive is a ring buffer, this is the next slot to overwrite
+        self.__next = 0
+
+    def get_state(self) -> dict:
+        return {
+            "individuals": None if self.archive_individuals is None else self.archive_individuals[:self.archive_length].copy(),
+            "fitness": self.archive_fitness[:self.archive_length].copy(),
+            "history": self.history,
+        }
+
+    def set_state(self, state: dict):
+        # the model is not saved, it is refitted on the restored archive
+        self.reset()
+        if state["individuals"] is not None:
+            self.record(state["individuals"], state["fitness"])
+        self.history = list(state["history"])
+
+    def record(self, individuals: list[Individual] | np.ndarray, fitness: list[float] | np.ndarray):
+        """
+        Add evaluated individuals to the archive
+        """
+        individuals = np.asarray(individuals, dtype=np.float64)
+        if len(individuals) == 0:
+            return
+        if self.archive_individuals is None:
+            self.archive_individuals = np.empty((self.archive_size, individuals.shape[1]))
+            self.archive_fitness = np.empty(self.archive_size)
+
+        # only the last archive_size of a large batch would survive
+        individuals = individuals[-self.archive_size:]
+        fitness = np.asarray(fitness, dtype=np.float64)[-self.archive_size:]
+        slots = (self.__next + np.arange(len(individuals))) % self.archive_size
+        self.archive_individuals[slots] = individuals
+        self.archive_fitness[slots] = fitness
+        self.__next = int(slots[-1] + 1) % self.archive_size
+        self.archive_length = min(self.archive_length + len(individuals), self.archive_size)
+
+    def screen(self, generation: int, offspring: list[Individual] | np.ndarray, optimization: BaseOptimization) -> tuple[np.ndarray, np.ndarray] | None:
+        """
+        Rows of the offspring to evaluate, in increasing order, and the
+        predicted fitness of all of them, or None when the model is not
+        trained yet
+        """
+        if self.archive_length < self.min_archive_size or len(offspring) == 0:
+            return None
+        if self.trained_at is None or generation - self.trained_at >= self.retrain_interval:
+            self.model.fit(self.archive_individuals[:self.archive_length], self.archive_fitness[:self.archive_length])
+            self.trained_at = generation
+
+        predicted_fitness = self.model.predict(np.asarray(offspring, dtype=np.float64))
+        number_evaluated = max(1, int(np.ceil(self.evaluated_fraction * len(offspring))))
+        # a partial sort is enough, the evaluation order is restored after
+        scores = optimization.scores(predicted_fitness)
+        rows = np.sort(np.argpartition(-scores, number_evaluated - 1)[:number_evaluated])
+        return rows, predicted_fitness
+
+    def record_error(self, generation: int, number_predicted: int, predicted_fitness: np.ndarray, fitness: list[float] | np.ndarray):
+        """
+        Compare the predictions for the evaluated offspring to their fitness
+        """
+        fitness = np.asarray(fitness, dtype=np.float64)
+        if len(fitness) == 0:
+            return
+        self.history.append({
+            "generation": generation,
+            "evaluated": len(fitness),
+            "predicted": number_predicted,
+            "mean_absolute_error": float(np.abs(predicted_fitness - fitness).mean()),
+            "rank_correlation": rank_correlation(predicted_fitness, fitness),
+        })
+
+
+def rank_correlation(a: np.ndarray, b: np.ndarray) -> float:
+    """
+    Spearman correlation without tie correction, nan for fewer than two
+    values or constant ones
+    """
+    if len(a) < 2:
+        return float("nan")
+    ranks_a = np.argsort(np.argsort(a, kind="stable"), kind="stable").astype(np.float64)
+    ranks_b = np.argsort(np.argsort(b, kind="stable"), kind="stable").astype(np.float64)
+    if np.all(a == a[0]) or np.all(b == b[0]):
+        return float("nan")
+    return float(np.corrcoef(ranks_a, ranks_b)[0, 1])
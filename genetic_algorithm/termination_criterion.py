@@ -1,14 +1,66 @@
+from .optimization import BaseOptimization, Maximization
+from .type import Individual
+
+
+class RunState:
+    """
+    What a termination criterion knows about the run when it is asked
+    """
+    def __init__(
+        self,
+        number_of_generation: int = 0,
+        optimal_fitness: float | None = None,
+        optimal_individual: Individual | None = None,
+        number_of_evaluations: int = 0,
+        number_of_cache_hits: int = 0,
+        elapsed_seconds: float = 0.0,
+        optimization: BaseOptimization = Maximization(),
+    ) -> None:
+        self.number_of_generation = number_of_generation
+        self.optimal_fitness = optimal_fitness
+        self.optimal_individual = optimal_individual
+        # individuals passed to the objective function, cache hits are free
+        self.number_of_evaluations = number_of_evaluations
+        self.number_of_cache_hits = number_of_cache_hits
+        self.elapsed_seconds = elapsed_seconds
+        self.optimization = optimization
+
+
 class BaseTerminationCriterion:
-    def should_terminate(self, number_of_generation: int, optimal_fitness: float) -> bool:
+    def should_terminate(self, state: RunState) -> bool:
         return False
 
+    def time_remaining(self, state: RunState) -> float | None:
+        """
+        Seconds after which should_terminate will hold whatever else
+        happens, None if it does not depend on time. The engine stops
+        evaluating a generation once they have passed
+        """
+        return None
+
+    def get_state(self) -> dict:
+        """
+        Internal state to save in a checkpoint
+        """
+        return {}
+
+    def set_state(self, state: dict):
+        pass
+
+
+def _require_single_objective(criterion: BaseTerminationCriterion, state: RunState):
+    # the optimal fitness of a multi-objective run is a whole front, and its
+    # optimization one direction per objective
+    if not isinstance(state.optimization, BaseOptimization):
+        raise TypeError(f"{type(criterion).__name__} compares single fitness values, it does not apply to multi-objective runs")
+
 
 class NumberOfGeneration(BaseTerminationCriterion):
     def __init__(self, max_number_of_generation) -> None:
         self.max_number_of_generation = max_number_of_generation
     
-    def should_terminate(self, number_of_generation: int, optimal_fitness: float) -> bool:
-        return number_of_generation >= self.max_number_of_generation
+    def should_terminate(self, state: RunState) -> bool:
+        return state.number_of_generation >= self.max_number_of_generation
 
 
 class ThresholdDifference(BaseTerminationCriterion):
@@ -16,7 +68,9 @@ class ThresholdDifference(BaseTerminationCriterion):
         self.threshold = threshold
         self.previous_optimal_fitness = None
     
-    def should_terminate(self, number_of_generation: int, optimal_fitness: float) -> bool:
+    def should_terminate(self, state: RunState) -> bool:
+        _require_single_objective(self, state)
+        optimal_fitness = state.optimal_fitness
         if self.previous_optimal_fitness is None:
             self.previous_optimal_fitness = optimal_fitness
             return False
@@ -25,14 +79,141 @@ class ThresholdDifference(BaseTerminationCriterion):
         self.previous_optimal_fitness = optimal_fitness
         return is_within_threshold
 
+    def get_state(self) -> dict:
+        return {"previous_optimal_fitness": self.previous_optimal_fitness}
+
+    def set_state(self, state: dict):
+        self.previous_optimal_fitness = state["previous_optimal_fitness"]
+
+
+class MaxEvaluations(BaseTerminationCriterion):
+    """
+    Stops once max_evaluations individuals have been passed to the objective
+    function. Fitness served from the cache does not count. The last
+    generation may go over the budget by less than one population
+    """
+    def __init__(self, max_evaluations: int) -> None:
+        self.max_evaluations = max_evaluations
+
+    def should_terminate(self, state: RunState) -> bool:
+        return state.number_of_evaluations >= self.max_evaluations
+
+
+class MaxRuntime(BaseTerminationCriterion):
+    """
+    Stops once the run has taken max_seconds of wall-clock time, counting
+    the time before a checkpoint it was resumed from. A generation whose
+    evaluation is still going at that point is cut short
+    """
+    def __init__(self, max_seconds: float) -> None:
+        self.max_seconds = max_seconds
+
+    def should_terminate(self, state: RunState) -> bool:
+        return state.elapsed_seconds >= self.max_seconds
+
+    def time_remaining(self, state: RunState) -> float | None:
+        return self.max_seconds - state.elapsed_seconds
+
+
+class EarlyStopping(BaseTerminationCriterion):
+    """
+    Stops when the optimal fitness has not improved on the best seen so far
+    by more than min_delta for patience generations in a row
+    """
+    def __init__(self, patience: int, min_delta: float = 0.0) -> None:
+        if patience < 1:
+            raise ValueError("patience must be at least 1")
+
+        self.patience = patience
+        self.min_delta = min_delta
+        self.best_score = None
+        self.stagnant_generations = 0
+
+    def should_terminate(self, state: RunState) -> bool:
+        _require_single_objective(self, state)
+        if state.optimal_fitness is None:
+            return False
+
+        # larger scores are better whatever the optimization
+        score = float(state.optimization.scores([state.optimal_fitness])[0])
+        if self.best_score is None or score > self.best_score + self.min_delta:
+            self.best_score = score
+            self.stagnant_generations = 0
+            return False
+
+        self.stagnant_generations += 1
+        return self.stagnant_generations >= self.patience
+
+    def get_state(self) -> dict:
+        return {"best_score": self.best_score, "stagnant_generations": self.stagnant_generations}
+
+    def set_state(self, state: dict):
+        self.best_score = state["best_score"]
+        self.stagnant_generations = state["stagnant_generations"]
+
+
+class TargetFitnessReached(BaseTerminationCriterion):
+    """
+    Stops once the optimal fitness is at least as good as target_fitness
+    """
+    def __init__(self, target_fitness: float) -> None:
+        self.target_fitness = target_fitness
+
+    def should_terminate(self, state: RunState) -> bool:
+        _require_single_objective(self, state)
+        if state.optimal_fitness is None:
+            return False
+        return not state.optimization.is_optimal(self.target_fitness, state.optimal_fitness)
+
+
 class OrTermination(BaseTerminationCriterion):
     def __init__(self, *args) -> None:
         super().__init__()
 
         self.terminators: list[BaseTerminationCriterion] = args;
 
-    def should_terminate(self, number_of_generation: int, optimal_fitness: float) -> bool:
+    def should_terminate(self, state: RunState) -> bool:
         for terminator in self.terminators:
-            if terminator.should_terminate(number_of_generation, optimal_fitness):
+            if terminator.should_terminate(state):
                 return True
         return False
+
+    def time_remaining(self, state: RunState) -> float | None:
+        remaining = [terminator.time_remaining(state) for terminator in self.terminators]
+        remaining = [seconds for seconds in remaining if seconds is not None]
+        return min(remaining) if remaining else None
+
+    def get_state(self) -> dict:
+        return {"terminators": [terminator.get_state() for terminator in self.terminators]}
+
+    def set_state(self, state: dict):
+        for terminator, terminator_state in zip(self.terminators, state["terminators"]):
+            terminator.set_state(terminator_state)
+
+
+class AndTermination(BaseTerminationCriterion):
+    """
+    Stops when all of its criteria hold. Every criterion is asked every
+    generation, so stateful ones keep track even while another one is false
+    """
+    def __init__(self, *args) -> None:
+        super().__init__()
+
+        self.terminators: list[BaseTerminationCriterion] = args
+
+    def should_terminate(self, state: RunState) -> bool:
+        return all([terminator.should_terminate(state) for terminator in self.terminators])
+
+    def time_remaining(self, state: RunState) -> float | None:
+        # only time bound when every criterion is
+        remaining = [terminator.time_remaining(state) for terminator in self.terminators]
+        if not remaining or None in remaining:
+            return None
+        return max(remaining)
+
+    def get_state(self) -> dict:
+        return {"terminators": [terminator.get_state() for terminator in self.terminators]}
+
+    def set_state(self, state: dict):
+        for terminator, terminator_state in zip(self.terminators, state["terminators"]):
+            terminator.set_state(terminator_state)
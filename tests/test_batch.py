@@ -0,0 +1,66 @@
+from functools import partial
+
+import numpy as np
+import pytest
+from ga import GeneticAlgorithm
+from genetic_algorithm.batch import BatchRunner
+from genetic_algorithm.chromosome_decoder import BinaryChromosomeDecoder
+from genetic_algorithm.crossover import SinglePointCrossover
+from genetic_algorithm.optimization import Minimization
+from genetic_algorithm.selection import TournamentSelection
+from genetic_algorithm.termination_criterion import NumberOfGeneration
+
+
+def objective(x):
+    return x[0] ** 2 + x[1] ** 2
+
+
+def make_ga(crossover_probability, number_of_generation=8):
+    return GeneticAlgorithm(
+        population_size=20,
+        objective_function=objective,
+        chromosome_decoder=BinaryChromosomeDecoder(6, 2, [-3, -3], [3, 3]),
+        termination=NumberOfGeneration(number_of_generation),
+        optimization=Minimization(),
+        selection=TournamentSelection(2),
+        crossover=SinglePointCrossover(crossover_probability),
+    )
+
+
+def test_batch_runner_streams_every_run_and_summarizes():
+    runner = BatchRunner(
+        {"low": partial(make_ga, 0.5), "high": partial(make_ga, 0.9, 5)},
+        repeats=4,
+        seed=7,
+        max_workers=2,
+        optimization=Minimization(),
+    )
+
+    streamed = list(runner.run())
+
+    assert len(streamed) == 8
+    assert sorted((result.configuration, result.run) for result in streamed) == sorted((name, run) for name in ["low", "high"] for run in range(4))
+    for result in streamed:
+        generations = 8 if result.configuration == "low" else 5
+        assert result.number_of_generation == generations
+        assert [generation for generation, _ in result.trace] == list(range(1, generations + 1))
+        assert result.optimal_fitness == pytest.approx(objective(result.optimal_individual))
+
+    summary = runner.summary(quantiles=[0.5])
+    for name in ["low", "high"]:
+        fitness = [result.optimal_fitness for result in streamed if result.configuration == name]
+        assert summary[name]["runs"] == 4
+        assert summary[name]["best"] == min(fitness)
+        assert summary[name]["mean"] == pytest.approx(np.mean(fitness))
+        assert summary[name]["quantiles"][0.5] == pytest.approx(np.median(fitness))
+
+
+def test_batch_runs_are_reproducible():
+    def run():
+        runner = BatchRunner({"ga": partial(make_ga, 0.8)}, repeats=3, seed=11, max_workers=3, optimization=Minimization())
+        return sorted((result.run, tuple(result.trace)) for result in runner.run_all())
+
+    first = run()
+    assert first == run()
+    # every run has its own seed
+    assert len({trace for _, trace in first}) == 3
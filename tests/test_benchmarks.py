@@ -0,0 +1,41 @@
+import numpy as np
+import pytest
+from benchmarks.functions import PROBLEMS, ackley, rastrigin, rosenbrock, sphere
+from benchmarks.suite import OPERATORS, compare, run_suite, sweep
+
+
+@pytest.mark.parametrize("function, optimum", [(sphere, 0), (rastrigin, 0), (ackley, 0)])
+def test_functions_accept_individuals_and_populations(function, optimum):
+    assert function([0.0, 0.0, 0.0]) == pytest.approx(optimum)
+    assert np.allclose(function(np.zeros((4, 3))), optimum)
+    assert rosenbrock(np.ones((2, 3))).tolist() == [0, 0]
+
+
+def test_sweep_only_pairs_compatible_operators():
+    configs = sweep(problems=["sphere", "lab_polynomial"], population_sizes=[10], chromosome_lengths=[8, 12])
+    assert all(config["decoder"] in OPERATORS[config["operators"]][2] for config in configs)
+    assert all(config["chromosome_length"] is None for config in configs if config["decoder"] == "identity")
+    assert {config["dimensions"] for config in configs if config["problem"] == "lab_polynomial"} == {PROBLEMS["lab_polynomial"].dimensions}
+
+
+@pytest.mark.parametrize("vectorized", [False, True])
+def test_run_suite_reports_metrics(vectorized):
+    configs = sweep(problems=["sphere"], population_sizes=[10], chromosome_lengths=[8], generations=4, vectorized=vectorized)
+    results = run_suite(configs, isolate=False)["results"]
+
+    assert len(results) == len(configs)
+    for result in results:
+        assert result["evaluations"] == 40
+        assert result["generations_per_second"] > 0
+        assert {"evaluation", "selection", "crossover", "mutation"} <= set(result["operator_seconds"])
+        assert [evaluations for evaluations, _ in result["convergence"]] == [10, 20, 30, 40]
+        assert result["convergence"][-1][1] == result["best_fitness"]
+
+
+def test_compare_flags_regressions():
+    result = {"name": "a", "generations_per_second": 100.0, "evaluations_per_second": 1000.0, "peak_rss_kib": 1000, "best_fitness": 1.0, "maximize": False}
+    slower = dict(result, generations_per_second=50.0, best_fitness=1.05)
+
+    assert compare({"results": [result]}, {"results": [result]}) == []
+    assert [regression["metric"] for regression in compare({"results": [result]}, {"results": [slower]})] == ["generations_per_second"]
+    assert [regression["metric"] for regression in compare({"results": [result]}, {"results": [slower]}, tolerance=0.01)] == ["generations_per_second", "best_fitness"]
@@ -0,0 +1,97 @@
+import pytest
+from ga import GeneticAlgorithm
+from genetic_algorithm.chromosome_decoder import BinaryChromosomeDecoder
+from genetic_algorithm.callbacks.base import Callback
+from genetic_algorithm.callbacks.decorators import on_generation_end
+from genetic_algorithm.callbacks.print_logger import PrintBestFitness
+from genetic_algorithm.termination_criterion import NumberOfGeneration
+
+
+class Recorder(Callback):
+    def __init__(self, requires=None, every=1) -> None:
+        self.requires = requires
+        self.every = every
+        self.calls = []
+
+    def on_generation_start(self, generation, best_fitness, best_individual, population):
+        self.calls.append(("start", generation, best_fitness, best_individual, population))
+
+    def on_evaluation_end(self, generation, population_fitness, cache_info):
+        self.calls.append(("evaluation", generation, population_fitness))
+
+    def on_generation_end(self, generation, best_fitness, best_individual, population):
+        self.calls.append(("end", generation, best_fitness, best_individual, population))
+
+    def on_evolution_end(self, generation, best_fitness, best_individual, population):
+        self.calls.append(("evolution", generation, best_fitness, best_individual, population))
+
+
+def run_with(callbacks, vectorized=False, persistent_genotypes=False):
+    ga = GeneticAlgorithm(
+        population_size=10,
+        objective_function=(lambda population: population.sum(axis=1)) if vectorized else (lambda x: x[0] + x[1]),
+        chromosome_decoder=BinaryChromosomeDecoder(
+            number_of_bytes=6,
+            number_of_decision_variables=2,
+            lower_bounds=[2, -1],
+            upper_bounds=[6, 4]
+        ),
+        termination=NumberOfGeneration(6),
+        callbacks=callbacks,
+        vectorized=vectorized,
+        persistent_genotypes=persistent_genotypes,
+        seed=0,
+    )
+    ga.run()
+    return ga
+
+
+def test_undeclared_callbacks_get_every_field():
+    recorder = Recorder()
+    run_with([recorder])
+
+    assert len(recorder.calls) == 6 * 3 + 1
+    # nothing has been evaluated when the first generation starts
+    assert all(value is not None for call in recorder.calls[1:] for value in call[2:])
+
+
+def test_only_requested_fields_are_built():
+    recorder = Recorder(requires=frozenset({"best_fitness"}))
+    run_with([recorder], vectorized=True, persistent_genotypes=True)
+
+    for call in recorder.calls:
+        if call[0] == "evaluation":
+            assert call[2] is None
+        else:
+            assert call[3] is None and call[4] is None
+            assert call[0] == "start" or call[2] is not None
+
+
+def test_requested_fields_are_merged_across_callbacks():
+    lean, full = Recorder(requires=frozenset()), Recorder(requires=frozenset({"population"}))
+    run_with([lean, full])
+
+    assert all(call[-1] is not None for call in lean.calls if call[0] in ("end", "evolution"))
+
+
+@pytest.mark.parametrize("every", [2, 3])
+def test_hooks_only_fire_every_n_generations(every):
+    recorder = Recorder(every=every)
+    run_with([recorder])
+
+    # the hooks of a generation come together, on_generation_end is passed
+    # the number of generations completed
+    hooks = [(call[0], call[1]) for call in recorder.calls]
+    expected = [(hook, generation + offset) for generation in range(every - 1, 6, every) for hook, offset in [("start", 0), ("evaluation", 0), ("end", 1)]]
+    assert hooks == expected + [("evolution", 6)]
+
+
+def test_builtin_callbacks(capsys):
+    seen = []
+    callbacks = [PrintBestFitness(every=3), on_generation_end(every=2)(lambda generation, population, best_individual: seen.append(generation))]
+    run_with(callbacks)
+
+    assert seen == [2, 4, 6]
+    output = capsys.readouterr().out.splitlines()
+    assert [line.split(":")[0] for line in output[:-1]] == ["Generation 3", "Generation 6"]
+    assert output[-1].startswith("Best Fitness = ")
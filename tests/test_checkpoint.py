@@ -0,0 +1,79 @@
+import numpy as np
+import pytest
+from ga import GeneticAlgorithm
+from genetic_algorithm.checkpoint import Checkpointer, load_checkpoint, save_checkpoint
+from genetic_algorithm.chromosome_decoder import BinaryChromosomeDecoder
+from genetic_algorithm.termination_criterion import AndTermination, EarlyStopping, NumberOfGeneration, OrTermination, RunState, ThresholdDifference
+
+
+def make_ga(max_number_of_generation, vectorized, persistent_genotypes, checkpointer=None, seed=0):
+    return GeneticAlgorithm(
+        population_size=20,
+        objective_function=(lambda population: population.sum(axis=1)) if vectorized else (lambda x: x[0] + x[1]),
+        chromosome_decoder=BinaryChromosomeDecoder(
+            number_of_bytes=6,
+            number_of_decision_variables=2,
+            lower_bounds=[2, -1],
+            upper_bounds=[6, 4]
+        ),
+        termination=NumberOfGeneration(max_number_of_generation),
+        vectorized=vectorized,
+        persistent_genotypes=persistent_genotypes,
+        checkpointer=checkpointer,
+        seed=seed,
+    )
+
+
+def test_checkpoint_round_trip(tmp_path):
+    path = tmp_path / "state.npz"
+    state = {
+        "array": np.arange(6).reshape(2, 3),
+        "nested": {"value": None, "items": [1.5, float("inf"), np.zeros(2)]},
+    }
+    save_checkpoint(path, state)
+    restored = load_checkpoint(path)
+
+    assert (restored["array"] == state["array"]).all()
+    assert restored["nested"]["value"] is None
+    assert restored["nested"]["items"][:2] == [1.5, float("inf")]
+    assert (restored["nested"]["items"][2] == 0).all()
+    assert list(tmp_path.iterdir()) == [path]
+
+
+@pytest.mark.parametrize("vectorized,persistent_genotypes", [(False, False), (True, False), (False, True), (True, True)])
+def test_resumed_run_matches_uninterrupted_run(tmp_path, vectorized, persistent_genotypes):
+    path = tmp_path / "ga.npz"
+
+    uninterrupted = make_ga(10, vectorized, persistent_genotypes)
+    uninterrupted.run()
+
+    make_ga(5, vectorized, persistent_genotypes, Checkpointer(path, every_n_generations=2)).run()
+
+    resumed = make_ga(10, vectorized, persistent_genotypes, seed=1)
+    resumed.run(resume_from=path)
+
+    assert resumed.number_of_generation == 10
+    assert resumed.result[0] == uninterrupted.result[0]
+    assert np.array_equal(resumed.population, uninterrupted.population)
+
+
+def test_failed_write_is_raised(tmp_path):
+    ga = make_ga(10, False, False, Checkpointer(tmp_path / "missing" / "ga.npz", every_n_generations=1))
+    with pytest.raises(FileNotFoundError):
+        ga.run()
+
+    # the writer has stopped, closing again does not wait for it
+    ga.checkpointer.close()
+
+
+def test_terminator_state_is_restored():
+    terminator = OrTermination(NumberOfGeneration(10), AndTermination(ThresholdDifference(0.05), EarlyStopping(3)))
+    terminator.should_terminate(RunState(number_of_generation=1, optimal_fitness=3.5))
+    terminator.should_terminate(RunState(number_of_generation=2, optimal_fitness=3.0))
+
+    restored = OrTermination(NumberOfGeneration(10), AndTermination(ThresholdDifference(0.05), EarlyStopping(3)))
+    restored.set_state(terminator.get_state())
+
+    threshold, early_stopping = restored.terminators[1].terminators
+    assert threshold.previous_optimal_fitness == 3.0
+    assert (early_stopping.best_score, early_stopping.stagnant_generations) == (3.5, 1)
@@ -1,3 +1,4 @@
+import numpy as np
 import pytest
 from genetic_algorithm.chromosome_decoder import BinaryChromosomeDecoder, DenaryChromosomeDecoder
 
@@ -64,3 +65,113 @@ def test_denary_chromosome_decoding_with_1_integer_3_dp(x, value):
         dp=4
     )
     assert dec_encoding.encode(x) == value
+
+
+@pytest.mark.parametrize("number_of_bytes", [5, 10, 32])
+def test_binary_chromosome_batch_matches_scalar(number_of_bytes):
+    bin_encoding = BinaryChromosomeDecoder(
+        number_of_bytes=number_of_bytes,
+        number_of_decision_variables=3,
+        lower_bounds=[10, 0, -20],
+        upper_bounds=[90, 90, 60]
+    )
+    population = np.random.default_rng(0).uniform([10, 0, -20], [90, 90, 60], size=(50, 3))
+    population[0] = [10, 0, -20]
+    population[1] = [90, 90, 60]
+
+    genotypes = bin_encoding.encode_batch(population)
+    assert genotypes.dtype == np.uint8
+    assert genotypes.tolist() == [bin_encoding.encode(x) for x in population.tolist()]
+    assert bin_encoding.decode_batch(genotypes).tolist() == [bin_encoding.decode(c) for c in genotypes.tolist()]
+
+    packed = bin_encoding.encode_batch(population, packed=True)
+    assert packed.shape == (50, 3)
+    assert (bin_encoding.pack(genotypes) == packed).all()
+    assert (bin_encoding.unpack(packed) == genotypes).all()
+    assert (bin_encoding.decode_batch(packed) == bin_encoding.decode_batch(genotypes)).all()
+
+
+@pytest.mark.parametrize("number_of_bytes", [6, 20])
+def test_binary_chromosome_encoding_inverts_decoding(number_of_bytes):
+    bin_encoding = BinaryChromosomeDecoder(
+        number_of_bytes=number_of_bytes,
+        number_of_decision_variables=2,
+        lower_bounds=[2, -1],
+        upper_bounds=[6, 4]
+    )
+    codes = np.random.default_rng(0).integers(0, 2**number_of_bytes, size=(4096, 2), dtype=np.uint64)
+    genotypes = bin_encoding.unpack(codes)
+
+    assert (bin_encoding.encode_batch(bin_encoding.decode_batch(genotypes)) == genotypes).all()
+    assert [bin_encoding.encode(bin_encoding.decode(chromosome)) for chromosome in genotypes[:500].tolist()] == genotypes[:500].tolist()
+
+
+def test_binary_chromosome_encoding_rounds_to_the_nearest_code():
+    bin_encoding = BinaryChromosomeDecoder(
+        number_of_bytes=4,
+        number_of_decision_variables=1,
+        lower_bounds=[0],
+        upper_bounds=[15]
+    )
+    # one unit per code
+    values = np.array([[4.4], [4.6], [0.2], [14.8]])
+    assert bin_encoding.pack(bin_encoding.encode_batch(values)).ravel().tolist() == [4, 5, 0, 15]
+    assert [bin_encoding.encode(x) for x in values.tolist()] == bin_encoding.encode_batch(values).tolist()
+
+
+def test_binary_chromosome_batch_encoding_out_of_bounds():
+    bin_encoding = BinaryChromosomeDecoder(
+        number_of_bytes=6,
+        number_of_decision_variables=2,
+        lower_bounds=[2, -1],
+        upper_bounds=[6, 4]
+    )
+    with pytest.raises(ValueError):
+        bin_encoding.encode_batch(np.array([[3.0, 1.0], [7.0, 1.0]]))
+
+
+@pytest.mark.parametrize("number_of_bytes, dp, lower_bounds, upper_bounds", [
+    (4, 3, [0, 1, -2], [3, 5, 6]),
+    (10, 8, [10, 0, -20], [90, 90, 60]),
+    (6, 4, [-11, 8, -0.5], [5, 23, 0.5]),
+    (18, 10, [-1e6, -3, 0], [1e6, 3, 1]),
+])
+def test_denary_chromosome_batch_matches_scalar(number_of_bytes, dp, lower_bounds, upper_bounds):
+    dec_encoding = DenaryChromosomeDecoder(
+        number_of_bytes=number_of_bytes,
+        number_of_decision_variables=3,
+        lower_bounds=lower_bounds,
+        upper_bounds=upper_bounds,
+        dp=dp
+    )
+    rng = np.random.default_rng(0)
+    population = rng.uniform(lower_bounds, upper_bounds, size=(200, 3))
+    population[0] = lower_bounds
+    population[1] = upper_bounds
+    population[2] = np.clip(0.0, lower_bounds, upper_bounds)
+
+    genotypes = dec_encoding.encode_batch(population)
+    assert genotypes.dtype == np.uint8
+    assert genotypes.shape == (200, 3, number_of_bytes + 1)
+    assert genotypes.tolist() == [dec_encoding.encode(individual) for individual in population.tolist()]
+
+    # arbitrary digits, including negative zeros and values outside the bounds
+    digits = rng.integers(0, 10, size=(200, 3, number_of_bytes + 1), dtype=np.uint8)
+    digits[..., 0] %= 2
+    digits[:5, :, 1:] = 0
+    for chromosomes in (genotypes, digits):
+        decoded = dec_encoding.decode_batch(chromosomes)
+        expected = np.array([dec_encoding.decode(chromosome) for chromosome in chromosomes.tolist()], dtype=np.float64)
+        assert decoded.tobytes() == expected.tobytes()
+
+
+def test_denary_chromosome_batch_encoding_out_of_bounds():
+    dec_encoding = DenaryChromosomeDecoder(
+        number_of_bytes=4,
+        number_of_decision_variables=2,
+        lower_bounds=[0, 1],
+        upper_bounds=[3, 5],
+        dp=3
+    )
+    with pytest.raises(ValueError):
+        dec_encoding.encode_batch(np.array([[1.0, 2.0], [1.0, 6.0]]))
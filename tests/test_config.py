@@ -0,0 +1,119 @@
+import json
+import subprocess
+import sys
+
+import pytest
+from ga import GeneticAlgorithm, NSGA2
+from genetic_algorithm.__main__ import main
+from genetic_algorithm.callbacks.print_logger import PrintBestFitness
+from genetic_algorithm.chromosome_decoder import BinaryChromosomeDecoder
+from genetic_algorithm.config import build, build_component, load_config
+from genetic_algorithm.optimization import Minimization
+from genetic_algorithm.registry import REGISTRY, register, resolve
+from genetic_algorithm.selection import TournamentSelection
+from genetic_algorithm.termination_criterion import NumberOfGeneration, OrTermination, ThresholdDifference
+
+
+def objective(x):
+    return x[0] + x[1]
+
+
+CONFIG = """
+population_size = 20
+objective_function = "tests.test_config:objective"
+optimization = "minimization"
+selection = { type = "tournament", k = 3 }
+seed = 4
+chromosome_decoder = { type = "binary", number_of_bytes = 6, number_of_decision_variables = 2, lower_bounds = [2, -1], upper_bounds = [6, 4] }
+crossover = { type = "single_point", crossover_probability = 0.85 }
+fitness_cache = true
+callbacks = ["print_best_fitness"]
+
+[termination]
+type = "or"
+args = [{ type = "number_of_generation", max_number_of_generation = 5 }, { type = "threshold_difference", threshold = 0.05 }]
+"""
+
+
+def test_build_from_toml(tmp_path):
+    path = tmp_path / "run.toml"
+    path.write_text(CONFIG)
+
+    ga = build(load_config(str(path)))
+
+    assert isinstance(ga, GeneticAlgorithm)
+    assert ga.objective_function is objective
+    assert isinstance(ga.chromosome_decoder, BinaryChromosomeDecoder)
+    assert isinstance(ga.terminator, OrTermination)
+    assert [type(criterion) for criterion in ga.terminator.terminators] == [NumberOfGeneration, ThresholdDifference]
+    assert isinstance(ga.callbacks[0], PrintBestFitness)
+    assert ga.fitness_cache is not None
+
+    # the selection follows the optimization of the run unless told otherwise
+    assert isinstance(ga.selector, TournamentSelection) and ga.selector.k == 3
+    assert isinstance(ga.selector.optimization, Minimization)
+
+
+def test_build_nsga2_from_json(tmp_path):
+    config = {
+        "algorithm": "nsga2",
+        "population_size": 10,
+        "objective_function": "tests.test_multi_objective:schaffer",
+        "optimization": {"type": "multi_objective", "optimizations": ["minimization", "minimization"]},
+        "chromosome_decoder": {"type": "identity", "number_of_decision_variables": 1, "lower_bounds": [-10], "upper_bounds": [10]},
+        "crossover": {"type": "simulated_binary", "crossover_probability": 0.9, "lower_bounds": [-10], "upper_bounds": [10]},
+        "mutation": {"type": "polynomial", "mutation_probability": 0.5, "lower_bounds": [-10], "upper_bounds": [10]},
+        "termination": {"type": "number_of_generation", "max_number_of_generation": 3},
+    }
+    path = tmp_path / "run.json"
+    path.write_text(json.dumps(config))
+
+    ga = build(load_config(str(path)))
+    ga.run()
+
+    assert isinstance(ga, NSGA2)
+    assert isinstance(ga.optimization.optimizations[1], Minimization)
+    assert ga.pareto_fitness.shape[1] == 2
+
+
+def test_registry(monkeypatch):
+    # registered on a copy, so that later tests do not see it
+    monkeypatch.setitem(REGISTRY, "termination", dict(REGISTRY["termination"]))
+    register("termination", "generations", "genetic_algorithm.termination_criterion:NumberOfGeneration")
+    assert build_component("termination", {"type": "generations", "args": [7]}).max_number_of_generation == 7
+    assert resolve("optimization", "genetic_algorithm.optimization:Minimization") is Minimization
+
+    with pytest.raises(ValueError):
+        resolve("selection", "nonexistent")
+    with pytest.raises(ValueError):
+        load_config("run.yaml")
+
+
+def test_command_line(tmp_path, capsys):
+    path = tmp_path / "run.toml"
+    path.write_text(CONFIG.replace('callbacks = ["print_best_fitness"]', ""))
+    output = tmp_path / "result.json"
+
+    assert main([str(path), "--seed", "9", "--output", str(output)]) == 0
+
+    result = json.loads(output.read_text())
+    assert result["number_of_generation"] <= 5
+    assert result["optimal_fitness"] == pytest.approx(objective(result["optimal_individual"]))
+
+
+def test_command_line_does_not_import_plotting_or_tables(tmp_path):
+    path = tmp_path / "run.toml"
+    path.write_text(CONFIG)
+    code = (
+        "import sys; from genetic_algorithm.__main__ import main; main([sys.argv[1]]); "
+        "assert 'matplotlib' not in sys.modules and 'prettytable' not in sys.modules"
+    )
+    subprocess.run([sys.executable, "-c", code, str(path)], check=True, capture_output=True)
+
+
+def test_importing_ga_does_not_import_parallel_evaluation():
+    code = (
+        "import sys, ga; "
+        "assert not {'asyncio', 'concurrent.futures', 'multiprocessing.shared_memory'} & set(sys.modules)"
+    )
+    subprocess.run([sys.executable, "-c", code], check=True, capture_output=True)
@@ -0,0 +1,54 @@
+import numpy as np
+import pytest
+from genetic_algorithm.crossover import SinglePointCrossover, TwoPointCrossover, UniformCrossover
+
+CROSSOVERS = [SinglePointCrossover, TwoPointCrossover, UniformCrossover]
+
+
+def random_parents(seed=0, shape=(200, 3, 10)):
+    rng = np.random.default_rng(seed)
+    return rng.integers(0, 2, size=shape, dtype=np.uint8), rng.integers(0, 2, size=shape, dtype=np.uint8)
+
+
+@pytest.mark.parametrize("crossover", CROSSOVERS)
+def test_cross_batch_exchanges_alleles(crossover):
+    parents_a, parents_b = random_parents()
+    children_a, children_b = crossover(1, seed=0).cross_batch(parents_a, parents_b)
+
+    assert children_a.shape == parents_a.shape and children_a.dtype == np.uint8
+    # every position keeps the alleles of both parents
+    assert (np.minimum(children_a, children_b) == np.minimum(parents_a, parents_b)).all()
+    assert (np.maximum(children_a, children_b) == np.maximum(parents_a, parents_b)).all()
+    assert (children_a != parents_a).any()
+
+
+@pytest.mark.parametrize("crossover", CROSSOVERS)
+def test_cross_batch_without_crossover_probability(crossover):
+    parents_a, parents_b = random_parents()
+    children_a, children_b = crossover(0, seed=0).cross_batch(parents_a, parents_b)
+
+    assert (children_a == parents_a).all() and (children_b == parents_b).all()
+
+
+@pytest.mark.parametrize("crossover,segment", [(SinglePointCrossover, "suffix"), (TwoPointCrossover, "segment")])
+def test_cross_batch_swaps_contiguous_alleles(crossover, segment):
+    parents_a = np.zeros((500, 2, 8), dtype=np.uint8)
+    parents_b = np.ones((500, 2, 8), dtype=np.uint8)
+    children_a, _ = crossover(1, seed=0).cross_batch(parents_a, parents_b)
+
+    for gene in children_a.reshape(-1, 8).tolist():
+        swapped = "".join(map(str, gene)).strip("0")
+        assert gene[0] == 0
+        assert swapped and set(swapped) == {"1"}
+        if segment == "suffix":
+            assert gene[-1] == 1
+
+
+@pytest.mark.parametrize("crossover", CROSSOVERS)
+def test_cross_pairs(crossover):
+    parents_a, parents_b = random_parents(shape=(1, 3, 10))
+    parent1, parent2 = parents_a[0].tolist(), parents_b[0].tolist()
+    child1, child2 = crossover(1, seed=0).cross(parent1, parent2)
+
+    for gene1, gene2, child_gene1, child_gene2 in zip(parent1, parent2, child1, child2):
+        assert all(sorted((a, b)) == sorted((c, d)) for a, b, c, d in zip(gene1, gene2, child_gene1, child_gene2))
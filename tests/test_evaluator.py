@@ -0,0 +1,83 @@
+import asyncio
+import time
+
+import numpy as np
+import pytest
+from genetic_algorithm.evaluator import AsyncEvaluator, ProcessPoolEvaluator, SerialEvaluator, ThreadPoolEvaluator
+
+
+def objective(x):
+    return 2*x[0]*x[1]*x[2] - 4*x[0]*x[2] - 2*x[1]*x[2] + x[0]**2 + x[1]**2 + x[2]**2 - 2*x[0] - 4*x[1] + 4*x[2]
+
+
+def vectorized_objective(population):
+    return objective(population.T)
+
+
+def slow_objective(x):
+    time.sleep(0.2)
+    return objective(x)
+
+
+EVALUATORS = [
+    lambda: ThreadPoolEvaluator(max_workers=4),
+    lambda: ProcessPoolEvaluator(max_workers=2),
+    lambda: ProcessPoolEvaluator(max_workers=2, chunksize=7),
+]
+
+
+@pytest.mark.parametrize("make_evaluator", EVALUATORS)
+def test_evaluator_matches_serial_order(make_evaluator):
+    population = np.random.default_rng(0).uniform([10, 0, -20], [90, 90, 60], size=(101, 3))
+    expected = SerialEvaluator().evaluate(objective, population.tolist())
+
+    with make_evaluator() as evaluator:
+        assert evaluator.evaluate(objective, population.tolist()) == expected
+        assert evaluator.evaluate(vectorized_objective, population, vectorized=True).tolist() == expected
+        assert evaluator.evaluate(objective, []) == []
+
+
+def test_process_pool_evaluator_deadline():
+    population = np.random.default_rng(0).uniform([10, 0, -20], [90, 90, 60], size=(6, 3)).tolist()
+
+    with ProcessPoolEvaluator(max_workers=1, chunksize=1) as evaluator:
+        evaluator.evaluate(objective, population)
+        start = time.monotonic()
+        assert evaluator.evaluate(slow_objective, population, deadline=start + 0.1) == []
+        # the tasks already handed to the worker read the population before it is released
+        assert time.monotonic() - start >= 0.2
+        assert evaluator.evaluate(objective, population) == [objective(x) for x in population]
+
+
+def test_serial_evaluator_vectorized():
+    population = np.arange(12, dtype=np.float64).reshape(4, 3)
+    assert SerialEvaluator().evaluate(vectorized_objective, population, vectorized=True).tolist() == [objective(x) for x in population.tolist()]
+
+
+def test_async_evaluator_limits_concurrency():
+    in_flight = []
+    peak = []
+
+    async def async_objective(x):
+        in_flight.append(x)
+        peak.append(len(in_flight))
+        await asyncio.sleep(0.01)
+        in_flight.remove(x)
+        return objective(x)
+
+    population = np.random.default_rng(0).uniform([10, 0, -20], [90, 90, 60], size=(20, 3)).tolist()
+    population_fitness = AsyncEvaluator(max_concurrency=3).evaluate(async_objective, population)
+
+    assert population_fitness == [objective(x) for x in population]
+    assert max(peak) == 3
+
+
+def test_async_evaluator_timeout():
+    async def slow_objective(x):
+        await asyncio.sleep(1 if x[0] > 0 else 0)
+        return x[0]
+
+    population = [[-1.0], [1.0], [-2.0]]
+    assert AsyncEvaluator(timeout=0.05, timeout_fitness=float("-inf")).evaluate(slow_objective, population) == [-1.0, float("-inf"), -2.0]
+    with pytest.raises(TimeoutError):
+        AsyncEvaluator(timeout=0.05).evaluate(slow_objective, population)
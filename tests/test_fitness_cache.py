@@ -0,0 +1,30 @@
+import pytest
+from genetic_algorithm.fitness_cache import CacheInfo, FitnessCache
+
+
+def test_lookup_collapses_unknown_duplicates():
+    cache = FitnessCache()
+    cache.put("a", 1.0)
+
+    population_fitness, missing = cache.lookup(["a", "b", "c", "b", "a"])
+
+    assert population_fitness == [1.0, None, None, None, 1.0]
+    assert missing == {"b": [1, 3], "c": [2]}
+    assert cache.cache_info() == CacheInfo(hits=3, misses=2, maxsize=100_000, currsize=1)
+
+
+def test_least_recently_used_entry_is_evicted():
+    cache = FitnessCache(maxsize=2)
+    cache.put("a", 1.0)
+    cache.put("b", 2.0)
+    cache.lookup(["a"])
+    cache.put("c", 3.0)
+
+    assert "a" in cache and "c" in cache
+    assert "b" not in cache
+    assert len(cache) == 2
+
+
+def test_invalid_maxsize():
+    with pytest.raises(ValueError):
+        FitnessCache(maxsize=0)
@@ -0,0 +1,493 @@
+import asyncio
+
+import numpy as np
+import pytest
+from ga import GeneticAlgorithm
+from genetic_algorithm.chromosome_decoder import BinaryChromosomeDecoder
+from genetic_algorithm.crossover import SinglePointCrossover
+from genetic_algorithm.mutation import BitFlipMutation
+from genetic_algorithm.optimization import Maximization, Minimization
+from genetic_algorithm.selection import LinearRankSelection, TournamentSelection
+from genetic_algorithm.termination_criterion import NumberOfGeneration
+from genetic_algorithm.fitness_cache import FitnessCache
+from genetic_algorithm.callbacks.base import Callback
+from genetic_algorithm.callbacks.profiling import ProfilingCallback
+from genetic_algorithm.checkpoint import Checkpointer
+from genetic_algorithm.evaluator import AsyncEvaluator, ProcessPoolEvaluator, SerialEvaluator
+
+
+def objective(x):
+    return x[0] + x[1]
+
+
+def make_decoder():
+    return BinaryChromosomeDecoder(
+        number_of_bytes=6,
+        number_of_decision_variables=2,
+        lower_bounds=[2, -1],
+        upper_bounds=[6, 4]
+    )
+
+
+def test_per_individual_run():
+    ga = GeneticAlgorithm(
+        population_size=20,
+        objective_function=lambda x: x[0] + x[1],
+        chromosome_decoder=make_decoder(),
+        termination=NumberOfGeneration(5),
+    )
+    ga.run()
+
+    fitness, individual = ga.result
+    assert ga.number_of_generation == 5
+    assert len(ga.population) == 20
+    assert fitness == individual[0] + individual[1]
+
+
+def test_vectorized_run_evaluates_whole_population_at_once():
+    calls = []
+
+    def objective(population):
+        calls.append(population.shape)
+        return population.sum(axis=1)
+
+    ga = GeneticAlgorithm(
+        population_size=20,
+        objective_function=objective,
+        chromosome_decoder=make_decoder(),
+        termination=NumberOfGeneration(5),
+        vectorized=True,
+    )
+    ga.run()
+
+    fitness, individual = ga.result
+    assert calls == [(20, 2)] * 5
+    assert isinstance(ga.population, np.ndarray)
+    assert ga.population.shape == (20, 2)
+    assert fitness == individual.sum()
+
+
+def test_vectorized_best_individual_follows_optimization():
+    class EvaluationRecorder(Callback):
+        def __init__(self):
+            self.fitness = []
+
+        def on_evaluation_end(self, generation, population_fitness, cache_info):
+            self.fitness.append(np.array(population_fitness))
+
+    recorder = EvaluationRecorder()
+    ga = GeneticAlgorithm(
+        population_size=30,
+        objective_function=lambda population: population.sum(axis=1),
+        chromosome_decoder=make_decoder(),
+        termination=NumberOfGeneration(5),
+        optimization=Minimization(),
+        callbacks=[recorder],
+        vectorized=True,
+        seed=0,
+    )
+    ga.run()
+
+    fitness, individual = ga.result
+    # the best of the last generation
+    assert fitness == recorder.fitness[-1].min() < recorder.fitness[-1].max()
+    assert fitness == individual.sum()
+
+
+@pytest.mark.parametrize("vectorized", [False, True])
+def test_persistent_genotypes_are_not_requantized(vectorized):
+    class PopulationRecorder(Callback):
+        def __init__(self):
+            self.populations = []
+
+        def on_generation_start(self, generation, best_fitness, best_individual, population):
+            self.populations.append({tuple(individual) for individual in np.asarray(population).tolist()})
+
+    recorder = PopulationRecorder()
+    ga = GeneticAlgorithm(
+        population_size=20,
+        objective_function=(lambda population: population.sum(axis=1)) if vectorized else (lambda x: x[0] + x[1]),
+        chromosome_decoder=make_decoder(),
+        termination=NumberOfGeneration(10),
+        crossover=SinglePointCrossover(0),
+        mutation=BitFlipMutation(0),
+        callbacks=[recorder],
+        vectorized=vectorized,
+        persistent_genotypes=True,
+        seed=0,
+    )
+    ga.run()
+
+    # without crossover and mutation, every generation is made of copies of
+    # the initial genotypes, decoded to the very same individuals
+    initial_population = recorder.populations[0]
+    assert len(recorder.populations) == 10
+    assert all(population <= initial_population for population in recorder.populations)
+    assert {tuple(individual) for individual in np.asarray(ga.population).tolist()} <= initial_population
+
+
+def test_persistent_genotypes_run():
+    ga = GeneticAlgorithm(
+        population_size=20,
+        objective_function=lambda x: x[0] + x[1],
+        chromosome_decoder=make_decoder(),
+        termination=NumberOfGeneration(5),
+        persistent_genotypes=True,
+    )
+    ga.run()
+
+    fitness, individual = ga.result
+    assert len(ga.genotypes) == 20
+    assert ga.population == [ga.chromosome_decoder.decode(chromosome) for chromosome in ga.genotypes]
+    assert fitness == individual[0] + individual[1]
+
+
+@pytest.mark.parametrize("vectorized,persistent_genotypes", [(False, False), (True, False), (False, True), (True, True)])
+def test_fitness_cache_evaluates_each_genotype_once(vectorized, persistent_genotypes):
+    evaluated = []
+
+    def objective(x):
+        evaluated.extend(np.atleast_2d(x).tolist())
+        return x.sum(axis=1) if vectorized else x[0] + x[1]
+
+    class CacheInfoCallback(Callback):
+        def __init__(self):
+            self.cache_infos = []
+
+        def on_evaluation_end(self, generation, population_fitness, cache_info):
+            self.cache_infos.append(cache_info)
+
+    callback = CacheInfoCallback()
+    ga = GeneticAlgorithm(
+        population_size=50,
+        objective_function=objective,
+        chromosome_decoder=BinaryChromosomeDecoder(
+            number_of_bytes=3,
+            number_of_decision_variables=2,
+            lower_bounds=[2, -1],
+            upper_bounds=[6, 4]
+        ),
+        termination=NumberOfGeneration(10),
+        callbacks=[callback],
+        vectorized=vectorized,
+        persistent_genotypes=persistent_genotypes,
+        fitness_cache=FitnessCache(),
+    )
+    ga.run()
+
+    cache_info = callback.cache_infos[-1]
+    assert len(callback.cache_infos) == 10
+    assert cache_info.hits + cache_info.misses == 50 * 10
+    assert cache_info.misses == len(evaluated) == cache_info.currsize
+    # 3 bits per variable leave at most 64 distinct chromosomes, plus the
+    # initial population when the individuals are the keys
+    assert cache_info.misses <= 64 + (0 if persistent_genotypes else 50)
+
+
+class FitnessRecorder(Callback):
+    def __init__(self):
+        self.populations = []
+        self.fitness = []
+
+    def on_generation_start(self, generation, best_fitness, best_individual, population):
+        self.populations.append(np.array(population))
+
+    def on_evaluation_end(self, generation, population_fitness, cache_info):
+        self.fitness.append(np.array(population_fitness))
+
+
+@pytest.mark.parametrize("vectorized,persistent_genotypes", [(False, False), (True, False), (False, True), (True, True)])
+def test_cached_fitness_belongs_to_the_individual(vectorized, persistent_genotypes):
+    recorder = FitnessRecorder()
+    ga = GeneticAlgorithm(
+        population_size=50,
+        objective_function=(lambda population: population.sum(axis=1)) if vectorized else objective,
+        chromosome_decoder=make_decoder(),
+        termination=NumberOfGeneration(30),
+        callbacks=[recorder],
+        vectorized=vectorized,
+        persistent_genotypes=persistent_genotypes,
+        fitness_cache=FitnessCache(),
+        seed=0,
+    )
+    ga.run()
+
+    assert ga.number_of_cache_hits > 0
+    for population, population_fitness in zip(recorder.populations, recorder.fitness):
+        np.testing.assert_array_equal(population_fitness, population.sum(axis=1))
+
+
+def test_run_async_with_coroutine_objective_and_callbacks():
+    class AsyncCallback(Callback):
+        def __init__(self):
+            self.generations = []
+
+        async def on_generation_end(self, generation, best_fitness, best_individual, population):
+            await asyncio.sleep(0)
+            self.generations.append(generation)
+
+    async def objective(x):
+        await asyncio.sleep(0)
+        return x[0] + x[1]
+
+    callback = AsyncCallback()
+    ga = GeneticAlgorithm(
+        population_size=20,
+        objective_function=objective,
+        chromosome_decoder=make_decoder(),
+        termination=NumberOfGeneration(5),
+        callbacks=[callback],
+        evaluator=AsyncEvaluator(max_concurrency=4),
+    )
+    asyncio.run(ga.run_async())
+
+    fitness, individual = ga.result
+    assert callback.generations == [1, 2, 3, 4, 5]
+    assert fitness == individual[0] + individual[1]
+
+
+@pytest.mark.parametrize("settings", [{"elitism": 2}, {"steady_state_offspring": 5, "vectorized": True}])
+def test_async_run_matches_run(tmp_path, settings):
+    def make_ga(name):
+        return GeneticAlgorithm(
+            population_size=20,
+            objective_function=(lambda population: population.sum(axis=1)) if settings.get("vectorized") else objective,
+            chromosome_decoder=make_decoder(),
+            termination=NumberOfGeneration(10),
+            fitness_cache=FitnessCache(),
+            checkpointer=Checkpointer(tmp_path / f"{name}.npz", every_n_generations=3),
+            seed=4,
+            **settings,
+        )
+
+    ga = make_ga("sync")
+    ga.run()
+    async_ga = make_ga("async")
+    asyncio.run(async_ga.run_async())
+
+    assert async_ga.optimal_fitness == ga.optimal_fitness
+    np.testing.assert_array_equal(async_ga.optimal_individual, ga.optimal_individual)
+    assert (async_ga.number_of_evaluations, async_ga.number_of_cache_hits) == (ga.number_of_evaluations, ga.number_of_cache_hits)
+    np.testing.assert_array_equal(async_ga.population, ga.population)
+    assert (tmp_path / "async.npz").exists()
+
+
+def test_coroutine_objective_needs_async_evaluator():
+    async def objective(x):
+        return x[0]
+
+    ga = GeneticAlgorithm(
+        population_size=20,
+        objective_function=objective,
+        chromosome_decoder=make_decoder(),
+        termination=NumberOfGeneration(5),
+    )
+    with pytest.raises(TypeError):
+        ga.run()
+
+
+def test_seeded_runs_are_reproducible():
+    def run(seed, evaluator):
+        ga = GeneticAlgorithm(
+            population_size=20,
+            objective_function=objective,
+            chromosome_decoder=make_decoder(),
+            termination=NumberOfGeneration(5),
+            evaluator=evaluator,
+            seed=seed,
+        )
+        ga.run()
+        return ga.result, ga.population
+
+    assert run(42, SerialEvaluator()) == run(42, ProcessPoolEvaluator(max_workers=2)) == run(42, ProcessPoolEvaluator(max_workers=3))
+    assert run(42, SerialEvaluator()) != run(43, SerialEvaluator())
+
+
+def test_seeded_runs_do_not_share_default_operators():
+    def make_ga(seed):
+        return GeneticAlgorithm(
+            population_size=20,
+            objective_function=objective,
+            chromosome_decoder=make_decoder(),
+            termination=NumberOfGeneration(5),
+            seed=seed,
+        )
+
+    alone = make_ga(1)
+    alone.run()
+
+    first = make_ga(1)
+    second = make_ga(2)
+    first.run()
+    second.run()
+
+    assert first.selector is not second.selector
+    assert first.result == alone.result
+
+
+@pytest.mark.parametrize("vectorized, persistent_genotypes", [(False, False), (True, False), (True, True)])
+def test_profiling_callback_times_every_phase(vectorized, persistent_genotypes):
+    profiler = ProfilingCallback()
+    ga = GeneticAlgorithm(
+        population_size=20,
+        objective_function=(lambda population: population.sum(axis=1)) if vectorized else objective,
+        chromosome_decoder=make_decoder(),
+        termination=NumberOfGeneration(4),
+        callbacks=[profiler],
+        vectorized=vectorized,
+        persistent_genotypes=persistent_genotypes,
+        fitness_cache=FitnessCache(),
+        seed=0,
+    )
+    ga.run()
+
+    summary = profiler.runs[-1]
+    assert summary["generations"] == 4
+    assert summary["objective_calls"] + summary["cache_hits"] == 80
+    assert summary["objective_calls"] == ga.number_of_evaluations
+    assert {"initialization", "evaluation", "selection", "crossover", "mutation", "decoding"} <= set(summary["phases"])
+    assert summary["phases"]["evaluation"]["count"] == 4
+    assert sum(phase["share"] for phase in summary["phases"].values()) == pytest.approx(1)
+
+    # the samples start over for the next run
+    assert profiler.samples == {}
+    assert profiler.histogram("evaluation")[0].sum() == 0
+
+
+def test_phases_are_not_timed_without_a_profiler():
+    ga = GeneticAlgorithm(
+        population_size=10,
+        objective_function=objective,
+        chromosome_decoder=make_decoder(),
+        termination=NumberOfGeneration(2),
+    )
+    assert ga._timer("selection", ga.selector.select) == ga.selector.select
+    ga.run()
+    assert ga._phase_nanoseconds == {}
+    assert ga.number_of_evaluations == 20
+
+
+class BestFitnessTrace(Callback):
+    def __init__(self) -> None:
+        self.trace = []
+
+    def on_evaluation_end(self, generation, population_fitness, cache_info):
+        self.trace.append(float(np.max(population_fitness)))
+
+
+@pytest.mark.parametrize("vectorized, persistent_genotypes", [(False, False), (True, False), (False, True), (True, True)])
+def test_elitism_keeps_the_best_individuals(vectorized, persistent_genotypes):
+    trace = BestFitnessTrace()
+    ga = GeneticAlgorithm(
+        population_size=20,
+        objective_function=(lambda population: population.sum(axis=1)) if vectorized else objective,
+        chromosome_decoder=make_decoder(),
+        termination=NumberOfGeneration(15),
+        mutation=BitFlipMutation(0.5),
+        callbacks=[trace],
+        vectorized=vectorized,
+        persistent_genotypes=persistent_genotypes,
+        elitism=2,
+        seed=3,
+    )
+    ga.run()
+
+    # the elites are not evaluated again
+    assert ga.number_of_evaluations == 20 + 18 * 14
+    assert trace.trace == sorted(trace.trace)
+    fitness, individual = ga.result
+    assert fitness == trace.trace[-1]
+    assert fitness == pytest.approx(individual[0] + individual[1])
+
+
+@pytest.mark.parametrize("vectorized", [False, True])
+def test_steady_state_replaces_the_worst_members(vectorized):
+    evaluated = []
+
+    def counting_objective(x):
+        evaluated.append(1)
+        return x[0] + x[1]
+
+    ga = GeneticAlgorithm(
+        population_size=20,
+        objective_function=(lambda population: evaluated.extend([1] * len(population)) or population.sum(axis=1)) if vectorized else counting_objective,
+        chromosome_decoder=make_decoder(),
+        termination=NumberOfGeneration(10),
+        callbacks=[trace := BestFitnessTrace()],
+        vectorized=vectorized,
+        steady_state_offspring=4,
+        seed=5,
+    )
+    ga.run()
+
+    assert len(evaluated) == ga.number_of_evaluations == 20 + 4 * 9
+    assert len(ga.population) == 20
+    assert trace.trace == sorted(trace.trace)
+
+
+@pytest.mark.parametrize("settings", [{"elitism": 20}, {"elitism": -1}, {"steady_state_offspring": 0}, {"steady_state_offspring": 21}, {"elitism": 1, "steady_state_offspring": 2}])
+def test_invalid_replacement_settings(settings):
+    with pytest.raises(ValueError):
+        GeneticAlgorithm(
+            population_size=20,
+            objective_function=objective,
+            chromosome_decoder=make_decoder(),
+            termination=NumberOfGeneration(1),
+            **settings,
+        )
+
+
+@pytest.mark.parametrize("make_selection", [TournamentSelection, lambda: LinearRankSelection(2)])
+def test_rank_based_selection_follows_the_optimization_of_the_run(make_selection):
+    ga = GeneticAlgorithm(
+        population_size=20,
+        objective_function=lambda population: population.sum(axis=1),
+        chromosome_decoder=make_decoder(),
+        termination=NumberOfGeneration(30),
+        optimization=Minimization(),
+        selection=make_selection(),
+        vectorized=True,
+        seed=0,
+    )
+    ga.run()
+
+    assert isinstance(ga.selector.optimization, Minimization)
+    # x[0] + x[1] is 5.5 on average over the bounds, 1 at least
+    assert np.mean(ga.population_fitness) < 4
+
+    # unless it was given its own
+    ga = GeneticAlgorithm(
+        population_size=20,
+        objective_function=objective,
+        chromosome_decoder=make_decoder(),
+        termination=NumberOfGeneration(1),
+        optimization=Minimization(),
+        selection=TournamentSelection(2, Maximization()),
+    )
+    assert isinstance(ga.selector.optimization, Maximization)
+
+
+def test_shared_selection_follows_each_run():
+    selection = TournamentSelection(2)
+
+    def run(optimization):
+        ga = GeneticAlgorithm(
+            population_size=20,
+            objective_function=lambda population: population.sum(axis=1),
+            chromosome_decoder=make_decoder(),
+            termination=NumberOfGeneration(30),
+            optimization=optimization,
+            selection=selection,
+            vectorized=True,
+            seed=0,
+        )
+        ga.run()
+        return ga
+
+    maximizing, minimizing = run(Maximization()), run(Minimization())
+
+    assert selection.optimization is None
+    assert isinstance(maximizing.selector.optimization, Maximization)
+    assert isinstance(minimizing.selector.optimization, Minimization)
+    # x[0] + x[1] is 5.5 on average over the bounds
+    assert np.mean(maximizing.population_fitness) > 7 > 4 > np.mean(minimizing.population_fitness)
@@ -0,0 +1,92 @@
+import os
+import time
+from functools import partial
+
+import pytest
+from ga import GeneticAlgorithm
+from genetic_algorithm.chromosome_decoder import BinaryChromosomeDecoder
+from genetic_algorithm.crossover import SinglePointCrossover
+from genetic_algorithm.evaluator import ProcessPoolEvaluator
+from genetic_algorithm.island import FullyConnectedTopology, IslandModel, RandomTopology, RingTopology
+from genetic_algorithm.termination_criterion import NumberOfGeneration
+
+
+def objective(x):
+    return x[0] + x[1]
+
+
+def failing_objective(x):
+    raise ValueError("objective failed")
+
+
+def exiting_objective(x):
+    os._exit(3)
+
+
+def make_island(crossover_probability, max_number_of_generation=12, objective_function=objective, evaluator=None):
+    return GeneticAlgorithm(
+        population_size=20,
+        objective_function=objective_function,
+        chromosome_decoder=BinaryChromosomeDecoder(
+            number_of_bytes=6,
+            number_of_decision_variables=2,
+            lower_bounds=[2, -1],
+            upper_bounds=[6, 4]
+        ),
+        termination=NumberOfGeneration(max_number_of_generation),
+        crossover=SinglePointCrossover(crossover_probability),
+        evaluator=evaluator,
+    )
+
+
+def test_topologies():
+    assert RingTopology().destinations(3) == [[1], [2], [0]]
+    assert FullyConnectedTopology().destinations(3) == [[1, 2], [0, 2], [0, 1]]
+    assert all(len(d) == 1 and i not in d for i, d in enumerate(RandomTopology(0).destinations(4)))
+
+
+@pytest.mark.parametrize("topology", [RingTopology(), FullyConnectedTopology(), RandomTopology(0)])
+def test_island_model_reports_global_best(topology):
+    model = IslandModel(
+        [partial(make_island, 0.8), partial(make_island, 0.5), partial(make_island, 0.9, 7)],
+        migration_interval=3,
+        migration_size=2,
+        topology=topology,
+    )
+    model.run()
+
+    fitness, individual = model.result
+    assert [generation for generation, _, _ in model.island_results] == [12, 12, 7]
+    # the best of a generation can be lost later on, the model keeps it
+    assert fitness >= max(island_fitness for _, island_fitness, _ in model.island_results)
+    assert fitness == objective(individual)
+
+
+def test_seeded_island_model_is_reproducible():
+    def run(seed):
+        model = IslandModel([partial(make_island, 0.8)] * 3, migration_interval=3, topology=RandomTopology(), seed=seed)
+        model.run()
+        return model.island_results
+
+    assert run(7) == run(7)
+
+
+@pytest.mark.parametrize("objective, error", [(failing_objective, ValueError), (exiting_objective, RuntimeError)])
+def test_failing_island_stops_the_model(objective, error):
+    model = IslandModel(
+        [partial(make_island, 0.8, 1000), partial(make_island, 0.8, 1000, objective), partial(make_island, 0.8, 1000)],
+        migration_interval=2,
+    )
+    started = time.monotonic()
+    with pytest.raises(error):
+        model.run()
+    assert time.monotonic() - started < 10
+
+
+def test_islands_can_evaluate_on_process_pools():
+    model = IslandModel([partial(make_island, 0.8, 6, evaluator=ProcessPoolEvaluator(max_workers=2))] * 2, migration_interval=3)
+    model.run()
+
+    fitness, individual = model.result
+    assert [generation for generation, _, _ in model.island_results] == [6, 6]
+    assert fitness == objective(individual)
@@ -0,0 +1,185 @@
+from functools import partial
+
+import numpy as np
+import pytest
+from ga import NSGA2
+from genetic_algorithm.batch import BatchRunner
+from genetic_algorithm.checkpoint import save_checkpoint
+from genetic_algorithm.chromosome_decoder import BinaryChromosomeDecoder, IdentityChromosomeDecoder
+from genetic_algorithm.crossover import SimulatedBinaryCrossover
+from genetic_algorithm.island import IslandModel
+from genetic_algorithm.multi_objective import MultiObjectiveOptimization, crowded_scores, crowding_distance, dominates, non_dominated_sort
+from genetic_algorithm.mutation import PolynomialMutation
+from genetic_algorithm.optimization import Maximization, Minimization
+from genetic_algorithm.termination_criterion import EarlyStopping, NumberOfGeneration, OrTermination, TargetFitnessReached, ThresholdDifference
+
+
+def peeled_ranks(objectives):
+    # Reference: remove the non-dominated rows one front at a time
+    domination = dominates(objectives[:, None, :], objectives[None, :, :])
+    ranks = np.full(len(objectives), -1)
+    remaining = np.ones(len(objectives), dtype=bool)
+    rank = 0
+    while remaining.any():
+        front = remaining & ~domination[remaining].any(axis=0)
+        ranks[front] = rank
+        remaining &= ~front
+        rank += 1
+    return ranks
+
+
+@pytest.mark.parametrize("number_of_objectives", [2, 3, 4, 8])
+@pytest.mark.parametrize("discrete", [False, True])
+def test_non_dominated_sort_matches_peeling(number_of_objectives, discrete):
+    rng = np.random.default_rng(number_of_objectives)
+    if discrete:
+        # many duplicates and ties
+        objectives = rng.integers(0, 5, size=(300, number_of_objectives)).astype(np.float64)
+    else:
+        objectives = rng.random((300, number_of_objectives))
+
+    np.testing.assert_array_equal(non_dominated_sort(objectives, chunk_size=64), peeled_ranks(objectives))
+
+
+def test_crowding_distance():
+    objectives = np.array([[0.0, 4], [1, 2], [2, 1], [4, 0], [3, 3]])
+    ranks = np.array([0, 0, 0, 0, 1])
+
+    distance = crowding_distance(objectives, ranks)
+
+    assert np.isinf(distance[[0, 3, 4]]).all()
+    assert distance[1] == pytest.approx(2 / 4 + 3 / 4)
+    assert distance[2] == pytest.approx(3 / 4 + 2 / 4)
+
+
+def test_crowded_scores_order_by_rank_then_distance():
+    scores = crowded_scores(np.array([0, 0, 1, 1]), np.array([0.0, np.inf, 1e9, 0.5]))
+    assert list(np.argsort(-scores)) == [1, 0, 2, 3]
+
+
+def test_objectives_follow_the_optimization_of_each_column():
+    optimization = MultiObjectiveOptimization([Minimization(), Maximization()])
+    np.testing.assert_array_equal(optimization.objectives([[1, 2], [3, 4]]), [[1, -2], [3, -4]])
+
+    with pytest.raises(ValueError):
+        optimization.objectives([[1, 2, 3]])
+
+
+def schaffer(x):
+    return (x[0] ** 2, (x[0] - 2) ** 2)
+
+
+def make_nsga2(vectorized=False, **settings):
+    objective = (lambda population: np.column_stack((population[:, 0] ** 2, (population[:, 0] - 2) ** 2))) if vectorized else schaffer
+    return NSGA2(
+        population_size=40,
+        objective_function=objective,
+        chromosome_decoder=IdentityChromosomeDecoder(1, [-10], [10]),
+        termination=NumberOfGeneration(30),
+        crossover=SimulatedBinaryCrossover(0.9, [-10], [10]),
+        mutation=PolynomialMutation(0.5, [-10], [10]),
+        vectorized=vectorized,
+        seed=0,
+        **settings,
+    )
+
+
+@pytest.mark.parametrize("vectorized", [False, True])
+def test_nsga2_converges_to_the_pareto_front(vectorized):
+    ga = make_nsga2(vectorized)
+    ga.run()
+
+    pareto_fitness, pareto_front = ga.result
+    assert pareto_fitness is ga.pareto_fitness
+    assert pareto_fitness.shape == (len(pareto_front), 2)
+    # the Pareto set of the Schaffer problem is [0, 2]
+    assert len(pareto_front) == 40
+    assert all(-0.01 <= individual[0] <= 2.01 for individual in pareto_front)
+    assert np.ptp([individual[0] for individual in pareto_front]) > 1.5
+    assert (non_dominated_sort(pareto_fitness) == 0).all()
+
+
+def test_nsga2_with_binary_genotypes_and_maximization():
+    ga = NSGA2(
+        population_size=30,
+        objective_function=lambda x: (x[0], -x[0] ** 2),
+        chromosome_decoder=BinaryChromosomeDecoder(8, 1, [-1], [1]),
+        termination=NumberOfGeneration(20),
+        optimization=MultiObjectiveOptimization([Maximization(), Maximization()]),
+        persistent_genotypes=True,
+        seed=1,
+    )
+    ga.run()
+
+    # the first objective wants x = 1, the second x = 0
+    assert all(-0.01 <= individual[0] <= 1.01 for individual in ga.pareto_front)
+
+
+def test_nsga2_resumes_from_its_state(tmp_path):
+    ga = make_nsga2(vectorized=True)
+    ga.start()
+    for _ in range(5):
+        ga.step()
+    path = str(tmp_path / "nsga2.npz")
+    save_checkpoint(path, ga.get_state())
+    for _ in range(5):
+        ga.step()
+
+    resumed = make_nsga2(vectorized=True)
+    resumed.start(resume_from=path)
+    for _ in range(5):
+        resumed.step()
+
+    np.testing.assert_array_equal(resumed.pareto_fitness, ga.pareto_fitness)
+    np.testing.assert_array_equal(resumed.population, ga.population)
+
+
+def test_nsga2_rejects_scalar_replacement_settings():
+    with pytest.raises(ValueError):
+        make_nsga2(elitism=2)
+
+
+def test_nsga2_island_model_merges_the_fronts():
+    model = IslandModel([partial(make_nsga2)] * 2, migration_interval=5, migration_size=3, optimization=MultiObjectiveOptimization(), seed=0)
+    model.run()
+
+    pareto_fitness, pareto_front = model.result
+    assert len(pareto_front) == len(pareto_fitness) >= 40
+    assert len({tuple(individual) for individual in pareto_front}) == len(pareto_front)
+    assert all(-0.01 <= individual[0] <= 2.01 for individual in pareto_front)
+    assert (non_dominated_sort(pareto_fitness) == 0).all()
+    np.testing.assert_array_equal(pareto_fitness, [schaffer(individual) for individual in pareto_front])
+
+
+def test_nsga2_emigrants_are_the_least_crowded_of_the_first_front():
+    ga = make_nsga2()
+    ga.run()
+
+    emigrants = ga.emigrants(3)
+    assert len(emigrants) == 3
+    # the extremes of the front are infinitely far from their neighbours
+    objectives = np.array([fitness for fitness, _ in emigrants])
+    assert {objectives[:, 0].argmin(), objectives[:, 1].argmin()} == {0, 1}
+    assert (non_dominated_sort(np.concatenate((objectives, ga.pareto_fitness)))[:3] == 0).all()
+
+
+def test_island_model_needs_the_multi_objective_optimization_of_nsga2():
+    with pytest.raises(TypeError):
+        IslandModel([partial(make_nsga2)] * 2, migration_interval=5).run()
+
+
+@pytest.mark.parametrize("criterion", [EarlyStopping(3), TargetFitnessReached(0), ThresholdDifference(0.1)])
+def test_nsga2_rejects_single_objective_criteria(criterion):
+    ga = make_nsga2()
+    ga.terminator = OrTermination(NumberOfGeneration(30), criterion)
+    with pytest.raises(TypeError):
+        ga.run()
+
+
+def test_batch_summary_rejects_fronts():
+    runner = BatchRunner({"nsga2": partial(make_nsga2)}, repeats=2, seed=0, max_workers=2)
+    results = runner.run_all()
+
+    assert all(result.optimal_fitness.shape == (len(result.optimal_individual), 2) for result in results)
+    with pytest.raises(TypeError, match="Pareto front"):
+        runner.summary()
@@ -0,0 +1,31 @@
+import numpy as np
+from genetic_algorithm.mutation import BitFlipMutation, PerBitFlipMutation
+
+
+def test_per_bit_flip_mutation_batch():
+    population = np.zeros((1000, 3, 10), dtype=np.uint8)
+    mutated = PerBitFlipMutation(0.1, seed=0).mutate_batch(population)
+
+    assert mutated.dtype == np.uint8
+    assert set(np.unique(mutated)) <= {0, 1}
+    assert np.isclose(mutated.mean(), 0.1, atol=0.005)
+    assert (PerBitFlipMutation(1).mutate_batch(mutated) == 1 - mutated).all()
+
+
+def test_per_bit_flip_mutation_pairs():
+    child1, child2 = PerBitFlipMutation(1).mutate([[0, 1, 1], [1, 0, 0]], [[1, 1, 1], [0, 0, 0]])
+
+    assert child1 == [[1, 0, 0], [0, 1, 1]]
+    assert child2 == [[0, 0, 0], [1, 1, 1]]
+
+
+def test_bit_flip_mutation_batch_swaps_one_allele_between_pairs():
+    population = np.zeros((5, 3, 10), dtype=np.uint8)
+    population[1::2] = 1
+    mutated = BitFlipMutation(1, seed=0).mutate_batch(population)
+
+    # every gene of a pair exchanged exactly one allele, the last row has no partner
+    assert (mutated[0:4:2].sum(axis=2) == 1).all()
+    assert (mutated[1:4:2].sum(axis=2) == 9).all()
+    assert (mutated[4] == 0).all()
+    assert (BitFlipMutation(0).mutate_batch(population) == population).all()
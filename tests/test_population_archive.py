@@ -0,0 +1,74 @@
+import json
+import os
+
+import numpy as np
+import pytest
+from ga import GeneticAlgorithm
+from genetic_algorithm.callbacks.population_archive import PopulationArchive, PopulationArchiveReader
+from genetic_algorithm.chromosome_decoder import BinaryChromosomeDecoder
+from genetic_algorithm.termination_criterion import NumberOfGeneration
+
+
+class Recorder(PopulationArchive):
+    # keeps copies of what was archived to compare with the files
+    def __init__(self, *args, **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+        self.populations = []
+        self.fitness = []
+
+    def on_generation_start(self, generation, best_fitness, best_individual, population):
+        super().on_generation_start(generation, best_fitness, best_individual, population)
+        self.populations.append(np.array(population, dtype=np.float64))
+
+    def on_evaluation_end(self, generation, population_fitness, cache_info):
+        super().on_evaluation_end(generation, population_fitness, cache_info)
+        self.fitness.append(np.array(population_fitness, dtype=np.float64))
+
+
+@pytest.mark.parametrize("vectorized", [False, True])
+def test_archive_round_trip(tmp_path, vectorized):
+    decoder = BinaryChromosomeDecoder(6, 2, [2, -1], [6, 4])
+    archive = Recorder(str(tmp_path / "archive"), chromosome_decoder=decoder, capacity=2)
+    ga = GeneticAlgorithm(
+        population_size=10,
+        objective_function=(lambda population: population.sum(axis=1)) if vectorized else (lambda x: x[0] + x[1]),
+        chromosome_decoder=decoder,
+        termination=NumberOfGeneration(7),
+        callbacks=[archive],
+        vectorized=vectorized,
+    )
+    ga.run()
+
+    reader = PopulationArchiveReader(str(tmp_path / "archive"))
+    assert reader.complete
+    assert len(reader) == 7
+    np.testing.assert_array_equal(reader.generation, np.arange(7))
+    np.testing.assert_array_equal(reader.population, np.stack(archive.populations))
+    np.testing.assert_array_equal(reader.fitness, np.stack(archive.fitness))
+    np.testing.assert_array_equal(reader.genotypes[3], decoder.encode_batch(archive.populations[3]))
+    assert isinstance(reader.population, np.memmap)
+    assert reader.row(5) == 5
+
+    # trimmed to the archived generations
+    assert os.path.getsize(tmp_path / "archive" / "fitness.dat") == 7 * 10 * 8
+
+
+def test_reader_sees_only_flushed_generations(tmp_path):
+    archive = PopulationArchive(str(tmp_path), capacity=1)
+    for generation in range(3):
+        archive.append({"generation": np.int64(generation), "population": np.full((4, 2), generation, dtype=np.float64), "fitness": np.zeros(4)})
+
+    reader = PopulationArchiveReader(str(tmp_path))
+    assert len(reader) == 3 and not reader.complete
+    assert reader.population[1:3, 0, 0].tolist() == [1, 2]
+
+    archive.append({"generation": np.int64(3), "population": np.ones((4, 2)), "fitness": np.zeros(4)})
+    reader.refresh()
+    assert len(reader) == 4
+
+    with pytest.raises(ValueError):
+        archive.append({"generation": np.int64(4), "population": np.ones((5, 2)), "fitness": np.zeros(5)})
+
+    archive.close()
+    with open(tmp_path / "index.json") as file:
+        assert json.load(file)["complete"]
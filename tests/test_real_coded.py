@@ -0,0 +1,94 @@
+import numpy as np
+import pytest
+from ga import GeneticAlgorithm, NSGA2
+from genetic_algorithm.chromosome_decoder import IdentityChromosomeDecoder
+from genetic_algorithm.fitness_cache import FitnessCache
+from genetic_algorithm.crossover import BlendCrossover, SimulatedBinaryCrossover
+from genetic_algorithm.mutation import GaussianMutation, PolynomialMutation
+from genetic_algorithm.optimization import Minimization
+from genetic_algorithm.selection import TournamentSelection
+from genetic_algorithm.termination_criterion import NumberOfGeneration
+
+LOWER_BOUNDS = [10, 0, -20]
+UPPER_BOUNDS = [90, 90, 60]
+
+
+def random_population(seed, size=500):
+    return np.random.default_rng(seed).uniform(LOWER_BOUNDS, UPPER_BOUNDS, size=(size, 3))
+
+
+@pytest.mark.parametrize("crossover", [SimulatedBinaryCrossover, BlendCrossover])
+def test_real_coded_crossover_stays_within_bounds(crossover):
+    parents_a, parents_b = random_population(0), random_population(1)
+    children_a, children_b = crossover(1, LOWER_BOUNDS, UPPER_BOUNDS, seed=0).cross_batch(parents_a, parents_b)
+
+    assert children_a.shape == parents_a.shape
+    assert ((children_a >= LOWER_BOUNDS) & (children_a <= UPPER_BOUNDS)).all()
+    assert ((children_b >= LOWER_BOUNDS) & (children_b <= UPPER_BOUNDS)).all()
+    assert not np.array_equal(children_a, parents_a)
+
+    unchanged_a, unchanged_b = crossover(0, LOWER_BOUNDS, UPPER_BOUNDS, seed=0).cross_batch(parents_a, parents_b)
+    assert np.array_equal(unchanged_a, parents_a) and np.array_equal(unchanged_b, parents_b)
+
+
+def test_simulated_binary_crossover_preserves_the_parents_mean():
+    parents_a, parents_b = random_population(0) / 2 + 30, random_population(1) / 2 + 30
+    children_a, children_b = SimulatedBinaryCrossover(1, [-1e9] * 3, [1e9] * 3, seed=0).cross_batch(parents_a, parents_b)
+
+    assert np.allclose(children_a + children_b, parents_a + parents_b)
+
+
+@pytest.mark.parametrize("mutation", [PolynomialMutation, GaussianMutation])
+def test_real_coded_mutation_stays_within_bounds(mutation):
+    population = random_population(0)
+    mutated = mutation(0.5, LOWER_BOUNDS, UPPER_BOUNDS, seed=0).mutate_batch(population)
+
+    assert ((mutated >= LOWER_BOUNDS) & (mutated <= UPPER_BOUNDS)).all()
+    assert np.isclose((mutated != population).mean(), 0.5, atol=0.05)
+
+    child1, child2 = mutation(0, LOWER_BOUNDS, UPPER_BOUNDS).mutate(population[0].tolist(), population[1].tolist())
+    assert [child1, child2] == population[:2].tolist()
+
+
+@pytest.mark.parametrize("vectorized", [False, True])
+def test_real_coded_run(vectorized):
+    def sphere(x):
+        return np.sum((np.asarray(x) - 30)**2, axis=-1)
+
+    ga = GeneticAlgorithm(
+        population_size=50,
+        objective_function=sphere,
+        chromosome_decoder=IdentityChromosomeDecoder(3, LOWER_BOUNDS, UPPER_BOUNDS),
+        termination=NumberOfGeneration(60),
+        optimization=Minimization(),
+        selection=TournamentSelection(2),
+        crossover=SimulatedBinaryCrossover(0.9, LOWER_BOUNDS, UPPER_BOUNDS),
+        mutation=PolynomialMutation(1 / 3, LOWER_BOUNDS, UPPER_BOUNDS),
+        vectorized=vectorized,
+        seed=0,
+    )
+    ga.run()
+
+    fitness, individual = ga.result
+    assert fitness < 1
+
+
+@pytest.mark.parametrize("persistent_genotypes", [False, True])
+@pytest.mark.parametrize("algorithm, objective", [(GeneticAlgorithm, lambda x: sum(x)), (NSGA2, lambda x: (x[0], -x[1]))])
+def test_identity_chromosomes_with_fitness_cache(persistent_genotypes, algorithm, objective):
+    ga = algorithm(
+        population_size=20,
+        objective_function=objective,
+        chromosome_decoder=IdentityChromosomeDecoder(3, LOWER_BOUNDS, UPPER_BOUNDS),
+        termination=NumberOfGeneration(10),
+        crossover=BlendCrossover(0.5, LOWER_BOUNDS, UPPER_BOUNDS),
+        mutation=GaussianMutation(0.1, LOWER_BOUNDS, UPPER_BOUNDS),
+        persistent_genotypes=persistent_genotypes,
+        fitness_cache=FitnessCache(),
+        seed=0,
+    )
+    ga.run()
+
+    # parents copied unchanged are found in the cache
+    assert ga.number_of_cache_hits > 0
+    assert ga.number_of_evaluations + ga.number_of_cache_hits == 20 * 10
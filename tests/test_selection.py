@@ -0,0 +1,83 @@
+import numpy as np
+import pytest
+from genetic_algorithm.optimization import Maximization, Minimization
+from genetic_algorithm.selection import (
+    AliasSelection,
+    LinearRankSelection,
+    RouletteSelection,
+    StochasticUniversalSampling,
+    TournamentSelection,
+)
+
+SELECTIONS = [RouletteSelection, StochasticUniversalSampling, AliasSelection]
+
+
+@pytest.mark.parametrize("selection", SELECTIONS)
+def test_selection_is_fitness_proportional(selection):
+    population_fitness = [1, 0, 3, 6]
+    counts = np.bincount(selection(seed=0).select_indices(population_fitness, 100_000), minlength=4)
+
+    assert counts[1] == 0
+    assert np.allclose(counts / 100_000, [0.1, 0, 0.3, 0.6], atol=0.01)
+
+
+@pytest.mark.parametrize("selection", SELECTIONS)
+def test_selection_with_negative_fitness(selection):
+    population = [[-4.0], [-1.0], [2.0], [5.0]]
+    population_fitness = [-4, -1, 2, 5]
+    selected = selection(seed=0).select(population, population_fitness)
+    counts = np.bincount(selection(seed=0).select_indices(population_fitness, 100_000), minlength=4)
+
+    assert len(selected) == len(population)
+    assert all(individual in population for individual in selected)
+    assert counts[0] == 0
+    assert np.allclose(counts / 100_000, [0, 3 / 18, 6 / 18, 9 / 18], atol=0.01)
+
+
+@pytest.mark.parametrize("selection", SELECTIONS)
+def test_selection_with_zero_total_fitness(selection):
+    counts = np.bincount(selection(seed=0).select_indices([0, 0, 0, 0], 100_000), minlength=4)
+
+    assert np.allclose(counts / 100_000, 0.25, atol=0.01)
+
+
+@pytest.mark.parametrize("selection", SELECTIONS)
+def test_selection_keeps_array_populations(selection):
+    population = np.arange(10, dtype=np.float64).reshape(5, 2)
+    selected = selection(seed=0).select(population, [1, 2, 3, 4, 5])
+
+    assert isinstance(selected, np.ndarray)
+    assert selected.shape == (5, 2)
+
+
+def test_stochastic_universal_sampling_spread():
+    population_fitness = [1, 2, 3, 4]
+    for _ in range(100):
+        counts = np.bincount(StochasticUniversalSampling().select_indices(population_fitness, 10), minlength=4)
+        assert (np.abs(counts - np.array(population_fitness)) < 1).all()
+
+
+@pytest.mark.parametrize("optimization,best", [(Maximization(), 3), (Minimization(), 0)])
+def test_tournament_selection(optimization, best):
+    population_fitness = [1e-300, 1, 1e100, 1e300]
+    counts = np.bincount(TournamentSelection(2, optimization, seed=0).select_indices(population_fitness, 100_000), minlength=4)
+
+    # the best individual wins every tournament it enters
+    assert np.isclose(counts[best] / 100_000, 1 - (3 / 4)**2, atol=0.01)
+    assert TournamentSelection(4, optimization).select_indices(population_fitness, 1).shape == (1,)
+
+
+@pytest.mark.parametrize("optimization,order", [(Maximization(), [1, 0, 3, 2]), (Minimization(), [2, 3, 0, 1])])
+def test_linear_rank_selection(optimization, order):
+    population_fitness = [-1e200, -5e300, 1e300, 7]
+    counts = np.bincount(LinearRankSelection(2, optimization, seed=0).select_indices(population_fitness, 100_000), minlength=4)
+
+    # with selection pressure 2 the rank probabilities are 0, 1/6, 2/6 and 3/6
+    assert np.allclose(counts[order] / 100_000, [0, 1 / 6, 2 / 6, 3 / 6], atol=0.01)
+
+
+def test_rank_based_selection_arguments():
+    with pytest.raises(ValueError):
+        TournamentSelection(0)
+    with pytest.raises(ValueError):
+        LinearRankSelection(2.5)
@@ -0,0 +1,68 @@
+import csv
+import json
+
+import numpy as np
+import pytest
+from ga import GeneticAlgorithm
+from genetic_algorithm.chromosome_decoder import BinaryChromosomeDecoder
+from genetic_algorithm.callbacks.stream_logger import StreamingLogger, read_binary_log
+from genetic_algorithm.termination_criterion import NumberOfGeneration
+
+
+def run_with(logger, vectorized=False):
+    ga = GeneticAlgorithm(
+        population_size=20,
+        objective_function=(lambda population: population.sum(axis=1)) if vectorized else (lambda x: x[0] + x[1]),
+        chromosome_decoder=BinaryChromosomeDecoder(
+            number_of_bytes=6,
+            number_of_decision_variables=2,
+            lower_bounds=[2, -1],
+            upper_bounds=[6, 4]
+        ),
+        termination=NumberOfGeneration(5),
+        callbacks=[logger],
+        vectorized=vectorized,
+        seed=0,
+    )
+    ga.run()
+    return ga
+
+
+@pytest.mark.parametrize("vectorized", [False, True])
+def test_jsonl_records_match_the_run(tmp_path, vectorized):
+    path = tmp_path / "run.jsonl"
+    ga = run_with(StreamingLogger(str(path), log_best_individual=True), vectorized)
+
+    records = [json.loads(line) for line in path.read_text().splitlines()]
+    assert [record["generation"] for record in records] == [0, 1, 2, 3, 4]
+    assert records[-1]["best_fitness"] == ga.optimal_fitness
+    assert records[-1]["best_individual"] == list(ga.optimal_individual)
+    assert records[-1]["mean_fitness"] == pytest.approx(np.mean(ga.population_fitness))
+    assert all(record["diversity"] >= 0 for record in records)
+
+
+def test_csv_records(tmp_path):
+    path = tmp_path / "run.csv"
+    run_with(StreamingLogger(str(path), format="csv"))
+
+    with open(path, newline="") as file:
+        rows = list(csv.DictReader(file))
+    assert [int(row["generation"]) for row in rows] == [0, 1, 2, 3, 4]
+    assert set(rows[0]) == {"generation", "best_fitness", "mean_fitness", "diversity"}
+
+
+@pytest.mark.parametrize("log_best_individual", [False, True])
+def test_binary_records(tmp_path, log_best_individual):
+    path = tmp_path / "run.bin"
+    ga = run_with(StreamingLogger(str(path), format="binary", log_best_individual=log_best_individual))
+
+    records = read_binary_log(str(path))
+    assert records["generation"].tolist() == [0, 1, 2, 3, 4]
+    assert records["best_fitness"][-1] == ga.optimal_fitness
+    if log_best_individual:
+        assert records["best_individual"][-1].tolist() == list(ga.optimal_individual)
+
+
+def test_unknown_format():
+    with pytest.raises(ValueError):
+        StreamingLogger("run.txt", format="txt")
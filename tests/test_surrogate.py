@@ -0,0 +1,110 @@
+import numpy as np
+import pytest
+from ga import GeneticAlgorithm
+from genetic_algorithm.chromosome_decoder import BinaryChromosomeDecoder
+from genetic_algorithm.fitness_cache import FitnessCache
+from genetic_algorithm.optimization import Maximization, Minimization
+from genetic_algorithm.surrogate import KNearestNeighbours, RadialBasisFunction, SurrogateScreening, rank_correlation
+from genetic_algorithm.termination_criterion import NumberOfGeneration
+
+
+def sphere(x):
+    return float(np.sum(np.square(x)))
+
+
+@pytest.mark.parametrize("model", [KNearestNeighbours(3), RadialBasisFunction()])
+def test_models_interpolate_the_training_points(model):
+    rng = np.random.default_rng(0)
+    individuals = rng.uniform(-5, 5, size=(40, 2))
+    fitness = np.sum(individuals ** 2, axis=1)
+    model.fit(individuals, fitness)
+
+    np.testing.assert_allclose(model.predict(individuals), fitness, rtol=1e-2)
+
+    # smooth enough to rank points far apart
+    predicted = model.predict(np.array([[0.0, 0.0], [4.5, 4.5]]))
+    assert predicted[0] < predicted[1]
+
+
+@pytest.mark.parametrize("optimization", [Maximization(), Minimization()])
+def test_screening_keeps_the_most_promising_fraction(optimization):
+    screening = SurrogateScreening(KNearestNeighbours(1), evaluated_fraction=0.25, min_archive_size=4)
+    assert screening.screen(0, np.zeros((8, 1)), optimization) is None
+
+    screening.record(np.arange(8.0)[:, None], np.arange(8.0))
+    rows, predicted = screening.screen(1, np.array([[5.0], [0.0], [7.0], [2.0], [6.0], [1.0], [3.0], [4.0]]), optimization)
+
+    np.testing.assert_array_equal(predicted, [5, 0, 7, 2, 6, 1, 3, 4])
+    expected = [2, 4] if isinstance(optimization, Maximization) else [1, 5]
+    np.testing.assert_array_equal(rows, expected)
+
+
+def test_archive_keeps_the_most_recent_individuals():
+    screening = SurrogateScreening(archive_size=5, min_archive_size=1)
+    for start in range(0, 12, 3):
+        screening.record(np.arange(start, start + 3.0)[:, None], np.arange(start, start + 3.0))
+
+    assert screening.archive_length == 5
+    assert sorted(screening.archive_fitness.tolist()) == [7, 8, 9, 10, 11]
+
+
+def test_rank_correlation():
+    assert rank_correlation(np.array([1.0, 2, 3]), np.array([10.0, 20, 30])) == pytest.approx(1)
+    assert rank_correlation(np.array([1.0, 2, 3]), np.array([3.0, 2, 1])) == pytest.approx(-1)
+    assert np.isnan(rank_correlation(np.array([1.0]), np.array([1.0])))
+
+
+def make_ga(vectorized=False, persistent_genotypes=False, **settings):
+    objective = (lambda population: np.sum(np.square(population), axis=1)) if vectorized else sphere
+    return GeneticAlgorithm(
+        population_size=20,
+        objective_function=objective,
+        chromosome_decoder=BinaryChromosomeDecoder(8, 2, [-5, -5], [5, 5]),
+        termination=NumberOfGeneration(10),
+        optimization=Minimization(),
+        vectorized=vectorized,
+        persistent_genotypes=persistent_genotypes,
+        seed=1,
+        **settings,
+    )
+
+
+@pytest.mark.parametrize("vectorized, persistent_genotypes", [(False, False), (True, False), (True, True)])
+def test_surrogate_reduces_the_number_of_evaluations(vectorized, persistent_genotypes):
+    surrogate = SurrogateScreening(KNearestNeighbours(3), evaluated_fraction=0.25, min_archive_size=20)
+    ga = make_ga(vectorized, persistent_genotypes, surrogate=surrogate)
+    ga.run()
+
+    # everyone is evaluated in the first generation, a quarter afterwards
+    assert ga.number_of_evaluations == 20 + 5 * 9
+    assert [record["generation"] for record in surrogate.history] == list(range(1, 10))
+    assert all(record["evaluated"] == 5 and record["predicted"] == 15 for record in surrogate.history)
+    assert all(record["mean_absolute_error"] >= 0 for record in surrogate.history)
+
+    # the optimum is a true fitness value
+    fitness, individual = ga.result
+    assert fitness == pytest.approx(sphere(individual))
+
+
+def test_surrogate_with_elitism_and_fitness_cache():
+    surrogate = SurrogateScreening(RadialBasisFunction(), evaluated_fraction=0.5, retrain_interval=3)
+    ga = make_ga(surrogate=surrogate, elitism=2, fitness_cache=FitnessCache())
+    ga.run()
+
+    assert surrogate.trained_at == 7
+    assert ga.number_of_evaluations + ga.number_of_cache_hits == 20 + 9 * 9
+    fitness, individual = ga.result
+    assert fitness == pytest.approx(sphere(individual))
+
+
+def test_surrogate_state_round_trip():
+    surrogate = SurrogateScreening(min_archive_size=5)
+    surrogate.record(np.arange(12.0).reshape(6, 2), np.arange(6.0))
+    surrogate.history.append({"generation": 1})
+
+    restored = SurrogateScreening(min_archive_size=5)
+    restored.set_state(surrogate.get_state())
+
+    np.testing.assert_array_equal(restored.archive_individuals[:restored.archive_length], np.arange(12.0).reshape(6, 2))
+    assert restored.history == surrogate.history
+    assert restored.trained_at is None
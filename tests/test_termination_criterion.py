@@ -1,10 +1,28 @@
-from genetic_algorithm.termination_criterion import NumberOfGeneration, ThresholdDifference
+import time
+
+import pytest
+from ga import GeneticAlgorithm
+from genetic_algorithm.chromosome_decoder import BinaryChromosomeDecoder
+from genetic_algorithm.evaluator import SerialEvaluator, ThreadPoolEvaluator
+from genetic_algorithm.fitness_cache import FitnessCache
+from genetic_algorithm.optimization import Minimization
+from genetic_algorithm.termination_criterion import (
+    AndTermination,
+    EarlyStopping,
+    MaxEvaluations,
+    MaxRuntime,
+    NumberOfGeneration,
+    OrTermination,
+    RunState,
+    TargetFitnessReached,
+    ThresholdDifference,
+)
 
 def test_number_of_generation_stopping_criterion():
     number_of_generations = 0
     criterion = NumberOfGeneration(5)
 
-    while not criterion.should_terminate(number_of_generations, 0):
+    while not criterion.should_terminate(RunState(number_of_generations, 0)):
         number_of_generations += 1
     
     assert number_of_generations == 5
@@ -19,8 +37,95 @@ def test_threshold_difference():
     for fitness in fitness_values:
         number_of_generations += 1
         optimal_fitness = fitness
-        if criterion.should_terminate(number_of_generations, optimal_fitness):
+        if criterion.should_terminate(RunState(number_of_generations, optimal_fitness)):
             break
     
     # assert number_of_generations == 5
     assert optimal_fitness == 3.1
+
+
+def test_max_evaluations_and_runtime():
+    assert not MaxEvaluations(100).should_terminate(RunState(number_of_evaluations=99))
+    assert MaxEvaluations(100).should_terminate(RunState(number_of_evaluations=100))
+
+    assert not MaxRuntime(2).should_terminate(RunState(elapsed_seconds=1.5))
+    assert MaxRuntime(2).should_terminate(RunState(elapsed_seconds=2))
+    assert MaxRuntime(2).time_remaining(RunState(elapsed_seconds=1.5)) == 0.5
+
+
+@pytest.mark.parametrize("optimization, fitness_values, stops_at", [
+    (None, [1, 2, 2, 2.5, 2.5, 2.5], 6),
+    (Minimization(), [5, 4, 4.5, 3, 3.5, 3.2], 6),
+])
+def test_early_stopping(optimization, fitness_values, stops_at):
+    criterion = EarlyStopping(patience=2)
+    generations = [
+        generation for generation, fitness in enumerate(fitness_values, 1)
+        if criterion.should_terminate(RunState(generation, fitness, optimization=optimization or RunState().optimization))
+    ]
+    assert generations[0] == stops_at
+
+
+@pytest.mark.parametrize("optimization, reached, not_reached", [(None, 10, 9.5), (Minimization(), 0.5, 1.5)])
+def test_target_fitness_reached(optimization, reached, not_reached):
+    optimization = optimization or RunState().optimization
+    criterion = TargetFitnessReached(10 if reached == 10 else 1)
+
+    assert criterion.should_terminate(RunState(optimal_fitness=reached, optimization=optimization))
+    assert not criterion.should_terminate(RunState(optimal_fitness=not_reached, optimization=optimization))
+    assert not criterion.should_terminate(RunState(optimization=optimization))
+
+
+def test_and_termination_asks_every_criterion():
+    criterion = AndTermination(NumberOfGeneration(3), EarlyStopping(patience=1))
+
+    assert not criterion.should_terminate(RunState(1, 5.0))
+    assert not criterion.should_terminate(RunState(2, 5.0))
+    assert criterion.should_terminate(RunState(3, 5.0))
+    assert criterion.terminators[1].stagnant_generations == 2
+
+    assert AndTermination(MaxRuntime(1), MaxRuntime(3)).time_remaining(RunState()) == 3
+    assert AndTermination(MaxRuntime(1), NumberOfGeneration(3)).time_remaining(RunState()) is None
+    assert OrTermination(MaxRuntime(1), MaxRuntime(3), NumberOfGeneration(3)).time_remaining(RunState()) == 1
+
+
+def make_ga(objective, termination, **kwargs):
+    return GeneticAlgorithm(
+        population_size=20,
+        objective_function=objective,
+        chromosome_decoder=BinaryChromosomeDecoder(
+            number_of_bytes=6,
+            number_of_decision_variables=2,
+            lower_bounds=[2, -1],
+            upper_bounds=[6, 4]
+        ),
+        termination=termination,
+        seed=0,
+        **kwargs
+    )
+
+
+def test_max_evaluations_does_not_count_cache_hits():
+    ga = make_ga(lambda x: x[0] + x[1], OrTermination(MaxEvaluations(60), NumberOfGeneration(50)), fitness_cache=FitnessCache())
+    ga.run()
+
+    assert 60 <= ga.number_of_evaluations < 80
+    assert ga.number_of_generation < 50
+    assert ga.number_of_evaluations + ga.number_of_cache_hits == 20 * ga.number_of_generation
+
+
+@pytest.mark.parametrize("make_evaluator", [SerialEvaluator, lambda: ThreadPoolEvaluator(max_workers=2)])
+def test_max_runtime_cuts_a_slow_generation_short(make_evaluator):
+    def slow_objective(x):
+        time.sleep(0.05)
+        return x[0] + x[1]
+
+    ga = make_ga(slow_objective, OrTermination(NumberOfGeneration(100), MaxRuntime(0.2)), evaluator=make_evaluator())
+    started = time.monotonic()
+    ga.run()
+
+    # a full generation takes at least 0.5 seconds
+    assert time.monotonic() - started < 0.4
+    assert ga.number_of_generation == 0
+    assert 0 < ga.number_of_evaluations < 20
+    assert ga.result[0] is not None